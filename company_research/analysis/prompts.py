@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from company_research.models import CompanyIntelligence
+
 # ---------------------------------------------------------------------------
 # PROMPT 1: Structured Data Extraction
 # Reworked to prioritize investment strategies, criteria, AUM, founding year,
@@ -162,47 +164,23 @@ Extract all information now:"""
 # Much shorter — just asks for a 3-part factual summary.
 # ---------------------------------------------------------------------------
 
-def build_summary_prompt(
-    company_name: str,
-    intelligence: dict,
-) -> str:
-    """Build a focused company summary prompt from validated intelligence data."""
-    overview = intelligence.get("company_overview", {})
-    strategy = intelligence.get("investment_strategy", {})
-    criteria = intelligence.get("investment_criteria", {})
-    recent = intelligence.get("recent_activity", {})
-    portfolio = intelligence.get("portfolio_highlights", {})
-
-    def fmt_list(items: list | None) -> str:
-        if not items:
-            return "Not identified"
-        return ", ".join(items)
-
-    # Build recent activity block
-    all_news = []
-    for category in ["acquisitions", "partnerships", "fund_raisings", "major_announcements", "executive_changes"]:
-        items = recent.get(category, [])
-        if items:
-            all_news.extend(items)
-    news_block = "\n".join(f"  - {item}" for item in all_news) if all_news else "  No recent activity found"
-
-    return f"""Summarize {company_name} for a sales research brief. Use ONLY the validated data below — do not fabricate.
+SUMMARY_PROMPT = """Summarize {company_name} for a sales research brief. Use ONLY the validated data below — do not fabricate.
 
 **COMPANY DATA:**
-- Name: {overview.get("company_name") or company_name}
-- Type: {overview.get("company_type") or "Unknown"}
-- Business Model: {fmt_list(overview.get("business_model"))}
-- AUM: {overview.get("aum") or "Not found"}
-- Founded: {overview.get("founded") or "Not found"}
-- HQ: {overview.get("headquarters") or "Not found"}
-- Lending Types: {fmt_list(strategy.get("lending_types"))}
-- Structures: {fmt_list(strategy.get("facility_structures"))}
-- Deal Types: {fmt_list(strategy.get("deal_types"))}
-- Check Sizes: {fmt_list(criteria.get("check_sizes"))}
-- EBITDA Thresholds: {fmt_list(criteria.get("ebitda_thresholds"))}
-- Geography: {fmt_list(strategy.get("geographic_focus"))}
-- Industries: {fmt_list(strategy.get("industry_focus"))}
-- Recent Deals: {fmt_list((portfolio.get("recent_deals") or [])[:5])}
+- Name: {display_name}
+- Type: {company_type}
+- Business Model: {business_model}
+- AUM: {aum}
+- Founded: {founded}
+- HQ: {headquarters}
+- Lending Types: {lending_types}
+- Structures: {facility_structures}
+- Deal Types: {deal_types}
+- Check Sizes: {check_sizes}
+- EBITDA Thresholds: {ebitda_thresholds}
+- Geography: {geographic_focus}
+- Industries: {industry_focus}
+- Recent Deals: {recent_deals}
 - Recent News:
 {news_block}
 
@@ -216,6 +194,55 @@ def build_summary_prompt(
 
 Be factual and concise. If data is missing, say so briefly rather than guessing."""
 
+_NEWS_CATEGORIES = (
+    "acquisitions", "partnerships", "fund_raisings", "major_announcements", "executive_changes",
+)
+
+
+def _fmt_list(items: list[str]) -> str:
+    if not items:
+        return "Not identified"
+    return ", ".join(items)
+
+
+def build_summary_prompt(
+    company_name: str,
+    intelligence: CompanyIntelligence,
+) -> str:
+    """Build a focused company summary prompt from validated intelligence data.
+
+    Reads the model directly, so callers don't need to dump it to a dict first.
+    """
+    overview = intelligence.company_overview
+    strategy = intelligence.investment_strategy
+    criteria = intelligence.investment_criteria
+    recent = intelligence.recent_activity
+
+    # Build recent activity block
+    all_news = [
+        item for category in _NEWS_CATEGORIES for item in getattr(recent, category)
+    ]
+    news_block = "\n".join(f"  - {item}" for item in all_news) if all_news else "  No recent activity found"
+
+    return SUMMARY_PROMPT.format(
+        company_name=company_name,
+        display_name=overview.company_name or company_name,
+        company_type=overview.company_type or "Unknown",
+        business_model=_fmt_list(overview.business_model),
+        aum=overview.aum or "Not found",
+        founded=overview.founded or "Not found",
+        headquarters=overview.headquarters or "Not found",
+        lending_types=_fmt_list(strategy.lending_types),
+        facility_structures=_fmt_list(strategy.facility_structures),
+        deal_types=_fmt_list(strategy.deal_types),
+        check_sizes=_fmt_list(criteria.check_sizes),
+        ebitda_thresholds=_fmt_list(criteria.ebitda_thresholds),
+        geographic_focus=_fmt_list(strategy.geographic_focus),
+        industry_focus=_fmt_list(strategy.industry_focus),
+        recent_deals=_fmt_list(intelligence.portfolio_highlights.recent_deals[:5]),
+        news_block=news_block,
+    )
+
 
 # ---------------------------------------------------------------------------
 # PROMPT 3: Person Profile Extraction
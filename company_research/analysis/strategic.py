@@ -34,8 +34,7 @@ async def generate_company_summary(
     Receives ONLY validated structured data, never raw HTML.
     Returns a CompanySummary.
     """
-    intel_dict = json.loads(intelligence.model_dump_json(by_alias=False))
-    prompt = build_summary_prompt(company_name, intel_dict)
+    prompt = build_summary_prompt(company_name, intelligence)
 
     try:
         response_text = await llm_complete(
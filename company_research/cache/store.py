@@ -5,11 +5,68 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import zlib
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json below is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Compact encoder for cached payloads, reused instead of built per json.dumps()
+_COMPACT_ENC = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _dumps(data: object) -> str:
+    """Serialize a cache payload (orjson when installed, else compact stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return _COMPACT_ENC(data)
+
+
+def _loads(text: str | bytes) -> object:
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+# Bump when the cached CompanyResult / PersonProfile shape changes, so older
+# payloads read as cache misses instead of failing validation downstream.
+# Payloads written before versioning carry no marker and count as version 1.
+CACHE_SCHEMA_VERSION = 1
+_VERSION_KEY = "_schema_version"
+
+
+def _stamp(data: dict) -> dict:
+    return {**data, _VERSION_KEY: CACHE_SCHEMA_VERSION}
+
+
+def _current(data: dict) -> dict | None:
+    """Strip the version marker; None if the payload is from another schema."""
+    if data.pop(_VERSION_KEY, 1) != CACHE_SCHEMA_VERSION:
+        return None
+    return data
+
+
+# Company results are large and repetitive JSON — stored deflated as a BLOB.
+# Rows written before compression are plain TEXT and still load as-is.
+_COMPRESS_LEVEL = 6
+
+
+def _pack(data: object) -> bytes:
+    return zlib.compress(_dumps(data).encode("utf-8"), _COMPRESS_LEVEL)
+
+
+def _unpack(stored: str | bytes) -> object:
+    if isinstance(stored, bytes):
+        stored = zlib.decompress(stored)
+    return _loads(stored)
+
+
+# Keys per "IN (...)" query — well under SQLite's bound-parameter limit
+_IN_CHUNK = 500
+
 
 class ResearchCache:
     """Four-layer SQLite cache: search results, scraped pages, company results, person profiles."""
@@ -22,7 +79,9 @@ class ResearchCache:
     def _init_db(self) -> None:
         """Initialize database tables."""
         try:
-            self.conn = sqlite3.connect(self.db_path, timeout=10)
+            # Callers may hand calls to a worker thread (one at a time), so
+            # the connection is not pinned to the thread that opened it
+            self.conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
             self.conn.execute("PRAGMA journal_mode=WAL")
             self.conn.executescript("""
                 CREATE TABLE IF NOT EXISTS search_cache (
@@ -98,7 +157,7 @@ class ResearchCache:
                 return None
             if _is_expired(row[1], max_age_days):
                 return None
-            return json.loads(row[0])
+            return _loads(row[0])
         except Exception:
             return None
 
@@ -108,12 +167,53 @@ class ResearchCache:
         try:
             self.conn.execute(
                 "INSERT OR REPLACE INTO search_cache (query_hash, query, results, created_at) VALUES (?, ?, ?, ?)",
-                (_hash(query), query, json.dumps(results), datetime.now().isoformat()),
+                (_hash(query), query, _dumps(results), datetime.now().isoformat()),
             )
             self.conn.commit()
         except Exception as e:
             logger.debug("Cache write error (search): %s", e)
 
+    def get_searches(
+        self, queries: list[str], max_age_days: int = 3,
+    ) -> dict[str, list[dict] | None]:
+        """Batch form of get_search: one SELECT per chunk of queries.
+
+        Returns {query: results or None} for every requested query.
+        """
+        found: dict[str, list[dict] | None] = dict.fromkeys(queries)
+        if not found or not self._ensure_connection():
+            return found
+        by_hash = {_hash(q): q for q in found}
+        hashes = list(by_hash)
+        try:
+            for i in range(0, len(hashes), _IN_CHUNK):
+                chunk = hashes[i:i + _IN_CHUNK]
+                rows = self.conn.execute(
+                    "SELECT query_hash, results, created_at FROM search_cache "
+                    f"WHERE query_hash IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for query_hash, results, created_at in rows:
+                    if not _is_expired(created_at, max_age_days):
+                        found[by_hash[query_hash]] = _loads(results)
+        except Exception as e:
+            logger.debug("Cache read error (searches): %s", e)
+        return found
+
+    def set_searches(self, entries: dict[str, list[dict]]) -> None:
+        """Batch form of set_search: all rows written in one transaction."""
+        if not entries or not self._ensure_connection():
+            return
+        now = datetime.now().isoformat()
+        try:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO search_cache (query_hash, query, results, created_at) VALUES (?, ?, ?, ?)",
+                [(_hash(q), q, _dumps(r), now) for q, r in entries.items()],
+            )
+            self.conn.commit()
+        except Exception as e:
+            logger.debug("Cache write error (searches): %s", e)
+
     # --- Scrape cache ---
 
     def get_scrape(self, url: str, max_age_days: int = 7) -> tuple[str, float] | None:
@@ -160,7 +260,7 @@ class ResearchCache:
                 return None
             if _is_expired(row[1], max_age_days):
                 return None
-            return json.loads(row[0])
+            return _current(_unpack(row[0]))
         except Exception:
             return None
 
@@ -170,7 +270,20 @@ class ResearchCache:
         try:
             self.conn.execute(
                 "INSERT OR REPLACE INTO company_cache (company_name, result_json, created_at) VALUES (?, ?, ?)",
-                (company_name, json.dumps(result), datetime.now().isoformat()),
+                (company_name, _pack(_stamp(result)), datetime.now().isoformat()),
+            )
+            self.conn.commit()
+        except Exception as e:
+            logger.debug("Cache write error (company): %s", e)
+
+    def update_company(self, company_name: str, result: dict) -> None:
+        """Rewrite a cached company result without resetting its age."""
+        if not self._ensure_connection():
+            return
+        try:
+            self.conn.execute(
+                "UPDATE company_cache SET result_json = ? WHERE company_name = ?",
+                (_pack(_stamp(result)), company_name),
             )
             self.conn.commit()
         except Exception as e:
@@ -202,7 +315,7 @@ class ResearchCache:
                 return None
             if _is_expired(row[1], max_age_days):
                 return None
-            return json.loads(row[0])
+            return _current(_loads(row[0]))
         except Exception:
             return None
 
@@ -213,7 +326,7 @@ class ResearchCache:
         try:
             self.conn.execute(
                 "INSERT OR REPLACE INTO person_cache (person_key, profile_json, created_at) VALUES (?, ?, ?)",
-                (key, json.dumps(profile), datetime.now().isoformat()),
+                (key, _dumps(_stamp(profile)), datetime.now().isoformat()),
             )
             self.conn.commit()
         except Exception as e:
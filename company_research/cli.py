@@ -110,7 +110,8 @@ def main(
         config.company_concurrency = concurrency
     if cache_ttl is not None:
         config.cache_ttl_days = cache_ttl
-        config.repository_ttl_days = cache_ttl  # Override both when explicitly set
+        config.repository_ttl_days = cache_ttl  # Override all when explicitly set
+        config.summary_ttl_days = cache_ttl
 
     # Show repository stats
     from company_research.cache.store import ResearchCache
@@ -182,7 +183,9 @@ def main(
     # Generate dashboard
     console.print(f"\n{'=' * 70}")
     console.print("[bold green]Generating dashboard...[/bold green]")
-    output_path = generate_dashboard(valid_results, output)
+    output_path = generate_dashboard(
+        valid_results, output, fragment_cache_dir=config.dashboard_cache_dir
+    )
 
     # Summary
     high = sum(1 for r in valid_results if r.fit_score.rating == "High")
@@ -50,7 +50,9 @@ class Config(BaseModel):
     # Cache
     cache_ttl_days: int = 7            # Search/scrape cache (web content changes)
     repository_ttl_days: int = 90      # Company/person repository (LLM-extracted intel)
+    summary_ttl_days: int = 30         # Cached summaries regenerate sooner than intel
     cache_db_path: str = ".research_cache.db"
+    dashboard_cache_dir: str | None = None  # Rendered panel fragments (opt-in)
 
     # Batch API
     batch_poll_interval: int = 30    # seconds between status checks
@@ -106,7 +108,9 @@ def load_config() -> Config:
         claude_concurrency=int(os.getenv("CLAUDE_CONCURRENCY", "5")),
         cache_ttl_days=int(os.getenv("CACHE_TTL_DAYS", "7")),
         repository_ttl_days=int(os.getenv("REPOSITORY_TTL_DAYS", "90")),
+        summary_ttl_days=int(os.getenv("SUMMARY_TTL_DAYS", "30")),
         apollo_api_key=os.getenv("APOLLO_API_KEY", ""),
         web_host=os.getenv("WEB_HOST", "0.0.0.0"),
         web_port=int(os.getenv("WEB_PORT", "8000")),
+        dashboard_cache_dir=os.getenv("DASHBOARD_CACHE_DIR") or None,
     )
@@ -126,6 +126,21 @@ class CompanyIntelligence(BaseModel):
     investment_criteria: InvestmentCriteria = Field(default_factory=InvestmentCriteria)
     portfolio_highlights: PortfolioHighlights = Field(default_factory=PortfolioHighlights)
 
+    def has_content(self) -> bool:
+        """True when extraction produced anything usable (cache-hit check)."""
+        overview = self.company_overview
+        strategy = self.investment_strategy
+        recent = self.recent_activity
+        return bool(
+            overview.company_type
+            or overview.aum
+            or strategy.lending_types
+            or strategy.deal_types
+            or recent.fund_raisings
+            or recent.major_announcements
+            or self.portfolio_highlights.recent_deals
+        )
+
 
 # ---------------------------------------------------------------------------
 # Person intelligence models
@@ -244,6 +259,18 @@ class CompanyResult(BaseModel):
     from_cache: bool = False
     error: str | None = None
 
+    @property
+    def has_core_intel(self) -> bool:
+        """True when extraction found the basics (type/AUM/lending/deal types)."""
+        overview = self.intelligence.company_overview
+        strategy = self.intelligence.investment_strategy
+        return bool(
+            overview.company_type
+            or overview.aum
+            or strategy.lending_types
+            or strategy.deal_types
+        )
+
     @classmethod
     def error_result(cls, company: CompanyInput, error_msg: str) -> CompanyResult:
         return cls(company=company, error=error_msg)
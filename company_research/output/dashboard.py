@@ -3,13 +3,47 @@ CRM Account/Opportunities/Notes, person accordions with timeline."""
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import html
 import json
+import os
 import re
+import string
+import sys
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from pathlib import Path
 
-from company_research.models import CompanyResult, PersonProfile
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib encoder below is the fallback
+    orjson = None
+
+from company_research import models
+from company_research.models import (
+    CompanyResult,
+    InteractionRecord,
+    PersonProfile,
+    SFOpportunity,
+)
+
+# Escape fast path — most extracted text has nothing to escape, so skip
+# html.escape's replace passes when no special character is present.
+_HTML_UNSAFE = re.compile(r'[&<>"\']').search
+_escape = html.escape
+
+# Compact encoder for the embedded companiesData blob — no whitespace after
+# separators, and reused across calls instead of built per json.dumps().
+_COMPACT_ENC = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _encode_script_json(data: object) -> str:
+    """Compact JSON safe to embed in an inline <script> block."""
+    encoded = orjson.dumps(data).decode("utf-8") if orjson is not None else _COMPACT_ENC(data)
+    # A literal "</script>" inside a company name would end the block early,
+    # and "<!--" would switch the HTML parser into its script-escape state
+    return encoded.replace("</", "<\\/").replace("<!--", "\\u003c!--")
 
 
 def _domain_from_url(url: str) -> str:
@@ -22,65 +56,120 @@ def _domain_from_url(url: str) -> str:
         return url[:40]
 
 
+_SOURCE_LINK_RE = re.compile(r'\[Source (\d+)\]')
+_SOURCE_STRIP_RE = re.compile(r'\s*\[Source \d+\]')
+
+
 def _linkify_sources(text: str, source_urls: list[str]) -> str:
     """Replace [Source N] with clickable links, or strip them if no sources."""
     escaped = html.escape(text)
+    if "[Source" not in escaped:
+        # Most snippets carry no markers — skip the regex engine entirely
+        return escaped
     if not source_urls:
         # Strip [Source N] markers cleanly when sources aren't available
-        return re.sub(r'\s*\[Source \d+\]', '', escaped)
+        return _SOURCE_STRIP_RE.sub('', escaped)
     def replacer(m):
         n = int(m.group(1))
         if 1 <= n <= len(source_urls):
             url = html.escape(source_urls[n - 1])
             return f'<a href="{url}" class="source-link" target="_blank" title="{url}">[{n}]</a>'
         return m.group(0)
-    return re.sub(r'\[Source (\d+)\]', replacer, escaped)
+    return _SOURCE_LINK_RE.sub(replacer, escaped)
+
+
+_MONTHS = {
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "may": 5, "june": 6, "july": 7, "august": 8,
+    "september": 9, "october": 10, "november": 11, "december": 12,
+}
+_QUARTERS = {"q1": 2, "q2": 5, "q3": 8, "q4": 11}
+
+_QUARTER_RE = re.compile(r"(q[1-4])\s+(\d{4})")
+_MONTH_YEAR_RE = re.compile(r"(\w+)\s+(\d{4})")
+_YEAR_RANGE_RE = re.compile(r"(\d{4})\s*-\s*(\d{4})")
+_LEADING_YEAR_RE = re.compile(r"(?:approximately\s+)?(\d{4})\s")
+
+
+@functools.lru_cache(maxsize=512)
+def _news_sort_key(item: str) -> tuple[int, int]:
+    """(year, month) extracted from a news item; (0, 0) when undated."""
+    text = item.lower().strip()
+    qm = _QUARTER_RE.match(text)
+    if qm:
+        return (int(qm.group(2)), _QUARTERS.get(qm.group(1), 6))
+    mm = _MONTH_YEAR_RE.match(text)
+    if mm and mm.group(1) in _MONTHS:
+        return (int(mm.group(2)), _MONTHS[mm.group(1)])
+    ym = _YEAR_RANGE_RE.search(text)
+    if ym:
+        return (int(ym.group(2)), 6)
+    ym2 = _LEADING_YEAR_RE.match(text)
+    if ym2:
+        return (int(ym2.group(1)), 6)
+    return (0, 0)
 
 
 def _sort_news_reverse_chrono(items: list[str]) -> list[str]:
     """Sort news items by date descending, extracting dates from item text."""
-    MONTHS = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12,
-    }
-    QUARTERS = {"q1": 2, "q2": 5, "q3": 8, "q4": 11}
-
-    def _extract_sort_key(item: str) -> tuple[int, int]:
-        text = item.lower().strip()
-        qm = re.match(r"(q[1-4])\s+(\d{4})", text)
-        if qm:
-            return (int(qm.group(2)), QUARTERS.get(qm.group(1), 6))
-        mm = re.match(r"(\w+)\s+(\d{4})", text)
-        if mm and mm.group(1) in MONTHS:
-            return (int(mm.group(2)), MONTHS[mm.group(1)])
-        ym = re.search(r"(\d{4})\s*-\s*(\d{4})", text)
-        if ym:
-            return (int(ym.group(2)), 6)
-        ym2 = re.match(r"(?:approximately\s+)?(\d{4})\s", text)
-        if ym2:
-            return (int(ym2.group(1)), 6)
-        return (0, 0)
-
-    return sorted(items, key=_extract_sort_key, reverse=True)
+    return sorted(items, key=_news_sort_key, reverse=True)
+
+
+# Everything up to the first ". " (or end of text) — stops scanning there
+# instead of splitting the whole field. Decimals like "$1.5B" stay intact.
+_FIRST_SENT_RE = re.compile(r".*?(?=\. |\Z)", re.DOTALL)
+
+
+def _first_sentence(text: str) -> str:
+    """First sentence of a summary field, terminated with a period."""
+    return _FIRST_SENT_RE.match(text).group(0) + "."
 
 
 def generate_dashboard(
     companies: list[CompanyResult],
     output_path: str,
+    fragment_cache_dir: str | None = None,
 ) -> str:
-    """Generate the interactive HTML dashboard and write to disk."""
+    """Generate the interactive HTML dashboard and write to disk.
+
+    With ``fragment_cache_dir`` set, rendered detail panels are kept on disk
+    keyed by content hash, so unchanged companies are not re-rendered on the
+    next run.
+
+    The page is streamed to a temp file beside ``output_path`` and renamed
+    over it only once complete, so a render error never clobbers the
+    previous dashboard.
+    """
+    path = Path(output_path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            write_dashboard(companies, f.write, fragment_cache_dir)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return output_path
+
+
+def write_dashboard(
+    companies: list[CompanyResult],
+    write: Callable[[bytes], object],
+    fragment_cache_dir: str | None = None,
+) -> None:
+    """Stream the dashboard as UTF-8 bytes to ``write``, fragment by fragment.
+
+    Panels go straight to the sink as they are rendered, so the full page is
+    never held in memory as one string. Static template pieces are
+    pre-encoded, so only the dynamic fragments pay for encoding.
+    """
     metadata = _build_metadata(companies)
-    sidebar_items = "\n".join(
-        _render_sidebar_item(company, idx) for idx, company in enumerate(companies)
-    )
-    detail_panels = "\n".join(
-        _render_detail_panel(company, idx) for idx, company in enumerate(companies)
-    )
     summary_stats = _render_summary_stats(metadata)
+    # Shared data guard — computed once per company, used by both renderers
+    core_intel = [c.has_core_intel for c in companies]
 
-    # Serialize company data for JS sorting/filtering
-    companies_json = json.dumps([
+    # Serialize company data for JS sorting/filtering and sidebar row hydration
+    companies_json = _encode_script_json([
         {
             "idx": idx,
             "name": c.company.company_name,
@@ -89,20 +178,123 @@ def generate_dashboard(
             "peopleCount": len(c.company.people),
             "industries": ",".join(c.intelligence.investment_strategy.industry_focus),
             "hasOpps": bool(c.sf_account and c.sf_account.opportunities),
+            "oppCount": len(c.sf_account.opportunities) if c.sf_account else 0,
+            "hasCrm": any(p.interactions for p in c.person_profiles),
+            "hasCoreIntel": core_intel[idx],
         }
         for idx, c in enumerate(companies)
     ])
 
-    dashboard_html = _TEMPLATE.format(
-        generated_at=datetime.now().strftime("%A, %B %d, %Y at %I:%M %p"),
-        summary_stats=summary_stats,
-        sidebar_items=sidebar_items,
-        detail_panels=detail_panels,
-        companies_json=companies_json,
-    )
+    _write_page({
+        "generated_at": datetime.now().strftime("%A, %B %d, %Y at %I:%M %p").encode("utf-8"),
+        "summary_stats": summary_stats.encode("utf-8"),
+        "sidebar_items": functools.partial(_write_sidebar_items, companies),
+        "detail_panels": functools.partial(
+            _write_detail_panels, companies, core_intel, fragment_cache_dir
+        ),
+        "companies_json": companies_json.encode("utf-8"),
+        "stylesheet": _STYLESHEET_BYTES,
+    }, write)
+
+
+def _write_sidebar_items(
+    companies: list[CompanyResult],
+    write: Callable[[bytes], object],
+) -> None:
+    for idx, company in enumerate(companies):
+        if idx:
+            write(b"\n")
+        write(_render_sidebar_item(company, idx).encode("utf-8"))
+
+
+def _write_detail_panels(
+    companies: list[CompanyResult],
+    core_intel: list[bool],
+    fragment_cache_dir: str | None,
+    write: Callable[[bytes], object],
+) -> None:
+    items = list(zip(range(len(companies)), companies, core_intel))
+    if fragment_cache_dir is None:
+        panels = _iter_detail_panels(items)
+    else:
+        panels = _iter_cached_detail_panels(items, Path(fragment_cache_dir))
+    # Panels are JS string literals, written as the elements of detailHtml
+    for idx, panel in enumerate(panels):
+        if idx:
+            write(b",\n")
+        write(panel)
+
+
+def _render_detail(item: tuple[int, CompanyResult, bool]) -> bytes:
+    """Detail panel for one company as an encoded JS string literal.
+
+    The page parses panels into the DOM only when their company is first
+    selected.
+    """
+    idx, company, has_core_intel = item
+    panel = _render_detail_panel(company, idx, has_core_intel)
+    return _encode_script_json(panel).encode("utf-8")
+
+
+def _iter_detail_panels(items: list[tuple[int, CompanyResult, bool]]) -> Iterator[bytes]:
+    """Yield detail panels in order."""
+    for item in items:
+        yield _render_detail(item)
+
+
+# Folded into every fragment key, so editing the renderer or the models it
+# reads invalidates panels rendered by an older version of them.
+_RENDERER_DIGEST = hashlib.blake2b(
+    Path(__file__).read_bytes() + Path(models.__file__).read_bytes(), digest_size=16,
+).digest()
+
+
+def _fragment_key(company: CompanyResult, has_core_intel: bool) -> str:
+    h = hashlib.blake2b(_RENDERER_DIGEST, digest_size=16)
+    h.update(f"{int(has_core_intel)}:".encode("utf-8"))
+    h.update(company.model_dump_json().encode("utf-8"))
+    return h.hexdigest()
 
-    Path(output_path).write_text(dashboard_html, encoding="utf-8")
-    return output_path
+
+def _panel_id(idx: int) -> bytes:
+    """Opening tag of panel idx as it appears in the encoded JS string."""
+    return f'<div id=\\"detail-{idx}\\"'.encode("utf-8")
+
+
+def _iter_cached_detail_panels(
+    items: list[tuple[int, CompanyResult, bool]],
+    cache_dir: Path,
+) -> Iterator[bytes]:
+    """Yield detail panels, reusing on-disk fragments from earlier runs.
+
+    Fragments are stored as panel 0 and re-numbered on the way out, so a
+    company's panel survives reordering. Only misses are rendered and then
+    persisted; once every panel has been yielded, fragments this run did
+    not use are deleted.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    paths = [cache_dir / f"{_fragment_key(company, core)}.json" for _, company, core in items]
+    hits = [path.exists() for path in paths]
+    fresh = _iter_detail_panels([item for item, hit in zip(items, hits) if not hit])
+    slot = _panel_id(0)
+    try:
+        for (idx, _, _), path, hit in zip(items, paths, hits):
+            if hit:
+                yield path.read_bytes().replace(slot, _panel_id(idx), 1)
+            else:
+                panel = next(fresh)
+                # Write-then-rename so a crashed run never leaves a partial fragment
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                tmp.write_bytes(panel.replace(_panel_id(idx), slot, 1))
+                os.replace(tmp, path)
+                yield panel
+    finally:
+        fresh.close()
+
+    used = set(paths)
+    for stale in cache_dir.glob("*.json"):
+        if stale not in used:
+            stale.unlink(missing_ok=True)
 
 
 def _build_metadata(companies: list[CompanyResult]) -> dict:
@@ -161,53 +353,39 @@ def _render_summary_stats(meta: dict) -> str:
     </div>"""
 
 
-def _render_sidebar_item(company: CompanyResult, idx: int) -> str:
-    name = html.escape(company.company.company_name)
-    score = company.fit_score.total
-    rating = company.fit_score.rating.lower()
-    people_count = len(company.company.people)
-
-    # Check if intelligence is empty
-    intel = company.intelligence
-    has_data = (
-        intel.company_overview.company_type
-        or intel.company_overview.aum
-        or intel.investment_strategy.lending_types
-        or intel.investment_strategy.deal_types
-    )
+# Class-string lookup tables (interned so every panel shares one object)
+_FIT_CLASS = {
+    rating: sys.intern(f"fit-{rating.lower()}") for rating in ("High", "Medium", "Low")
+}
+# Keyed by CompanyResult.from_cache; the badge date label follows
+_FRESHNESS_BADGE_OPEN = {
+    True: sys.intern('<span class="freshness-badge cached" title="Loaded from cache">Cached '),
+    False: sys.intern('<span class="freshness-badge fresh" title="Freshly researched">Researched '),
+}
 
-    # CRM indicator dot
-    crm_dot = ""
-    if any(p.interactions for p in company.person_profiles):
-        crm_dot = '<span class="sidebar-crm-dot" title="Has CRM history"></span>'
 
-    # Opportunity dollar indicator
-    opp_indicator = ""
-    if company.sf_account and company.sf_account.opportunities:
-        opp_count = len(company.sf_account.opportunities)
-        opp_indicator = f'<span class="sidebar-opp" title="{opp_count} opportunities">$</span>'
-
-    # No-data warning
-    warn_indicator = ""
-    if not has_data:
-        warn_indicator = '<span class="sidebar-warn" title="Insufficient data — re-run with --force-refresh">!</span>'
+def _render_sidebar_item(company: CompanyResult, idx: int) -> str:
+    """Sidebar row shell: score and name only.
 
+    The bottom line (contact count and CRM / opportunity / no-data badges)
+    is filled in by the page from companiesData once the row nears the
+    viewport.
+    """
+    name = html.escape(company.company.company_name)
+    score = company.fit_score.total
+    fit_class = _FIT_CLASS[company.fit_score.rating]
     return (
-        f'<div id="sidebar-{idx}" class="sidebar-item" data-idx="{idx}" '
-        f'onclick="selectCompany({idx})">'
+        f'<div id="sidebar-{idx}" class="sidebar-item" data-idx="{idx}">'
         f'<div class="sidebar-item-top">'
-        f'<span class="sidebar-score fit-{rating}">{score}</span>'
+        f'<span class="sidebar-score {fit_class}">{score}</span>'
         f'<span class="sidebar-name">{name}</span>'
         f'</div>'
-        f'<div class="sidebar-item-bottom">'
-        f'<span class="sidebar-people">{people_count} contact{"s" if people_count != 1 else ""}</span>'
-        f'{crm_dot}{opp_indicator}{warn_indicator}'
-        f'</div>'
+        f'<div class="sidebar-item-bottom"></div>'
         f'</div>'
     )
 
 
-def _render_detail_panel(company: CompanyResult, idx: int) -> str:
+def _render_detail_panel(company: CompanyResult, idx: int, has_core_intel: bool) -> str:
     c = company
     intel = c.intelligence
     overview = intel.company_overview
@@ -224,11 +402,7 @@ def _render_detail_panel(company: CompanyResult, idx: int) -> str:
     freshness_badge = ""
     try:
         ts = datetime.fromisoformat(c.processed_at)
-        age_label = ts.strftime("%b %d, %Y")
-        if c.from_cache:
-            freshness_badge = f'<span class="freshness-badge cached" title="Loaded from cache">Cached {age_label}</span>'
-        else:
-            freshness_badge = f'<span class="freshness-badge fresh" title="Freshly researched">Researched {age_label}</span>'
+        freshness_badge = f'{_FRESHNESS_BADGE_OPEN[c.from_cache]}{ts.strftime("%b %d, %Y")}</span>'
     except Exception:
         pass
 
@@ -247,7 +421,7 @@ def _render_detail_panel(company: CompanyResult, idx: int) -> str:
         meta_items.append(f'<div class="hero-stat"><span class="hero-stat-val">{html.escape(overview.employees)}</span><span class="hero-stat-lbl">Employees</span></div>')
     meta_html = "\n".join(meta_items)
 
-    fit_class = f"fit-{fit.rating.lower()}"
+    fit_class = _FIT_CLASS[fit.rating]
 
     # --- CRM ACCOUNT BAR ---
     account_bar_html = ""
@@ -270,10 +444,7 @@ def _render_detail_panel(company: CompanyResult, idx: int) -> str:
     # --- INSUFFICIENT DATA WARNING ---
     data_warning_html = ""
     has_intelligence = (
-        overview.company_type
-        or overview.aum
-        or strategy.lending_types
-        or strategy.deal_types
+        has_core_intel
         or recent.fund_raisings
         or recent.major_announcements
         or portfolio.recent_deals
@@ -292,15 +463,9 @@ def _render_detail_panel(company: CompanyResult, idx: int) -> str:
     # --- TALKING POINTS ---
     talking_points_html = ""
     tp_parts = []
-    if summary.overview:
-        first_sent = summary.overview.split(". ")[0] + "."
-        tp_parts.append(html.escape(first_sent))
-    if summary.credit_focus:
-        first_sent = summary.credit_focus.split(". ")[0] + "."
-        tp_parts.append(html.escape(first_sent))
-    if summary.notable_details:
-        first_sent = summary.notable_details.split(". ")[0] + "."
-        tp_parts.append(html.escape(first_sent))
+    for field in (summary.overview, summary.credit_focus, summary.notable_details):
+        if field:
+            tp_parts.append(html.escape(_first_sentence(field)))
     if tp_parts:
         tp_items = "".join(f'<li>{p}</li>' for p in tp_parts)
         talking_points_html = f'<div class="talking-points"><div class="tp-header">Talking Points</div><ul>{tp_items}</ul></div>'
@@ -308,39 +473,13 @@ def _render_detail_panel(company: CompanyResult, idx: int) -> str:
     # --- OPPORTUNITIES TABLE ---
     opps_html = ""
     if sf and sf.opportunities:
-        rows = ""
-        for opp in sf.opportunities:
-            # Type badge
-            type_badge = ""
-            if opp.opp_type:
-                type_badge = f' <span class="opp-type-badge">{html.escape(opp.opp_type)}</span>'
-            rows += (
-                f'<tr>'
-                f'<td>{html.escape(opp.name)}{type_badge}</td>'
-                f'<td><span class="opp-stage">{html.escape(opp.stage)}</span></td>'
-                f'<td class="opp-amount">{html.escape(opp.amount)}</td>'
-                f'<td>{html.escape(opp.close_date)}</td>'
-                f'<td>{html.escape(opp.owner)}</td>'
-                f'</tr>'
-            )
-            # Details sub-row: next_step, roadblocks, description, opp notes
-            detail_parts = []
-            if opp.next_step:
-                detail_parts.append(f'<div class="opp-detail"><strong>Next Step:</strong> {html.escape(opp.next_step)}</div>')
-            if opp.roadblocks:
-                detail_parts.append(f'<div class="opp-detail opp-roadblock"><strong>Roadblocks:</strong> {html.escape(opp.roadblocks)}</div>')
-            if opp.description:
-                detail_parts.append(f'<div class="opp-detail">{html.escape(opp.description)}</div>')
-            if opp.opp_notes:
-                for note in opp.opp_notes:
-                    detail_parts.append(f'<div class="opp-detail opp-note-item">{html.escape(note)}</div>')
-            if detail_parts:
-                details_content = "".join(detail_parts)
-                rows += (
-                    f'<tr class="opp-notes-row">'
-                    f'<td colspan="5"><div class="opp-notes-text">{details_content}</div></td>'
-                    f'</tr>'
-                )
+        # Owner/stage/type repeat heavily across opps — escape each distinct value once
+        esc_owner = {k: html.escape(k) for k in {o.owner for o in sf.opportunities}}
+        esc_stage = {k: html.escape(k) for k in {o.stage for o in sf.opportunities}}
+        esc_type = {k: html.escape(k) for k in {o.opp_type for o in sf.opportunities}}
+        rows = "".join(
+            _render_opp_rows(opp, esc_owner, esc_stage, esc_type) for opp in sf.opportunities
+        )
         opps_html = (
             f'<div class="section-card">'
             f'<h3>Opportunities</h3>'
@@ -378,7 +517,7 @@ def _render_detail_panel(company: CompanyResult, idx: int) -> str:
             )
             extra = len(all_news) - visible_limit
             toggle_btn = (
-                f'<button class="news-toggle-btn" onclick="toggleNewsExpand(this)">'
+                f'<button class="news-toggle-btn" data-action="toggleNewsExpand">'
                 f'Show {extra} more</button>'
             )
         news_html = (
@@ -442,7 +581,7 @@ def _render_detail_panel(company: CompanyResult, idx: int) -> str:
             f'<div class="people-section">'
             f'<div class="people-header">'
             f'<h3>People Intelligence</h3>'
-            f'<button class="expand-all-btn" onclick="toggleAllAccordions(this)">Expand All</button>'
+            f'<button class="expand-all-btn" data-action="toggleAllAccordions">Expand All</button>'
             f'</div>{cards}</div>'
         )
 
@@ -474,9 +613,9 @@ def _render_detail_panel(company: CompanyResult, idx: int) -> str:
                 note_parts.append(
                     f'<div class="note-item note-expandable">'
                     f'<div class="note-preview">{preview} '
-                    f'<button class="note-toggle" onclick="toggleNoteExpand(this)">Show full note</button></div>'
-                    f'<div class="note-full" style="display:none">{escaped} '
-                    f'<button class="note-toggle" onclick="toggleNoteExpand(this)">Show less</button></div>'
+                    f'<button class="note-toggle" data-action="toggleNoteExpand">Show full note</button></div>'
+                    f'<div class="note-full">{escaped} '
+                    f'<button class="note-toggle" data-action="toggleNoteExpand">Show less</button></div>'
                     f'</div>'
                 )
             else:
@@ -546,13 +685,13 @@ def _render_person_accordion(person: PersonProfile, expanded: bool = False) -> s
     email_link = ""
     if person.email:
         esc_email = html.escape(person.email)
-        email_link = f'<a href="mailto:{esc_email}" class="person-email" onclick="event.stopPropagation()" title="{esc_email}">{esc_email}</a>'
+        email_link = f'<a href="mailto:{esc_email}" class="person-email" title="{esc_email}">{esc_email}</a>'
 
     # LinkedIn button
     linkedin_btn = ""
     if person.linkedin_url:
         url = html.escape(person.linkedin_url)
-        linkedin_btn = f'<a href="{url}" class="person-linkedin-btn" target="_blank" onclick="event.stopPropagation()">LinkedIn</a>'
+        linkedin_btn = f'<a href="{url}" class="person-linkedin-btn" target="_blank">LinkedIn</a>'
 
     # CRM status badge
     crm_badge = ""
@@ -593,56 +732,19 @@ def _render_person_accordion(person: PersonProfile, expanded: bool = False) -> s
 
     # Education
     if person.education:
-        edu_items = ""
+        edu_parts = []
         for edu in person.education:
             degree = html.escape(edu.degree) if edu.degree else ""
             school = html.escape(edu.school)
             year = ""
             if edu.graduation_year:
                 year = f'<span class="edu-year">{html.escape(edu.graduation_year)}</span>'
-            edu_items += f'<div class="edu-item">{degree}{", " if degree else ""}{school} {year}</div>'
-        body_parts.append(f'<div class="person-edu"><div class="section-label">Education</div>{edu_items}</div>')
+            edu_parts.append(f'<div class="edu-item">{degree}{", " if degree else ""}{school} {year}</div>')
+        body_parts.append(f'<div class="person-edu"><div class="section-label">Education</div>{"".join(edu_parts)}</div>')
 
     # CRM History
     if person.interactions:
-        crm_items = ""
-        for interaction in person.interactions[:10]:
-            type_class = {
-                "Call": "crm-call",
-                "Email": "crm-email",
-                "Meeting": "crm-meeting",
-            }.get(interaction.activity_type, "crm-task")
-            date_str = html.escape(interaction.date) if interaction.date else ""
-            subject = html.escape(interaction.subject) if interaction.subject else ""
-            notes_raw = interaction.notes or ""
-            owner = html.escape(interaction.owner) if interaction.owner else ""
-
-            crm_items += f'<div class="crm-item {type_class}">'
-            crm_items += f'<div class="crm-header">'
-            crm_items += f'<span class="crm-type">{html.escape(interaction.activity_type)}</span>'
-            if date_str:
-                crm_items += f'<span class="crm-date">{date_str}</span>'
-            if owner:
-                crm_items += f'<span class="crm-owner">{owner}</span>'
-            crm_items += f'</div>'
-            if subject:
-                crm_items += f'<div class="crm-subject">{subject}</div>'
-            if notes_raw:
-                notes_escaped = html.escape(notes_raw)
-                if len(notes_raw) < 150:
-                    crm_items += f'<div class="crm-notes">{notes_escaped}</div>'
-                else:
-                    preview = html.escape(notes_raw[:120].rsplit(" ", 1)[0]) + "..."
-                    crm_items += (
-                        f'<div class="crm-notes-wrap">'
-                        f'<div class="crm-notes-preview">{preview} '
-                        f'<button class="crm-expand-btn" onclick="event.stopPropagation();toggleNotes(this)">Show more</button></div>'
-                        f'<div class="crm-notes-full" style="display:none">{notes_escaped} '
-                        f'<button class="crm-expand-btn" onclick="event.stopPropagation();toggleNotes(this)">Show less</button></div>'
-                        f'</div>'
-                    )
-            crm_items += '</div>'
-
+        crm_items = "".join(_render_crm_item(i) for i in person.interactions[:10])
         body_parts.append(f'<div class="person-crm"><div class="section-label">CRM History</div>{crm_items}</div>')
 
     # Person sources
@@ -657,7 +759,7 @@ def _render_person_accordion(person: PersonProfile, expanded: bool = False) -> s
 
     return f"""
     <div class="accordion {open_class}">
-      <div class="accordion-header" onclick="togglePerson(this)">
+      <div class="accordion-header" data-action="togglePerson">
         <div class="accordion-left">
           <div class="avatar">{initials}</div>
           <div class="accordion-info">
@@ -679,921 +781,225 @@ def _render_person_accordion(person: PersonProfile, expanded: bool = False) -> s
     </div>"""
 
 
-def _render_experience_timeline(person: PersonProfile) -> str:
-    """Render work experience as a vertical timeline."""
-    # Build timeline items: current role first, then prior
-    items = []
-
-    if person.current_title and person.current_company:
-        duration = ""
-        if person.tenure_current:
-            duration = f' <span class="timeline-duration">({html.escape(person.tenure_current)})</span>'
-        items.append({
-            "title": html.escape(person.current_title),
-            "firm": html.escape(person.current_company),
-            "duration_raw": person.tenure_current or "",
-            "duration_html": duration,
-            "highlights": [],
-            "is_current": True,
-        })
-
-    for exp in person.prior_experience:
-        duration = ""
-        if exp.duration:
-            duration = f' <span class="timeline-duration">({html.escape(exp.duration)})</span>'
-        items.append({
-            "title": html.escape(exp.title) if exp.title else "Role",
-            "firm": html.escape(exp.firm),
-            "duration_raw": exp.duration or "",
-            "duration_html": duration,
-            "highlights": [html.escape(h) for h in exp.highlights],
-            "is_current": False,
-        })
-
-    if not items:
-        return ""
-
-    timeline_items = ""
-    for item in items:
-        dot_class = "dot-current" if item["is_current"] else "dot-prior"
-        highlights = ""
-        if item["highlights"]:
-            hl = "".join(f'<div class="timeline-highlight">{h}</div>' for h in item["highlights"])
-            highlights = f'<div class="timeline-highlights">{hl}</div>'
-
-        timeline_items += (
-            f'<div class="timeline-item">'
-            f'<div class="timeline-dot {dot_class}"></div>'
-            f'<div class="timeline-content">'
-            f'<div class="timeline-role">{item["title"]}</div>'
-            f'<div class="timeline-firm">{item["firm"]}{item["duration_html"]}</div>'
-            f'{highlights}'
-            f'</div></div>'
-        )
-
-    return f'<div class="person-timeline"><div class="section-label">Experience</div><div class="timeline">{timeline_items}</div></div>'
+def _render_opp_rows(
+    opp: SFOpportunity,
+    esc_owner: dict[str, str],
+    esc_stage: dict[str, str],
+    esc_type: dict[str, str],
+) -> str:
+    """Render one opportunity row plus its optional details sub-row."""
+    esc = html.escape
+    type_badge = f' <span class="opp-type-badge">{esc_type[opp.opp_type]}</span>' if opp.opp_type else ""
+    row = (
+        f'<tr>'
+        f'<td>{esc(opp.name)}{type_badge}</td>'
+        f'<td><span class="opp-stage">{esc_stage[opp.stage]}</span></td>'
+        f'<td class="opp-amount">{esc(opp.amount)}</td>'
+        f'<td>{esc(opp.close_date)}</td>'
+        f'<td>{esc_owner[opp.owner]}</td>'
+        f'</tr>'
+    )
 
+    # Details sub-row: next_step, roadblocks, description, opp notes
+    detail_parts = []
+    if opp.next_step:
+        detail_parts.append(f'<div class="opp-detail"><strong>Next Step:</strong> {esc(opp.next_step)}</div>')
+    if opp.roadblocks:
+        detail_parts.append(f'<div class="opp-detail opp-roadblock"><strong>Roadblocks:</strong> {esc(opp.roadblocks)}</div>')
+    if opp.description:
+        detail_parts.append(f'<div class="opp-detail">{esc(opp.description)}</div>')
+    for note in opp.opp_notes:
+        detail_parts.append(f'<div class="opp-detail opp-note-item">{esc(note)}</div>')
+    if not detail_parts:
+        return row
+    return (
+        f'{row}<tr class="opp-notes-row">'
+        f'<td colspan="5"><div class="opp-notes-text">{"".join(detail_parts)}</div></td>'
+        f'</tr>'
+    )
 
-def _render_tags(items: list[str], css_class: str = "tag") -> str:
-    if not items:
-        return ""
-    return '<div class="tag-list">' + "".join(
-        f'<span class="{css_class}">{html.escape(item)}</span>' for item in items
-    ) + '</div>'
 
+_CRM_TYPE_CLASS: dict[str, str] = {
+    "Call": "crm-call",
+    "Email": "crm-email",
+    "Meeting": "crm-meeting",
+}
 
-# ---------------------------------------------------------------------------
-# HTML Template
-# ---------------------------------------------------------------------------
 
-_TEMPLATE = """<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Street Diligence Intelligence Dashboard</title>
-  <style>
-    :root {{
-      /* SD Brand — green */
-      --sd-primary: #28a745;
-      --sd-dark: #218838;
-      --sd-darker: #1e7e34;
-      --sd-bg: #e7f5ec;
-      --sd-border: #c3e6cb;
-      --sd-light: #d4edda;
-
-      /* Fit colors (semantic — unchanged) */
-      --fit-high: #22c55e;
-      --fit-medium: #eab308;
-      --fit-low: #ef4444;
-
-      /* CRM activity colors (semantic — unchanged) */
-      --crm-call: #22c55e;
-      --crm-email: #3b82f6;
-      --crm-meeting: #8b5cf6;
-      --crm-task: #f97316;
-
-      /* Neutrals */
-      --bg: #f8fafc;
-      --card: #ffffff;
-      --text: #1e293b;
-      --text-secondary: #64748b;
-      --border: #e2e8f0;
-      --border-light: #f1f5f9;
-
-      /* Layout */
-      --sidebar-w: 280px;
-      --header-h: 60px;
-    }}
-
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    body {{
-      font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-      background: var(--bg);
-      color: var(--text);
-      line-height: 1.6;
-      height: 100vh;
-      overflow: hidden;
-    }}
-
-    /* ---- HEADER ---- */
-    .header {{
-      height: var(--header-h);
-      background: linear-gradient(135deg, var(--sd-darker) 0%, var(--sd-dark) 100%);
-      color: white;
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      padding: 0 24px;
-      box-shadow: 0 2px 8px rgba(30,126,52,0.15);
-      position: fixed;
-      top: 0;
-      left: 0;
-      right: 0;
-      z-index: 100;
-    }}
-    .header h1 {{ font-size: 18px; font-weight: 700; letter-spacing: -0.3px; }}
-    .header .subtitle {{ font-size: 12px; opacity: 0.8; }}
-    .header-right {{ display: flex; align-items: center; gap: 12px; }}
-    .print-btn {{
-      padding: 6px 14px;
-      background: rgba(255,255,255,0.15);
-      border: 1px solid rgba(255,255,255,0.3);
-      border-radius: 6px;
-      color: white;
-      font-size: 12px;
-      font-weight: 600;
-      cursor: pointer;
-    }}
-    .print-btn:hover {{ background: rgba(255,255,255,0.25); }}
+def _render_crm_item(interaction: InteractionRecord) -> str:
+    """Render a single CRM activity card."""
+    esc = html.escape
+    type_class = _CRM_TYPE_CLASS.get(interaction.activity_type, "crm-task")
+    date_html = f'<span class="crm-date">{esc(interaction.date)}</span>' if interaction.date else ""
+    owner_html = f'<span class="crm-owner">{esc(interaction.owner)}</span>' if interaction.owner else ""
+    subject_html = f'<div class="crm-subject">{esc(interaction.subject)}</div>' if interaction.subject else ""
 
-    /* ---- LAYOUT ---- */
-    .layout {{
-      display: flex;
-      margin-top: var(--header-h);
-      height: calc(100vh - var(--header-h));
-    }}
+    notes_html = ""
+    notes_raw = interaction.notes or ""
+    if notes_raw:
+        notes_escaped = esc(notes_raw)
+        if len(notes_raw) < 150:
+            notes_html = f'<div class="crm-notes">{notes_escaped}</div>'
+        else:
+            preview = esc(notes_raw[:120].rsplit(" ", 1)[0]) + "..."
+            notes_html = (
+                f'<div class="crm-notes-wrap">'
+                f'<div class="crm-notes-preview">{preview} '
+                f'<button class="crm-expand-btn" data-action="toggleNotes">Show more</button></div>'
+                f'<div class="crm-notes-full">{notes_escaped} '
+                f'<button class="crm-expand-btn" data-action="toggleNotes">Show less</button></div>'
+                f'</div>'
+            )
 
-    /* ---- SIDEBAR ---- */
-    .sidebar {{
-      width: var(--sidebar-w);
-      min-width: var(--sidebar-w);
-      background: var(--card);
-      border-right: 1px solid var(--border);
-      display: flex;
-      flex-direction: column;
-      overflow: hidden;
-    }}
-    .sidebar-controls {{
-      padding: 12px;
-      border-bottom: 1px solid var(--border);
-      display: flex;
-      flex-direction: column;
-      gap: 8px;
-    }}
-    .sidebar-search {{
-      width: 100%;
-      padding: 8px 12px;
-      border: 1px solid var(--border);
-      border-radius: 6px;
-      font-size: 13px;
-      background: var(--bg);
-    }}
-    .sidebar-search:focus {{ outline: none; border-color: var(--sd-primary); }}
-    .sidebar-filters {{
-      display: flex;
-      gap: 4px;
-    }}
-    .sidebar-filter-select {{
-      flex: 1;
-      padding: 6px 8px;
-      border: 1px solid var(--border);
-      border-radius: 6px;
-      font-size: 12px;
-      background: var(--card);
-    }}
-    .sidebar-sort-btn {{
-      padding: 6px 10px;
-      border: 1px solid var(--border);
-      border-radius: 6px;
-      background: var(--card);
-      font-size: 11px;
-      font-weight: 600;
-      cursor: pointer;
-      color: var(--text-secondary);
-    }}
-    .sidebar-sort-btn:hover {{ border-color: var(--sd-primary); color: var(--sd-primary); }}
-    .sidebar-sort-btn.active {{ background: var(--sd-primary); color: white; border-color: var(--sd-primary); }}
+    return (
+        f'<div class="crm-item {type_class}">'
+        f'<div class="crm-header">'
+        f'<span class="crm-type">{esc(interaction.activity_type)}</span>'
+        f'{date_html}{owner_html}'
+        f'</div>'
+        f'{subject_html}{notes_html}'
+        f'</div>'
+    )
 
-    .sidebar-list {{
-      flex: 1;
-      overflow-y: auto;
-      padding: 4px 0;
-    }}
 
-    /* Fit group headers */
-    .sidebar-group-header {{
-      font-size: 10px;
-      font-weight: 700;
-      text-transform: uppercase;
-      letter-spacing: 0.8px;
-      color: var(--text-secondary);
-      padding: 10px 16px 4px;
-    }}
+# Indexed by the is_current bool — no per-item branch
+_DOT_CLASS = (sys.intern("dot-prior"), sys.intern("dot-current"))
 
-    .sidebar-item {{
-      padding: 10px 16px;
-      cursor: pointer;
-      border-left: 3px solid transparent;
-      transition: all 0.15s;
-    }}
-    .sidebar-item:hover {{ background: var(--sd-bg); }}
-    .sidebar-item.active {{
-      background: var(--sd-bg);
-      border-left-color: var(--sd-primary);
-    }}
-    .sidebar-item-top {{
-      display: flex;
-      align-items: center;
-      gap: 8px;
-    }}
-    .sidebar-score {{
-      min-width: 28px;
-      height: 22px;
-      border-radius: 4px;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      font-size: 11px;
-      font-weight: 700;
-      color: white;
-    }}
-    .sidebar-score.fit-high {{ background: var(--fit-high); }}
-    .sidebar-score.fit-medium {{ background: var(--fit-medium); color: #422006; }}
-    .sidebar-score.fit-low {{ background: var(--fit-low); }}
-    .sidebar-name {{
-      font-size: 13px;
-      font-weight: 600;
-      color: var(--text);
-      white-space: nowrap;
-      overflow: hidden;
-      text-overflow: ellipsis;
-      flex: 1;
-    }}
-    .sidebar-item-bottom {{
-      display: flex;
-      align-items: center;
-      gap: 8px;
-      margin-top: 2px;
-      padding-left: 36px;
-    }}
-    .sidebar-people {{
-      font-size: 11px;
-      color: var(--text-secondary);
-    }}
-    .sidebar-crm-dot {{
-      width: 7px;
-      height: 7px;
-      border-radius: 50%;
-      background: var(--sd-primary);
-    }}
-    .sidebar-opp {{
-      font-size: 11px;
-      font-weight: 700;
-      color: var(--fit-high);
-    }}
-    .sidebar-warn {{
-      width: 14px; height: 14px; border-radius: 50%;
-      background: #ef4444; color: white; display: inline-flex;
-      align-items: center; justify-content: center;
-      font-size: 9px; font-weight: 800;
-    }}
 
-    /* ---- DETAIL PANEL ---- */
-    .detail-area {{
-      flex: 1;
-      overflow-y: auto;
-      background: var(--bg);
-    }}
-    .detail-panel {{ display: none; }}
-    .detail-panel.active {{ display: block; }}
-
-    .detail-hero {{
-      background: linear-gradient(135deg, var(--sd-darker) 0%, var(--sd-primary) 100%);
-      color: white;
-      padding: 16px 24px;
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      gap: 20px;
-    }}
-    .hero-title-row {{ display: flex; align-items: center; gap: 12px; margin-bottom: 10px; }}
-    .hero-main h2 {{ font-size: 22px; font-weight: 700; }}
-    .freshness-badge {{
-      font-size: 10px; font-weight: 600; padding: 2px 8px; border-radius: 4px;
-      text-transform: uppercase; letter-spacing: 0.3px;
-    }}
-    .freshness-badge.fresh {{ background: rgba(34,197,94,0.25); color: #d1fae5; }}
-    .freshness-badge.cached {{ background: rgba(255,255,255,0.15); color: rgba(255,255,255,0.7); }}
-    .hero-stats {{ display: flex; gap: 16px; flex-wrap: wrap; }}
-    .hero-stat {{
-      display: flex;
-      flex-direction: column;
-      align-items: center;
-      background: rgba(255,255,255,0.12);
-      padding: 6px 12px;
-      border-radius: 8px;
-      min-width: 80px;
-    }}
-    .hero-stat-val {{ font-size: 14px; font-weight: 700; }}
-    .hero-stat-lbl {{ font-size: 10px; opacity: 0.8; text-transform: uppercase; letter-spacing: 0.5px; }}
-
-    .fit-circle {{
-      width: 72px;
-      height: 72px;
-      border-radius: 50%;
-      display: flex;
-      flex-direction: column;
-      align-items: center;
-      justify-content: center;
-      border: 3px solid rgba(255,255,255,0.5);
-      flex-shrink: 0;
-    }}
-    .fit-circle.fit-high {{ background: rgba(34,197,94,0.3); }}
-    .fit-circle.fit-medium {{ background: rgba(234,179,8,0.3); }}
-    .fit-circle.fit-low {{ background: rgba(239,68,68,0.3); }}
-    .fit-num {{ font-size: 24px; font-weight: 800; line-height: 1; }}
-    .fit-lbl {{ font-size: 10px; text-transform: uppercase; opacity: 0.9; }}
-
-    /* ---- ACCOUNT BAR ---- */
-    .account-bar {{
-      background: var(--sd-bg);
-      border-bottom: 1px solid var(--sd-border);
-      padding: 10px 24px;
-    }}
-    .acct-bar-title {{
-      font-size: 10px;
-      font-weight: 700;
-      text-transform: uppercase;
-      letter-spacing: 0.8px;
-      color: var(--sd-dark);
-      margin-bottom: 6px;
-    }}
-    .acct-bar-items {{ display: flex; gap: 24px; flex-wrap: wrap; }}
-    .acct-bar-item {{ display: flex; flex-direction: column; }}
-    .acct-bar-label {{ font-size: 10px; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.3px; }}
-    .acct-bar-value {{ font-size: 14px; font-weight: 600; color: var(--text); }}
-
-    /* ---- DATA WARNING ---- */
-    .data-warning {{
-      display: flex; align-items: flex-start; gap: 12px;
-      background: #fef2f2; border: 1px solid #fecaca; border-left: 4px solid #ef4444;
-      border-radius: 8px; padding: 12px 16px; margin: 12px 20px 0;
-    }}
-    .data-warning-icon {{
-      width: 24px; height: 24px; border-radius: 50%;
-      background: #ef4444; color: white; display: flex;
-      align-items: center; justify-content: center;
-      font-weight: 800; font-size: 14px; flex-shrink: 0;
-    }}
-    .data-warning-text {{ font-size: 13px; color: #991b1b; line-height: 1.5; }}
-    .data-warning-text code {{
-      background: #fee2e2; padding: 1px 6px; border-radius: 3px;
-      font-size: 12px; font-family: monospace;
-    }}
+def _timeline_highlights_html(highlights: tuple[str, ...]) -> str:
+    if not highlights:
+        return ""
+    return (
+        '<div class="timeline-highlights"><div class="timeline-highlight">'
+        + '</div><div class="timeline-highlight">'.join(map(html.escape, highlights))
+        + '</div></div>'
+    )
 
-    /* ---- TALKING POINTS ---- */
-    .talking-points {{
-      background: #fefce8;
-      border: 1px solid #fde68a;
-      border-radius: 8px;
-      padding: 12px 20px;
-      margin: 12px 20px 0;
-    }}
-    .tp-header {{
-      font-size: 12px;
-      font-weight: 700;
-      text-transform: uppercase;
-      letter-spacing: 0.5px;
-      color: #92400e;
-      margin-bottom: 8px;
-    }}
-    .talking-points ul {{
-      list-style: disc;
-      padding-left: 18px;
-    }}
-    .talking-points li {{
-      font-size: 13px;
-      color: #78350f;
-      line-height: 1.6;
-      margin-bottom: 4px;
-    }}
 
-    /* ---- SECTION CARDS ---- */
-    .section-card {{
-      background: var(--card);
-      border-radius: 10px;
-      padding: 14px 20px;
-      box-shadow: 0 1px 4px rgba(0,0,0,0.04);
-      border: 1px solid var(--border);
-    }}
-    .section-card h3 {{
-      font-size: 15px;
-      font-weight: 700;
-      color: var(--sd-dark);
-      margin-bottom: 14px;
-    }}
+def _render_experience_timeline(person: PersonProfile) -> str:
+    """Render work experience as a vertical timeline."""
+    current = None
+    if person.current_title and person.current_company:
+        current = (person.current_title, person.current_company, person.tenure_current)
+    prior = tuple(
+        (exp.firm, exp.title, exp.duration, tuple(exp.highlights))
+        for exp in person.prior_experience
+    )
+    return _render_timeline_cached(current, prior)
 
-    /* ---- OPPORTUNITIES TABLE ---- */
-    .table-wrap {{ overflow-x: auto; }}
-    .opp-table {{
-      width: 100%;
-      border-collapse: collapse;
-      font-size: 13px;
-    }}
-    .opp-table th {{
-      text-align: left;
-      font-size: 10px;
-      font-weight: 700;
-      text-transform: uppercase;
-      letter-spacing: 0.5px;
-      color: var(--text-secondary);
-      padding: 8px 12px;
-      border-bottom: 2px solid var(--border);
-    }}
-    .opp-table td {{
-      padding: 10px 12px;
-      border-bottom: 1px solid var(--border-light);
-      color: var(--text);
-    }}
-    .opp-table tr:hover td {{ background: var(--sd-bg); }}
-    .opp-stage {{
-      display: inline-block;
-      padding: 2px 8px;
-      border-radius: 4px;
-      font-size: 11px;
-      font-weight: 600;
-      background: var(--sd-light);
-      color: var(--sd-darker);
-    }}
-    .opp-amount {{ font-weight: 600; white-space: nowrap; }}
-    .opp-notes-row td {{
-      padding: 0 12px 10px !important;
-      border-bottom: 1px solid var(--border-light) !important;
-      background: none !important;
-    }}
-    .opp-notes-text {{
-      font-size: 12px;
-      color: var(--text-secondary);
-      line-height: 1.5;
-      padding-left: 4px;
-    }}
-    .opp-notes-text strong {{
-      font-weight: 600;
-      color: var(--text);
-    }}
-    .opp-detail {{
-      margin-bottom: 4px;
-    }}
-    .opp-detail:last-child {{
-      margin-bottom: 0;
-    }}
-    .opp-roadblock {{
-      color: #b45309;
-    }}
-    .opp-roadblock strong {{
-      color: #92400e;
-    }}
-    .opp-note-item {{
-      border-left: 2px solid var(--sd-primary);
-      padding-left: 8px;
-      margin-top: 4px;
-    }}
-    .opp-type-badge {{
-      font-size: 10px;
-      padding: 1px 6px;
-      border-radius: 3px;
-      background: var(--bg);
-      color: var(--text-secondary);
-      font-weight: 500;
-      margin-left: 4px;
-    }}
 
-    /* Space between detail sections */
-    .detail-panel > .section-card,
-    .detail-panel > .news-card,
-    .detail-panel > .people-section,
-    .detail-panel > .notes-section {{
-      margin: 12px 20px;
-    }}
+# Keyed on the experience content itself, so people repeated across companies
+# (or re-rendered in the same process) reuse the finished fragment.
+@functools.lru_cache(maxsize=4096)
+def _render_timeline_cached(
+    current: tuple[str, str, str | None] | None,
+    prior: tuple[tuple[str, str, str | None, tuple[str, ...]], ...],
+) -> str:
+    # Column-wise (SoA) layout: current role first, then prior. Each column
+    # is escaped in one pass instead of field-by-field per row.
+    titles: list[str] = []
+    firms: list[str] = []
+    durations: list[str | None] = []
+    highlights: list[tuple[str, ...]] = []
+    is_current = bytearray()
+
+    if current:
+        title, firm, tenure = current
+        titles.append(title)
+        firms.append(firm)
+        durations.append(tenure)
+        highlights.append(())
+        is_current.append(1)
+
+    for firm, title, exp_duration, exp_highlights in prior:
+        titles.append(title)
+        firms.append(firm)
+        durations.append(exp_duration)
+        highlights.append(exp_highlights)
+        is_current.append(0)
+
+    if not titles:
+        return ""
 
-    /* ---- NEWS ---- */
-    .news-card {{ border-left: 4px solid var(--fit-medium); }}
-    .news-card h3 {{ color: #92400e; }}
-    .news-item {{
-      padding: 6px 10px;
-      background: #fffbeb;
-      border-left: 3px solid #fbbf24;
-      border-radius: 4px;
-      margin-bottom: 4px;
-      font-size: 12px;
-      color: #78350f;
-      line-height: 1.5;
-    }}
-    .news-hidden {{ display: none; }}
-    .news-toggle-btn {{
-      background: none;
-      border: none;
-      color: var(--sd-primary);
-      font-size: 12px;
-      font-weight: 600;
-      cursor: pointer;
-      padding: 4px 0;
-    }}
-    .news-toggle-btn:hover {{ text-decoration: underline; }}
-
-    /* ---- INTEL GRID ---- */
-    .intel-grid {{
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(340px, 1fr));
-      gap: 12px;
-      padding: 12px 20px;
-    }}
+    esc = html.escape
+    esc_titles = [esc(t) if t else "Role" for t in titles]
+    esc_firms = list(map(esc, firms))
+    duration_html = [
+        f' <span class="timeline-duration">({esc(d)})</span>' if d else "" for d in durations
+    ]
+    highlights_html = list(map(_timeline_highlights_html, highlights))
+
+    # Row markup inlined as one f-string — compiles to a single BUILD_STRING
+    # with direct local loads, no template parse or keyword-arg dict per row.
+    dot_class = _DOT_CLASS
+    parts = [
+        f'<div class="timeline-item">'
+        f'<div class="timeline-dot {dot_class[cur]}"></div>'
+        f'<div class="timeline-content">'
+        f'<div class="timeline-role">{title}</div>'
+        f'<div class="timeline-firm">{firm}{dur}</div>'
+        f'{hl}'
+        f'</div></div>'
+        for cur, title, firm, dur, hl in zip(
+            is_current, esc_titles, esc_firms, duration_html, highlights_html
+        )
+    ]
+    timeline_items = "".join(parts)
 
-    /* ---- INFO ROWS / TAGS ---- */
-    .info-row {{ padding: 10px 0; border-bottom: 1px solid var(--border-light); }}
-    .info-row:last-child {{ border-bottom: none; }}
-    .info-label {{ font-size: 10px; font-weight: 700; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px; }}
-    .info-value {{ font-size: 13px; color: var(--text); }}
-    .tag-list {{ display: flex; flex-wrap: wrap; gap: 5px; }}
-    .tag {{
-      background: var(--sd-bg);
-      color: var(--sd-darker);
-      padding: 3px 10px;
-      border-radius: 5px;
-      font-size: 12px;
-      font-weight: 500;
-      border: 1px solid var(--sd-border);
-    }}
+    return f'<div class="person-timeline"><div class="section-label">Experience</div><div class="timeline">{timeline_items}</div></div>'
 
-    /* ---- SUMMARY ---- */
-    .summary-section .summary-block {{ margin-bottom: 12px; }}
-    .summary-section .summary-block:last-child {{ margin-bottom: 0; }}
-    .summary-block h4 {{ font-size: 12px; font-weight: 700; color: var(--sd-dark); text-transform: uppercase; letter-spacing: 0.3px; margin-bottom: 4px; }}
-    .summary-block p {{ font-size: 13px; line-height: 1.7; color: var(--text); }}
-
-    /* ---- DEAL ITEMS ---- */
-    .deal-item {{
-      padding: 8px 14px;
-      background: var(--bg);
-      border-left: 3px solid var(--sd-primary);
-      border-radius: 4px;
-      margin-bottom: 6px;
-      font-size: 13px;
-      color: var(--text);
-    }}
 
-    /* ---- SOURCE CITATIONS ---- */
-    .source-link {{ color: var(--sd-primary); font-size: 11px; text-decoration: none; font-weight: 600; }}
-    .source-link:hover {{ text-decoration: underline; }}
-
-    /* ---- SOURCES FOOTER ---- */
-    .sources-footer {{ margin: 12px 20px; }}
-    .sources-footer h3 {{ font-size: 13px; }}
-    .source-footer-item {{ font-size: 11px; color: var(--text-secondary); margin-bottom: 2px; }}
-    .source-num {{ font-weight: 700; color: var(--sd-primary); }}
-    .source-footer-link {{ color: var(--sd-primary); text-decoration: none; font-weight: 600; }}
-    .source-footer-link:hover {{ text-decoration: underline; }}
-    .source-footer-path {{ color: var(--text-secondary); font-size: 10px; margin-left: 2px; }}
-
-    /* ---- PERSON SOURCES ---- */
-    .person-sources {{ padding: 0 16px 8px; }}
-    .person-source-list {{ display: flex; flex-wrap: wrap; gap: 6px; }}
-    .person-source-link {{
-      font-size: 11px; color: var(--sd-primary); text-decoration: none;
-      background: var(--sd-bg); padding: 2px 8px; border-radius: 4px;
-      border: 1px solid var(--sd-border);
-    }}
-    .person-source-link:hover {{ text-decoration: underline; background: var(--sd-light); }}
+def _render_tags(items: list[str], css_class: str = "tag") -> str:
+    if not items:
+        return ""
+    return _render_tags_cached(tuple(items), css_class)
 
-    /* ---- LINKEDIN BUTTON ---- */
-    .person-linkedin-btn {{
-      font-size: 11px; font-weight: 600; padding: 2px 8px; border-radius: 4px;
-      background: #0077b5; color: white; text-decoration: none;
-    }}
-    .person-linkedin-btn:hover {{ background: #005f8d; }}
-
-    /* ---- PEOPLE SECTION ---- */
-    .people-section {{ margin: 12px 20px; }}
-    .people-header {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px; }}
-    .people-header h3 {{ margin-bottom: 0; }}
-    .people-section h3 {{
-      font-size: 16px;
-      font-weight: 700;
-      color: var(--text);
-      margin-bottom: 12px;
-    }}
-    .expand-all-btn {{
-      font-size: 11px; font-weight: 600; padding: 4px 12px; border-radius: 5px;
-      border: 1px solid var(--border); background: var(--card); color: var(--text-secondary);
-      cursor: pointer;
-    }}
-    .expand-all-btn:hover {{ border-color: var(--sd-primary); color: var(--sd-primary); }}
-
-    /* ---- ACCORDION ---- */
-    .accordion {{
-      border: 1px solid var(--border);
-      border-radius: 8px;
-      margin-bottom: 8px;
-      background: var(--card);
-      overflow: hidden;
-    }}
-    .accordion-header {{
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      padding: 10px 14px;
-      cursor: pointer;
-      user-select: none;
-      transition: background 0.15s;
-    }}
-    .accordion-header:hover {{ background: var(--bg); }}
-    .accordion-left {{ display: flex; align-items: center; gap: 12px; }}
-    .avatar {{
-      width: 36px;
-      height: 36px;
-      border-radius: 50%;
-      background: var(--sd-primary);
-      color: white;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      font-size: 13px;
-      font-weight: 700;
-      flex-shrink: 0;
-    }}
-    .accordion-name {{ font-size: 14px; font-weight: 600; color: var(--text); }}
-    .accordion-title {{ font-size: 12px; color: var(--text-secondary); }}
-    .person-email {{ font-size: 11px; color: var(--sd-primary); text-decoration: none; }}
-    .person-email:hover {{ text-decoration: underline; }}
-    .accordion-right {{ display: flex; align-items: center; gap: 10px; }}
-    .person-crm-badge {{
-      font-size: 10px;
-      font-weight: 600;
-      padding: 2px 8px;
-      border-radius: 4px;
-      background: var(--sd-bg);
-      color: var(--sd-dark);
-    }}
-    .person-last-contact {{
-      font-size: 11px;
-      color: var(--text-secondary);
-    }}
-    .accordion-arrow {{
-      width: 8px;
-      height: 8px;
-      border-right: 2px solid var(--text-secondary);
-      border-bottom: 2px solid var(--text-secondary);
-      transform: rotate(45deg);
-      transition: transform 0.2s;
-    }}
-    .accordion.open .accordion-arrow {{ transform: rotate(-135deg); }}
 
-    .accordion-body {{
-      max-height: 0;
-      overflow: hidden;
-      transition: max-height 0.3s ease;
-    }}
-    .accordion.open .accordion-body {{
-      max-height: 3000px;
-    }}
-    .accordion-body > * {{
-      padding: 0 16px;
-    }}
-    .accordion-body > *:last-child {{
-      padding-bottom: 16px;
-    }}
+@functools.lru_cache(maxsize=4096)
+def _render_tags_cached(items: tuple[str, ...], css_class: str) -> str:
+    return '<div class="tag-list">' + "".join(
+        f'<span class="{css_class}">{item if _HTML_UNSAFE(item) is None else _escape(item)}</span>'
+        for item in items
+    ) + '</div>'
 
-    .section-label {{
-      font-size: 10px;
-      font-weight: 700;
-      color: var(--text-secondary);
-      text-transform: uppercase;
-      letter-spacing: 0.5px;
-      margin-bottom: 8px;
-      margin-top: 14px;
-    }}
 
-    .person-bio {{
-      font-size: 13px;
-      color: var(--text);
-      line-height: 1.6;
-      padding: 12px 16px;
-      background: var(--sd-bg);
-      border-radius: 6px;
-      border-left: 3px solid var(--sd-primary);
-      margin-top: 12px;
-    }}
+# ---------------------------------------------------------------------------
+# HTML Template
+# ---------------------------------------------------------------------------
 
-    /* ---- TIMELINE ---- */
-    .timeline {{ position: relative; padding-left: 20px; }}
-    .timeline::before {{
-      content: '';
-      position: absolute;
-      left: 6px;
-      top: 4px;
-      bottom: 4px;
-      width: 2px;
-      background: var(--border);
-    }}
-    .timeline-item {{
-      position: relative;
-      padding-bottom: 14px;
-      display: flex;
-      gap: 12px;
-    }}
-    .timeline-item:last-child {{ padding-bottom: 0; }}
-    .timeline-dot {{
-      width: 12px;
-      height: 12px;
-      border-radius: 50%;
-      position: absolute;
-      left: -19px;
-      top: 4px;
-      border: 2px solid var(--card);
-      z-index: 1;
-    }}
-    .dot-current {{ background: var(--sd-primary); }}
-    .dot-prior {{ background: #94a3b8; }}
-    .timeline-content {{ flex: 1; min-width: 0; }}
-    .timeline-role {{ font-size: 13px; font-weight: 600; color: var(--text); }}
-    .timeline-firm {{ font-size: 12px; color: var(--text-secondary); }}
-    .timeline-duration {{ font-weight: 600; color: var(--sd-dark); }}
-    .timeline-highlights {{ padding-left: 8px; margin-top: 4px; }}
-    .timeline-highlight {{ font-size: 12px; color: var(--text-secondary); line-height: 1.5; }}
-    .timeline-highlight::before {{ content: '- '; }}
-
-    /* ---- EDUCATION ---- */
-    .edu-item {{
-      font-size: 13px;
-      color: var(--text);
-      margin-bottom: 4px;
-      padding-left: 12px;
-      border-left: 2px solid var(--border);
-    }}
-    .edu-year {{
-      display: inline-block;
-      background: var(--sd-bg);
-      color: var(--sd-dark);
-      padding: 1px 8px;
-      border-radius: 4px;
-      font-size: 11px;
-      font-weight: 600;
-    }}
+# Static CSS lives in a sibling file and is spliced in as a value, so the
+# formatter never walks it (and it needs no {{ }} doubling). Still inlined so
+# the dashboard stays a single self-contained file.
+_CSS_STRING_RE = re.compile(r"""("[^"]*"|'[^']*')""")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};,>])\s*")
+_CSS_COLON_SPACE_RE = re.compile(r":\s+")
 
-    /* ---- CRM HISTORY (inside accordion) ---- */
-    .person-crm {{ padding: 0 16px 16px; }}
-    .crm-item {{
-      padding: 8px 12px;
-      border-radius: 6px;
-      margin-bottom: 6px;
-      font-size: 12px;
-      border-left: 3px solid var(--border);
-      background: var(--bg);
-    }}
-    .crm-call {{ border-left-color: var(--crm-call); background: #f0fdf4; }}
-    .crm-email {{ border-left-color: var(--crm-email); background: var(--sd-bg); }}
-    .crm-meeting {{ border-left-color: var(--crm-meeting); background: #faf5ff; }}
-    .crm-task {{ border-left-color: var(--crm-task); background: #fff7ed; }}
-    .crm-header {{ display: flex; gap: 10px; align-items: center; margin-bottom: 2px; }}
-    .crm-type {{ font-weight: 700; font-size: 10px; text-transform: uppercase; }}
-    .crm-date {{ color: var(--text-secondary); font-size: 11px; }}
-    .crm-owner {{ color: var(--text-secondary); font-size: 11px; font-style: italic; }}
-    .crm-subject {{ font-weight: 600; color: var(--text); margin-bottom: 2px; }}
-    .crm-notes {{ color: var(--text-secondary); line-height: 1.5; white-space: pre-wrap; }}
-    .crm-notes-wrap {{ margin-top: 2px; }}
-    .crm-notes-preview {{ color: var(--text-secondary); line-height: 1.5; }}
-    .crm-notes-full {{ color: var(--text-secondary); line-height: 1.5; white-space: pre-wrap; }}
-    .crm-expand-btn {{
-      background: none;
-      border: none;
-      color: var(--sd-primary);
-      font-size: 11px;
-      cursor: pointer;
-      padding: 0;
-      font-weight: 600;
-    }}
-    .crm-expand-btn:hover {{ text-decoration: underline; }}
-
-    /* ---- NOTES SECTION ---- */
-    .notes-section {{ margin: 12px 20px; }}
-    .notes-section h3 {{
-      font-size: 15px;
-      font-weight: 700;
-      color: var(--sd-dark);
-      margin-bottom: 12px;
-    }}
-    .note-item {{
-      padding: 10px 14px;
-      background: var(--bg);
-      border-left: 3px solid var(--sd-primary);
-      border-radius: 4px;
-      margin-bottom: 6px;
-      font-size: 13px;
-      color: var(--text);
-      line-height: 1.5;
-      white-space: pre-wrap;
-      word-break: break-word;
-    }}
-    .note-toggle {{
-      background: none; border: none; color: var(--sd-primary);
-      font-size: 11px; font-weight: 600; cursor: pointer; padding: 0; margin-left: 4px;
-    }}
-    .note-toggle:hover {{ text-decoration: underline; }}
 
-    .no-data {{
-      padding: 20px 16px;
-      color: var(--text-secondary);
-      font-size: 13px;
-      font-style: italic;
-    }}
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace; quoted strings are kept as-is."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    pieces = _CSS_STRING_RE.split(css)
+    # Odd indices are the quoted strings captured by split()
+    for i in range(0, len(pieces), 2):
+        text = " ".join(pieces[i].split())
+        text = _CSS_PUNCT_SPACE_RE.sub(r"\1", text)
+        pieces[i] = _CSS_COLON_SPACE_RE.sub(":", text)
+    return "".join(pieces).replace(";}", "}").strip() + "\n"
 
-    /* ---- SUMMARY CARDS (stats) ---- */
-    .summary-cards {{
-      display: flex;
-      gap: 8px;
-      padding: 0 24px;
-      flex-wrap: wrap;
-    }}
-    .stat-card {{
-      background: var(--card);
-      padding: 10px 16px;
-      border-radius: 8px;
-      border: 1px solid var(--border);
-      text-align: center;
-      min-width: 80px;
-    }}
-    .stat-value {{ font-size: 20px; font-weight: 700; color: var(--sd-primary); }}
-    .stat-label {{ font-size: 10px; font-weight: 600; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.4px; }}
-    .stat-high .stat-value {{ color: var(--fit-high); }}
-    .stat-medium .stat-value {{ color: var(--fit-medium); }}
-    .stat-low .stat-value {{ color: var(--fit-low); }}
-    .stat-intel .stat-value {{ color: var(--sd-primary); }}
-
-    /* ---- EMPTY STATE ---- */
-    .empty-state {{
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      height: 100%;
-      color: var(--text-secondary);
-      font-size: 15px;
-    }}
 
-    /* ---- PRINT ---- */
-    @media print {{
-      body {{ overflow: visible; height: auto; }}
-      .header {{ position: static; }}
-      .sidebar {{ display: none !important; }}
-      .layout {{ display: block; margin-top: 0; height: auto; }}
-      .detail-area {{ overflow: visible; }}
-      .detail-panel {{ display: block !important; page-break-before: always; }}
-      .detail-hero {{ -webkit-print-color-adjust: exact; print-color-adjust: exact; }}
-      .accordion-body {{ max-height: none !important; }}
-      .accordion {{ break-inside: avoid; }}
-    }}
+_STYLESHEET_BYTES = _minify_css(
+    (Path(__file__).parent / "dashboard.css").read_text(encoding="utf-8")
+).encode("utf-8")
 
-    /* ---- MOBILE ---- */
-    @media (max-width: 768px) {{
-      .layout {{ flex-direction: column; }}
-      .sidebar {{
-        width: 100%;
-        min-width: 100%;
-        max-height: 160px;
-        border-right: none;
-        border-bottom: 1px solid var(--border);
-      }}
-      .sidebar-list {{
-        display: flex;
-        overflow-x: auto;
-        overflow-y: hidden;
-        padding: 4px;
-        gap: 4px;
-      }}
-      .sidebar-item {{
-        min-width: 160px;
-        border-left: none;
-        border-bottom: 3px solid transparent;
-        flex-shrink: 0;
-      }}
-      .sidebar-item.active {{ border-bottom-color: var(--sd-primary); border-left-color: transparent; }}
-      .sidebar-item-bottom {{ padding-left: 0; }}
-      .detail-hero {{ padding: 16px; }}
-      .hero-main h2 {{ font-size: 20px; }}
-      .intel-grid {{ grid-template-columns: 1fr; padding: 12px; }}
-      .talking-points, .section-card, .people-section, .notes-section {{ margin: 12px !important; }}
-    }}
-  </style>
+_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Street Diligence Intelligence Dashboard</title>
+  <style>
+{stylesheet}  </style>
 </head>
 <body>
   <!-- HEADER -->
@@ -1613,7 +1019,7 @@ _TEMPLATE = """<!DOCTYPE html>
     <div class="sidebar">
       <div class="sidebar-controls">
         <input type="text" id="sidebar-search" class="sidebar-search"
-               placeholder="Search companies..." oninput="filterCompanies()">
+               placeholder="Search companies..." oninput="scheduleFilter()">
         <div class="sidebar-filters">
           <select id="fit-filter" class="sidebar-filter-select" onchange="filterCompanies()">
             <option value="">All Fits</option>
@@ -1634,7 +1040,6 @@ _TEMPLATE = """<!DOCTYPE html>
     <!-- DETAIL PANEL -->
     <div class="detail-area" id="detail-area">
       <div class="empty-state" id="empty-state">Select a company from the sidebar</div>
-      {detail_panels}
     </div>
   </div>
 
@@ -1642,161 +1047,434 @@ _TEMPLATE = """<!DOCTYPE html>
     const companiesData = {companies_json};
     let currentIdx = -1;
     let sortedOrder = [];
+    // Sidebar idxs currently shown, in display order; kept in sync by
+    // filterCompanies/sortCompanies so key navigation never scans the DOM
+    let visibleOrder = [];
+    let curPos = -1;
+    let sidebarMeasured = false;
+    let listH = 0, listW = 0;
+    // The selected row and panel, so switching never has to search for them
+    let activeSidebarItem = null;
+    let activeDetail = null;
+    const isVisible = companiesData.map(() => true);
+
+    // Columns read by filter/sort, one array per field indexed by position
+    // in companiesData. Search fields are lowercased here, once.
+    const N = companiesData.length;
+    const FIT_CODES = {{ High: 1, Medium: 2, Low: 3 }};
+    const idxs = new Int32Array(N);
+    const fitScores = new Float64Array(N);
+    const peopleCounts = new Int32Array(N);
+    const fitCodes = new Uint8Array(N);
+    const names = new Array(N);
+    const namesLc = new Array(N);
+    const industriesLc = new Array(N);
+    for (let i = 0; i < N; i++) {{
+      const c = companiesData[i];
+      idxs[i] = c.idx;
+      fitScores[i] = c.fitScore;
+      peopleCounts[i] = c.peopleCount;
+      fitCodes[i] = FIT_CODES[c.fitRating] || 0;
+      names[i] = c.name;
+      namesLc[i] = c.name.toLowerCase();
+      industriesLc[i] = (c.industries || '').toLowerCase();
+    }}
+
+    // Positions grouped by fit code, for filtering on a single rating
+    const allPositions = Array.from({{ length: N }}, (_, i) => i);
+    const fitBuckets = [[], [], [], []];
+    for (let i = 0; i < N; i++) fitBuckets[fitCodes[i]].push(i);
+    const matched = new Uint8Array(N);
+    // Backing stores for sortedOrder / visibleOrder, rewritten in place on
+    // every sort and filter instead of allocating new arrays
+    const orderBuf = new Uint32Array(N);
+    const visibleBuf = new Uint32Array(N);
+
+    // Every 3-char substring of the search fields maps to the positions of
+    // the companies containing it
+    const trigramIndex = new Map();
+    for (let i = 0; i < N; i++) {{
+      for (const text of [namesLc[i], industriesLc[i]]) {{
+        for (let j = 0; j + 3 <= text.length; j++) {{
+          const gram = text.slice(j, j + 3);
+          let posting = trigramIndex.get(gram);
+          if (!posting) trigramIndex.set(gram, posting = new Set());
+          posting.add(i);
+        }}
+      }}
+    }}
+
+    // A company containing the search text contains each of its trigrams, so
+    // intersecting the postings (smallest first) yields every possible match.
+    // Returns null for queries too short to index; callers scan everything.
+    function searchCandidates(search) {{
+      if (search.length < 3) return null;
+      const postings = [];
+      for (let j = 0; j + 3 <= search.length; j++) {{
+        const posting = trigramIndex.get(search.slice(j, j + 3));
+        if (!posting) return new Set();
+        postings.push(posting);
+      }}
+      postings.sort((a, b) => a.size - b.size);
+      const candidates = new Set();
+      for (const i of postings[0]) {{
+        if (postings.every(p => p.has(i))) candidates.add(i);
+      }}
+      return candidates;
+    }}
+
+    // Detail panels ship as HTML strings and are parsed into the page only
+    // when their company is first selected
+    const detailHtml = [{detail_panels}];
+    const detailByIdx = new Array(N);
+
+    // Elements looked up once at load instead of on every interaction; idx
+    // is dense (0..N-1), so rows are held in a plain array indexed by it
+    const detailArea = document.getElementById('detail-area');
+    const sidebarList = document.getElementById('sidebar-list');
+    const emptyState = document.getElementById('empty-state');
+    const sidebarByIdx = new Array(N);
+    const sidebarItems = document.getElementsByClassName('sidebar-item');
+    for (let i = 0; i < sidebarItems.length; i++) {{
+      sidebarByIdx[sidebarItems[i].dataset.idx | 0] = sidebarItems[i];
+    }}
+
+    // Rows arrive as shells; the bottom line is built from the company record
+    // the first time a row comes within 200px of the visible list
+    function hydrateSidebarRow(el) {{
+      const c = companiesData[el.dataset.idx | 0];
+      let html = '<span class="sidebar-people">' + c.peopleCount + ' contact' + (c.peopleCount !== 1 ? 's' : '') + '</span>';
+      if (c.hasCrm) html += '<span class="sidebar-crm-dot" title="Has CRM history"></span>';
+      if (c.oppCount) html += '<span class="sidebar-opp" title="' + c.oppCount + ' opportunities">$</span>';
+      if (!c.hasCoreIntel) html += '<span class="sidebar-warn" title="Insufficient data — re-run with --force-refresh">!</span>';
+      el.lastElementChild.innerHTML = html;
+    }}
+    if (window.IntersectionObserver) {{
+      const rowObserver = new IntersectionObserver((entries, observer) => {{
+        for (const entry of entries) {{
+          if (!entry.isIntersecting) continue;
+          hydrateSidebarRow(entry.target);
+          observer.unobserve(entry.target);
+        }}
+      }}, {{ root: sidebarList, rootMargin: '200px' }});
+      sidebarByIdx.forEach(el => rowObserver.observe(el));
+    }} else {{
+      sidebarByIdx.forEach(hydrateSidebarRow);
+    }}
+
+    // Large rosters keep only the sidebar rows in (or near) view attached,
+    // between two spacers standing in for the rest. Detached rows keep their
+    // classes, so filtering, sorting and selection treat them the same.
+    const VIRTUAL_MIN = 400;
+    const VIRTUAL_OVERSCAN = 8;
+    const virtualSidebar = companiesData.length >= VIRTUAL_MIN;
+    const padTop = document.createElement('div');
+    const padBottom = document.createElement('div');
+    let rowH = 0;
+    let windowFirst = -1, windowLast = -1;
+
+    function renderSidebarWindow(force) {{
+      const rows = Math.ceil(sidebarList.clientHeight / rowH) + 2 * VIRTUAL_OVERSCAN;
+      const maxFirst = Math.max(0, visibleOrder.length - rows);
+      const first = Math.min(maxFirst, Math.max(0, Math.floor(sidebarList.scrollTop / rowH) - VIRTUAL_OVERSCAN));
+      const last = Math.min(visibleOrder.length, first + rows);
+      if (!force && first === windowFirst && last === windowLast) return;
+      windowFirst = first;
+      windowLast = last;
+      padTop.style.height = first * rowH + 'px';
+      padBottom.style.height = (visibleOrder.length - last) * rowH + 'px';
+      const frag = document.createDocumentFragment();
+      frag.appendChild(padTop);
+      for (let i = first; i < last; i++) frag.appendChild(sidebarByIdx[visibleOrder[i]]);
+      frag.appendChild(padBottom);
+      sidebarList.replaceChildren(frag);
+    }}
+
+    if (virtualSidebar) {{
+      // Rows are uniform; measure one on its own rather than laying out all
+      const sample = sidebarByIdx[companiesData[0].idx];
+      sidebarList.classList.add('virtual');
+      sidebarList.replaceChildren(sample);
+      rowH = sample.offsetHeight || 60;
+      let scrollQueued = false;
+      sidebarList.addEventListener('scroll', () => {{
+        if (scrollQueued) return;
+        scrollQueued = true;
+        requestAnimationFrame(() => {{
+          scrollQueued = false;
+          renderSidebarWindow(false);
+        }});
+      }});
+      window.addEventListener('resize', () => renderSidebarWindow(true));
+    }}
+
+    function getDetail(idx) {{
+      let detail = detailByIdx[idx];
+      if (!detail && detailHtml[idx]) {{
+        const holder = document.createElement('div');
+        holder.innerHTML = detailHtml[idx];
+        detail = holder.firstElementChild;
+        detailArea.appendChild(detail);
+        detailByIdx[idx] = detail;
+        detailHtml[idx] = null;
+      }}
+      return detail || null;
+    }}
+
+    // Printing shows every panel, so materialize the rest in company order
+    window.addEventListener('beforeprint', () => {{
+      for (let i = 0; i < detailHtml.length; i++) {{
+        const detail = getDetail(i);
+        if (detail) detailArea.appendChild(detail);
+      }}
+    }});
 
     function selectCompany(idx) {{
       // Deselect previous
-      document.querySelectorAll('.sidebar-item').forEach(s => s.classList.remove('active'));
-      document.querySelectorAll('.detail-panel').forEach(d => {{
-        d.style.display = 'none';
-        d.classList.remove('active');
-      }});
+      if (activeSidebarItem) activeSidebarItem.classList.remove('active');
+      if (activeDetail) {{
+        activeDetail.style.display = 'none';
+        activeDetail.classList.remove('active');
+      }}
 
       // Select new
-      const sidebar = document.getElementById('sidebar-' + idx);
-      const detail = document.getElementById('detail-' + idx);
-      const empty = document.getElementById('empty-state');
+      const sidebar = sidebarByIdx[idx];
+      const detail = getDetail(idx);
 
       if (sidebar) sidebar.classList.add('active');
       if (detail) {{
         detail.style.display = 'block';
         detail.classList.add('active');
       }}
-      if (empty) empty.style.display = detail ? 'none' : 'flex';
+      if (emptyState) emptyState.style.display = detail ? 'none' : 'flex';
 
+      activeSidebarItem = sidebar || null;
+      activeDetail = detail;
       currentIdx = idx;
+      curPos = visibleOrder.indexOf(idx);
 
       // Scroll detail area to top
-      document.getElementById('detail-area').scrollTop = 0;
+      detailArea.scrollTop = 0;
     }}
 
     function filterCompanies() {{
       const search = document.getElementById('sidebar-search').value.toLowerCase();
       const fitFilter = document.getElementById('fit-filter').value;
-      let firstVisible = -1;
+      const fitCode = fitFilter ? FIT_CODES[fitFilter] || 255 : 0;
+      const candidates = searchCandidates(search);
+
+      // Only the smaller of the rating's bucket and the search candidates is
+      // tested, cheapest predicate first; everything outside it is hidden
+      const bucket = fitCode ? fitBuckets[fitCode] || [] : allPositions;
+      const pool = candidates && candidates.size < bucket.length ? candidates : bucket;
+      matched.fill(0);
+      for (const i of pool) {{
+        if (fitCode && fitCodes[i] !== fitCode) continue;
+        if (candidates && !candidates.has(i)) continue;
+        if (search && !namesLc[i].includes(search) && !industriesLc[i].includes(search)) continue;
+        matched[i] = 1;
+      }}
 
-      companiesData.forEach(c => {{
-        const el = document.getElementById('sidebar-' + c.idx);
-        if (!el) return;
-        const nameMatch = !search || c.name.toLowerCase().includes(search) || (c.industries || '').toLowerCase().includes(search);
-        const fitMatch = !fitFilter || c.fitRating === fitFilter;
-        const visible = nameMatch && fitMatch;
-        el.style.display = visible ? '' : 'none';
-        if (visible && firstVisible === -1) firstVisible = c.idx;
-      }});
+      let firstVisible = -1;
+      for (let i = 0; i < N; i++) {{
+        const idx = idxs[i];
+        const el = sidebarByIdx[idx];
+        if (!el) continue;
+        const visible = matched[i] === 1;
+        if (visible !== isVisible[idx]) el.classList.toggle('hidden', !visible);
+        isVisible[idx] = visible;
+        if (visible && firstVisible === -1) firstVisible = idx;
+      }}
+      rebuildVisibleOrder();
+      if (virtualSidebar) renderSidebarWindow(true);
 
       // If current company is hidden, switch to first visible
-      const currentEl = document.getElementById('sidebar-' + currentIdx);
-      if (!currentEl || currentEl.style.display === 'none') {{
+      if (!sidebarByIdx[currentIdx] || !isVisible[currentIdx]) {{
         if (firstVisible >= 0) selectCompany(firstVisible);
       }}
     }}
 
+    function rebuildVisibleOrder() {{
+      let n = 0;
+      for (let k = 0; k < sortedOrder.length; k++) {{
+        const idx = sortedOrder[k];
+        if (isVisible[idx]) visibleBuf[n++] = idx;
+      }}
+      visibleOrder = visibleBuf.subarray(0, n);
+      curPos = visibleOrder.indexOf(currentIdx);
+      sidebarMeasured = false;
+    }}
+
+    // The data is static, so each sort order is computed once up front, by
+    // sorting positions against the column arrays
+    function orderBy(compare) {{
+      const positions = Array.from({{ length: N }}, (_, i) => i);
+      positions.sort(compare);
+      return Uint32Array.from(positions, i => idxs[i]);
+    }}
+    const nameCollator = new Intl.Collator();
+    const sortOrders = {{
+      fit: orderBy((a, b) => fitScores[b] - fitScores[a]),
+      name: orderBy((a, b) => nameCollator.compare(names[a], names[b])),
+      people: orderBy((a, b) => peopleCounts[b] - peopleCounts[a]),
+    }};
+
+    // Coalesce bursts of keystrokes in the search box into one filter pass
+    let filterTimer = 0;
+    function scheduleFilter() {{
+      clearTimeout(filterTimer);
+      filterTimer = setTimeout(filterCompanies, 80);
+    }}
+
     function sortCompanies(sortBy, btn) {{
       // Update button states
       document.querySelectorAll('.sidebar-sort-btn').forEach(b => b.classList.remove('active'));
       if (btn) btn.classList.add('active');
 
-      const sorted = [...companiesData];
-      if (sortBy === 'fit') sorted.sort((a, b) => b.fitScore - a.fitScore);
-      else if (sortBy === 'name') sorted.sort((a, b) => a.name.localeCompare(b.name));
-      else if (sortBy === 'people') sorted.sort((a, b) => b.peopleCount - a.peopleCount);
-
-      // Reorder sidebar items
-      const list = document.getElementById('sidebar-list');
-      sorted.forEach(c => {{
-        const el = document.getElementById('sidebar-' + c.idx);
-        if (el) list.appendChild(el);
-      }});
+      // One memcpy of the precomputed order; an unknown key keeps data order
+      orderBuf.set(sortOrders[sortBy] || idxs);
+      const sorted = orderBuf;
+
+      // Reorder sidebar items via a fragment so the list is reinserted once
+      if (!virtualSidebar) {{
+        const frag = document.createDocumentFragment();
+        sorted.forEach(idx => {{
+          const el = sidebarByIdx[idx];
+          if (el) frag.appendChild(el);
+        }});
+        sidebarList.appendChild(frag);
+      }}
 
-      sortedOrder = sorted.map(c => c.idx);
+      sortedOrder = sorted;
+      rebuildVisibleOrder();
+      if (virtualSidebar) renderSidebarWindow(true);
 
       // Select first if nothing selected
       if (currentIdx === -1 && sorted.length > 0) {{
-        selectCompany(sorted[0].idx);
+        selectCompany(sorted[0]);
       }}
     }}
 
+    // A control's container is found on its first use and kept on the
+    // control, so later clicks skip the ancestor walk
+    function ownerOf(el, selector) {{
+      return el._owner || (el._owner = el.closest(selector));
+    }}
+
     function togglePerson(headerEl) {{
-      const accordion = headerEl.closest('.accordion');
-      accordion.classList.toggle('open');
+      ownerOf(headerEl, '.accordion').classList.toggle('open');
     }}
 
     function toggleAllAccordions(btn) {{
-      const section = btn.closest('.people-section');
-      const accordions = section.querySelectorAll('.accordion');
-      const allOpen = Array.from(accordions).every(a => a.classList.contains('open'));
-      accordions.forEach(a => {{
-        if (allOpen) a.classList.remove('open');
-        else a.classList.add('open');
-      }});
+      // Live collection, owned by the button
+      const accordions = btn._accordions ||
+        (btn._accordions = ownerOf(btn, '.people-section').getElementsByClassName('accordion'));
+      const len = accordions.length;
+      let allOpen = true;
+      for (let i = 0; i < len; i++) {{
+        if (!accordions[i].classList.contains('open')) {{
+          allOpen = false;
+          break;
+        }}
+      }}
+      for (let i = 0; i < len; i++) {{
+        accordions[i].classList.toggle('open', !allOpen);
+      }}
       btn.textContent = allOpen ? 'Expand All' : 'Collapse All';
     }}
 
+    // Expanded state lives in a class on the container; the stylesheet
+    // decides which children are shown
     function toggleNewsExpand(btn) {{
-      const card = btn.closest('.news-card');
-      const hidden = card.querySelectorAll('.news-hidden');
-      const isExpanded = btn.dataset.expanded === 'true';
-      hidden.forEach(el => el.style.display = isExpanded ? 'none' : '');
-      if (isExpanded) {{
-        btn.textContent = 'Show ' + hidden.length + ' more';
-        btn.dataset.expanded = 'false';
-      }} else {{
-        btn.textContent = 'Show less';
-        btn.dataset.expanded = 'true';
+      const card = ownerOf(btn, '.news-card');
+      const expanded = card.classList.toggle('expanded');
+      if (card._hiddenCount === undefined) {{
+        card._hiddenCount = card.getElementsByClassName('news-hidden').length;
       }}
+      btn.textContent = expanded ? 'Show less' : 'Show ' + card._hiddenCount + ' more';
     }}
 
     function toggleNotes(btn) {{
-      const wrap = btn.closest('.crm-notes-wrap');
-      const preview = wrap.querySelector('.crm-notes-preview');
-      const full = wrap.querySelector('.crm-notes-full');
-      if (preview.style.display === 'none') {{
-        preview.style.display = '';
-        full.style.display = 'none';
-      }} else {{
-        preview.style.display = 'none';
-        full.style.display = '';
-      }}
+      ownerOf(btn, '.crm-notes-wrap').classList.toggle('expanded');
     }}
 
     function toggleNoteExpand(btn) {{
-      const item = btn.closest('.note-expandable');
-      const preview = item.querySelector('.note-preview');
-      const full = item.querySelector('.note-full');
-      if (preview.style.display === 'none') {{
-        preview.style.display = '';
-        full.style.display = 'none';
-      }} else {{
-        preview.style.display = 'none';
-        full.style.display = '';
+      ownerOf(btn, '.note-expandable').classList.toggle('expanded');
+    }}
+
+    // One click listener per container instead of a handler on every row and
+    // button. Links are left to the browser, so following an email or
+    // LinkedIn link in a person header does not also toggle the accordion.
+    const detailActions = {{ togglePerson, toggleAllAccordions, toggleNewsExpand, toggleNotes, toggleNoteExpand }};
+    detailArea.addEventListener('click', e => {{
+      const target = e.target.closest('a, [data-action]');
+      if (!target || target.tagName === 'A') return;
+      const action = detailActions[target.dataset.action];
+      if (action) action(target);
+    }});
+    sidebarList.addEventListener('click', e => {{
+      const item = e.target.closest('.sidebar-item');
+      if (item) selectCompany(item.dataset.idx | 0);
+    }});
+
+    // Sidebar geometry is read in one batch the first time it is needed after
+    // a sort, filter or resize, so key navigation scrolls without forcing a
+    // synchronous layout on every press. The list is the items' offsetParent.
+    function measureSidebar() {{
+      listH = sidebarList.clientHeight;
+      listW = sidebarList.clientWidth;
+      if (!virtualSidebar) {{
+        sidebarByIdx.forEach(el => {{
+          el._top = el.offsetTop;
+          el._h = el.offsetHeight;
+          el._left = el.offsetLeft;
+          el._w = el.offsetWidth;
+        }});
+      }}
+      sidebarMeasured = true;
+    }}
+    window.addEventListener('resize', () => {{ sidebarMeasured = false; }});
+
+    // Scroll the list just enough to show the row at visibleOrder[pos], on
+    // either axis (the sidebar becomes a horizontal strip on narrow screens)
+    function scrollSidebarTo(pos) {{
+      if (!sidebarMeasured) measureSidebar();
+      if (virtualSidebar) {{
+        // A virtual row's offset follows from its position; the scroll
+        // handler then attaches it
+        const rowTop = pos * rowH, top = sidebarList.scrollTop;
+        if (rowTop < top) sidebarList.scrollTop = rowTop;
+        else if (rowTop + rowH > top + listH) sidebarList.scrollTop = rowTop + rowH - listH;
+        return;
       }}
+      const el = sidebarByIdx[visibleOrder[pos]];
+      const top = sidebarList.scrollTop;
+      if (el._top < top) sidebarList.scrollTop = el._top;
+      else if (el._top + el._h > top + listH) sidebarList.scrollTop = el._top + el._h - listH;
+      const left = sidebarList.scrollLeft;
+      if (el._left < left) sidebarList.scrollLeft = el._left;
+      else if (el._left + el._w > left + listW) sidebarList.scrollLeft = el._left + el._w - listW;
     }}
 
     // Keyboard navigation
     document.addEventListener('keydown', function(e) {{
       if (e.target.tagName === 'INPUT' || e.target.tagName === 'SELECT') return;
 
-      // Get visible sidebar items in order
-      const visible = [];
-      document.querySelectorAll('.sidebar-item').forEach(el => {{
-        if (el.style.display !== 'none') {{
-          visible.push(parseInt(el.dataset.idx));
-        }}
-      }});
+      const visible = visibleOrder;
       if (visible.length === 0) return;
 
-      const curPos = visible.indexOf(currentIdx);
-
       if (e.key === 'ArrowDown' || e.key === 'j') {{
         e.preventDefault();
         const next = curPos < visible.length - 1 ? curPos + 1 : 0;
+        if (visible[next] === currentIdx) return;
+        scrollSidebarTo(next);
         selectCompany(visible[next]);
-        document.getElementById('sidebar-' + visible[next]).scrollIntoView({{ block: 'nearest' }});
       }} else if (e.key === 'ArrowUp' || e.key === 'k') {{
         e.preventDefault();
         const prev = curPos > 0 ? curPos - 1 : visible.length - 1;
+        if (visible[prev] === currentIdx) return;
+        scrollSidebarTo(prev);
         selectCompany(visible[prev]);
-        document.getElementById('sidebar-' + visible[prev]).scrollIntoView({{ block: 'nearest' }});
       }}
     }});
 
@@ -1805,10 +1483,55 @@ _TEMPLATE = """<!DOCTYPE html>
       sortCompanies('fit', document.querySelector('.sidebar-sort-btn[data-sort="fit"]'));
       if (companiesData.length > 0) {{
         // Select highest fit company
-        const sorted = [...companiesData].sort((a, b) => b.fitScore - a.fitScore);
-        selectCompany(sorted[0].idx);
+        selectCompany(sortOrders.fit[0]);
       }}
     }};
   </script>
 </body>
 </html>"""
+
+
+def _split_template(template: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a str.format template into literal chunks and placeholder names.
+
+    Returns (chunks, fields) with len(chunks) == len(fields) + 1, so the page
+    is chunks[0] + value(fields[0]) + chunks[1] + ... + chunks[-1].
+    """
+    chunks: list[str] = []
+    fields: list[str] = []
+    pending: list[str] = []
+    # parse() also yields field-less segments at each {{ / }} escape, so
+    # literals are merged until the next real placeholder.
+    for literal, field, _spec, _conv in string.Formatter().parse(template):
+        pending.append(literal)
+        if field is not None:
+            chunks.append("".join(pending))
+            fields.append(field)
+            pending = []
+    chunks.append("".join(pending))
+    return tuple(chunks), tuple(fields)
+
+
+# Parsed and UTF-8 encoded once at import — rendering is then plain writes,
+# with no format-parser pass, {{ }} unescaping, or re-encoding of static text.
+_CHUNKS, _FIELDS = _split_template(_TEMPLATE)
+_CHUNKS_BYTES = tuple(chunk.encode("utf-8") for chunk in _CHUNKS)
+
+
+def _write_page(
+    ctx: dict[str, bytes | Callable[[Callable[[bytes], object]], None]],
+    write: Callable[[bytes], object],
+) -> None:
+    """Write the template chunks interleaved with ``ctx`` values.
+
+    A value is either finished bytes or a callable that streams its own
+    fragments to ``write``.
+    """
+    write(_CHUNKS_BYTES[0])
+    for field, chunk in zip(_FIELDS, _CHUNKS_BYTES[1:]):
+        value = ctx[field]
+        if callable(value):
+            value(write)
+        else:
+            write(value)
+        write(chunk)
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import io
 import logging
 import time
-
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain, islice
+from urllib.parse import urlparse
+
+import httpx
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskID
+from rich.text import Text
 
 from company_research.analysis.batch_client import BatchProcessor
 from company_research.analysis.extraction import (
@@ -16,6 +26,12 @@ from company_research.analysis.extraction import (
     extract_company_intelligence,
     _parse_extraction_response,
 )
+from company_research.analysis.llm_client import get_active_provider, llm_complete
+from company_research.analysis.prompts import (
+    EXTRACTION_PROMPT,
+    PERSON_EXTRACTION_PROMPT,
+    build_summary_prompt,
+)
 from company_research.analysis.scoring import compute_fit_score
 from company_research.analysis.strategic import (
     generate_company_summary,
@@ -23,11 +39,14 @@ from company_research.analysis.strategic import (
     _parse_summary_response,
     _parse_person_response,
 )
-from company_research.cache.store import ResearchCache
+from company_research.cache.store import ResearchCache, _is_expired
 from company_research.config import Config
 from company_research.models import (
     CompanyInput,
+    ContactInfo,
+    CompanyIntelligence,
     CompanyResult,
+    CompanySummary,
     InteractionRecord,
     PersonProfile,
     RankedURL,
@@ -36,20 +55,168 @@ from company_research.models import (
     SFAccountInfo,
     SFOpportunity,
 )
-from company_research.salesforce.client import SalesforceClient
+from company_research.salesforce.client import SFContactHistory, SalesforceClient
 from company_research.scrape.extractor import extract_page
+from company_research.scrape.http_scraper import new_scrape_client
 from company_research.search.duckduckgo_client import search_ddg
 from company_research.search.firecrawl_client import search_firecrawl
 from company_research.search.strategy import (
     generate_queries,
-    generate_person_queries,
     generate_team_page_query,
+    person_query_templates,
+    render_person_queries,
+    _guess_domain,
 )
 from company_research.search.url_ranker import rank_and_deduplicate
 
 logger = logging.getLogger(__name__)
 console = Console(force_terminal=True)
 
+# Volatile CRM fields left out of cached payloads (refreshed on every run)
+_PROFILE_CACHE_EXCLUDE = frozenset({"interactions", "sf_status", "last_contacted"})
+_COMPANY_CACHE_EXCLUDE = {
+    "sf_account": True,
+    "fit_score": True,
+    "person_profiles": {"__all__": _PROFILE_CACHE_EXCLUDE},
+}
+
+
+# Queries kept in ResearchPipeline's in-memory search-result memo
+_SEARCH_MEMO_SIZE = 2048
+
+
+def _snippet_lines(results: list[SearchResult]) -> Iterator[str]:
+    """Yield '- [source] snippet' lines for results that have a snippet."""
+    for r in results:
+        snippet = r.snippet.strip() if r.snippet else ""
+        if snippet:
+            label = "LinkedIn" if "linkedin.com" in r.url else r.title[:50]
+            yield f"- [{label}] {snippet}"
+
+
+def _combine_team_pages(scraped: dict[str, str], limit: int = 20000) -> str:
+    """Join team page markdown under headers, stopping once ~limit chars are in.
+
+    Pages are added whole until the running total passes limit. The parts
+    go into one join, so no per-page header+body string is built.
+    """
+    parts: list[str] = []
+    total_len = 0
+    for url, md in scraped.items():
+        if total_len > limit:
+            break
+        if parts:
+            parts.append("\n\n")
+        parts.append(f"--- Team page: {url} ---\n")
+        parts.append(md)
+        total_len += len(md)
+    return "".join(parts)
+
+
+def _contact_lookup(contacts: list[ContactInfo] | None) -> dict[str, tuple[str, str]]:
+    """Map contact name -> (email, linkedin_url), first non-empty value of each."""
+    lookup: dict[str, tuple[str, str]] = {}
+    for c in contacts or ():
+        email, linkedin = lookup.get(c.name, ("", ""))
+        lookup[c.name] = (email or c.email, linkedin or c.linkedin_url)
+    return lookup
+
+
+@lru_cache(maxsize=4096)
+def _company_domain(website_url: str | None, search_name: str) -> str:
+    """Memoized body of ResearchPipeline._extract_domain."""
+    if website_url:
+        try:
+            parsed = urlparse(website_url)
+            domain = parsed.netloc or parsed.path
+            domain = domain.removeprefix("www.")
+            if domain:
+                return domain
+        except Exception:
+            pass
+    # Fall back to guessing (use the shared domain guesser)
+    return _guess_domain(search_name)
+
+
+class DynamicLimiter:
+    """Concurrency limiter whose limit can be changed while tasks hold slots.
+
+    Works like ``asyncio.Semaphore`` under ``async with``, but keeps an
+    explicit in-flight count so ``set_limit`` can resize it safely.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = max(1, limit)
+        self._active = 0
+        self._cond = asyncio.Condition(asyncio.Lock())
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def __aenter__(self) -> DynamicLimiter:
+        async with self._cond:
+            while self._active >= self._limit:
+                try:
+                    await self._cond.wait()
+                except asyncio.CancelledError:
+                    # The notify() that woke us may be lost with the cancel;
+                    # hand a free slot on so it doesn't sit unused
+                    if self._active < self._limit:
+                        self._cond.notify(1)
+                    raise
+            self._active += 1
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the limit; waiters are woken if slots opened up."""
+        async with self._cond:
+            self._limit = max(1, limit)
+            self._cond.notify_all()
+
+
+class _PhaseLog:
+    """Per-item progress output for a run_batch phase.
+
+    Advances a Rich Progress task when one is supplied; otherwise buffers
+    the per-item lines and prints them in blocks of ``flush_every``.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        description: str,
+        progress: Progress | None = None,
+        flush_every: int = 10,
+    ):
+        self.total = total
+        self.done = 0
+        self._progress = progress
+        self._task: TaskID | None = (
+            progress.add_task(description, total=total) if progress is not None else None
+        )
+        self._lines: list[str] = []
+        self._flush_every = flush_every
+
+    def item(self, label: str, detail: str) -> None:
+        self.done += 1
+        if self._progress is not None:
+            self._progress.update(self._task, advance=1, description=label)
+            return
+        self._lines.append(f"  [{self.done}/{self.total}] {label}: {detail}")
+        if len(self._lines) >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            console.print("\n".join(self._lines))
+            self._lines.clear()
+
 
 class ResearchPipeline:
     """Async pipeline for company research with concurrency control."""
@@ -58,6 +225,9 @@ class ResearchPipeline:
         self.config = config
         self.force_refresh = force_refresh
         self.cache = ResearchCache(config.cache_db_path)
+        # Cache calls made while tasks run go through one worker thread, so
+        # SQLite never blocks the event loop and the connection stays serial
+        self._cache_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-io")
 
         # Salesforce integration
         self.sf_client = SalesforceClient()
@@ -66,11 +236,110 @@ class ResearchPipeline:
         # Search provider state: True = Firecrawl working, False = use DuckDuckGo
         self._firecrawl_available = bool(config.firecrawl_key)
 
-        # Semaphores for rate limiting
-        self.search_sem = asyncio.Semaphore(config.search_concurrency)
-        self.scrape_sem = asyncio.Semaphore(config.scrape_concurrency)
-        self.claude_sem = asyncio.Semaphore(config.claude_concurrency)
-        self.company_sem = asyncio.Semaphore(config.company_concurrency)
+        # Limiters for rate limiting
+        self.search_sem = DynamicLimiter(config.search_concurrency)
+        self.scrape_sem = DynamicLimiter(config.scrape_concurrency)
+        self.claude_sem = DynamicLimiter(config.claude_concurrency)
+        self.company_sem = DynamicLimiter(config.company_concurrency)
+
+        # Shared HTTP clients, open only while run()/run_batch() is active
+        self._api_http: httpx.AsyncClient | None = None
+        self._scrape_http: httpx.AsyncClient | None = None
+
+        # Searches/page fetches currently in flight, so concurrent tasks asking
+        # for the same query or URL share one network call
+        self._inflight_search: dict[Hashable, asyncio.Task] = {}
+        self._inflight_scrape: dict[Hashable, asyncio.Task] = {}
+
+        # Validated search results by query, LRU-bounded (see _cached_searches)
+        self._search_memo: OrderedDict[str, list[SearchResult]] = OrderedDict()
+
+        # One OpenAI batch client per (api key, model), shared across phases
+        self._batch_processors: dict[tuple[str, str], BatchProcessor] = {}
+
+    async def _cache_call(self, fn: Callable, *args, **kwargs):
+        """Run a blocking ResearchCache method on the cache I/O thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._cache_io, partial(fn, *args, **kwargs),
+        )
+
+    async def _coalesced(
+        self,
+        inflight: dict[Hashable, asyncio.Task],
+        key: Hashable,
+        make: Callable[[], Awaitable],
+    ):
+        """Await make(), or the identical call another task already started.
+
+        The shared task is shielded so one cancelled caller does not cancel
+        it for the others; it leaves the map as soon as it finishes.
+        """
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(make())
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _cached_searches(self, queries: list[str]) -> dict[str, list[SearchResult]]:
+        """Non-empty cached results per query ({} on force-refresh).
+
+        Served from the in-run memo first. SQLite rows are rebuilt with
+        model_construct: they were dumped from validated SearchResults.
+        """
+        if self.force_refresh:
+            return {}
+        found: dict[str, list[SearchResult]] = {}
+        misses: list[str] = []
+        for query in queries:
+            results = self._search_memo.get(query)
+            if results is None:
+                misses.append(query)
+            else:
+                self._search_memo.move_to_end(query)
+                found[query] = results
+        if misses:
+            rows = await self._cache_call(self.cache.get_searches, misses)
+            for query, cached in rows.items():
+                if cached:
+                    found[query] = self._remember_search(
+                        query, [SearchResult.model_construct(**r) for r in cached],
+                    )
+        return found
+
+    async def _store_searches(self, fresh: dict[str, list[SearchResult]]) -> None:
+        """Memoize fresh results and write them to the search cache."""
+        for query, results in fresh.items():
+            self._remember_search(query, results)
+        await self._cache_call(self.cache.set_searches, {
+            query: [r.model_dump() for r in results] for query, results in fresh.items()
+        })
+
+    def _remember_search(self, query: str, results: list[SearchResult]) -> list[SearchResult]:
+        self._search_memo[query] = results
+        self._search_memo.move_to_end(query)
+        if len(self._search_memo) > _SEARCH_MEMO_SIZE:
+            self._search_memo.popitem(last=False)
+        return results
+
+    @asynccontextmanager
+    async def _http_clients(self):
+        """Pooled HTTP clients shared by every search/scrape call in one run.
+
+        Opened per run (not in __init__) because the CLI drives each run
+        through its own asyncio.run() loop.
+        """
+        limits = httpx.Limits(
+            max_connections=100, max_keepalive_connections=40, keepalive_expiry=60,
+        )
+        async with httpx.AsyncClient(limits=limits) as api_http, new_scrape_client(
+            self.config.scrape_timeout, limits=limits,
+        ) as scrape_http:
+            self._api_http, self._scrape_http = api_http, scrape_http
+            try:
+                yield
+            finally:
+                self._api_http = self._scrape_http = None
 
     async def run(
         self,
@@ -84,10 +353,19 @@ class ResearchPipeline:
             progress: Rich Progress bar (CLI mode).
             progress_callback: Optional callable(pct: int, msg: str) for web SSE updates.
         """
+        async with self._http_clients():
+            return await self._run(companies, progress, progress_callback)
+
+    async def _run(
+        self,
+        companies: list[CompanyInput],
+        progress: Progress | None,
+        progress_callback: object | None,
+    ) -> list[CompanyResult]:
         self._progress_callback = progress_callback
         # Connect to Salesforce if configured
         if self.sf_client.is_configured:
-            self._sf_connected = self.sf_client.authenticate()
+            self._sf_connected = await asyncio.to_thread(self.sf_client.authenticate)
             if self._sf_connected:
                 console.print("[bold blue]Salesforce connected — pulling CRM history[/bold blue]")
             else:
@@ -98,6 +376,8 @@ class ResearchPipeline:
 
         # Check cache first
         to_process: list[tuple[int, CompanyInput]] = []
+        cache_hits: list[tuple[CompanyResult, CompanyInput]] = []
+        stale_summaries: list[CompanyResult] = []
         for i, company in enumerate(companies):
             if not self.force_refresh:
                 cached = self.cache.get_company(
@@ -110,17 +390,7 @@ class ResearchPipeline:
 
                         # Reject cached data with empty intelligence
                         # (from previous failed extractions)
-                        intel = result.intelligence
-                        has_data = (
-                            intel.company_overview.company_type
-                            or intel.company_overview.aum
-                            or intel.investment_strategy.lending_types
-                            or intel.investment_strategy.deal_types
-                            or intel.recent_activity.fund_raisings
-                            or intel.recent_activity.major_announcements
-                            or intel.portfolio_highlights.recent_deals
-                        )
-                        if not has_data:
+                        if not result.intelligence.has_content():
                             console.print(
                                 f"  [yellow][{i+1}/{total}] {company.company_name}"
                                 f" — cached data has empty intelligence, re-processing[/yellow]"
@@ -132,13 +402,10 @@ class ResearchPipeline:
                         # Always recompute fit score from cached intelligence
                         result.fit_score = compute_fit_score(result.intelligence)
 
-                        # Always refresh Salesforce data (CRM goes stale)
-                        if self._sf_connected:
-                            self._enrich_profiles_with_sf(result, company)
-                            result.sf_account = self._fetch_account_data(
-                                company.company_name
-                            )
+                        if self._summary_is_stale(cached, result):
+                            stale_summaries.append(result)
                         results.append(result)
+                        cache_hits.append((result, company))
                         console.print(
                             f"  [dim][{i+1}/{total}] {company.company_name} — loaded from cache[/dim]"
                         )
@@ -147,6 +414,11 @@ class ResearchPipeline:
                         pass  # Cache data invalid or empty, re-process
             to_process.append((i, company))
 
+        await self._refresh_stale_summaries(stale_summaries)
+
+        # Always refresh Salesforce data (CRM goes stale)
+        await self._refresh_cached_sf(cache_hits)
+
         if not to_process:
             console.print("[green]All companies loaded from cache.[/green]")
             return results
@@ -156,41 +428,32 @@ class ResearchPipeline:
             f"({len(results)} from cache)...\n"
         )
 
-        # Process uncached companies concurrently
+        result_map = {r.company.company_name: r for r in results}
+
+        # Process uncached companies concurrently, caching each result as
+        # soon as it finishes rather than after the slowest company
         tasks = [
             self._process_company_safe(idx, company, total)
             for idx, company in to_process
         ]
-        new_results = await asyncio.gather(*tasks)
-
-        # Merge cached and new results, preserving order
-        result_map: dict[str, CompanyResult] = {}
-        for r in results:
-            result_map[r.company.company_name] = r
-        for r in new_results:
+        for next_done in asyncio.as_completed(tasks):
+            r = await next_done
             result_map[r.company.company_name] = r
             # Cache successful results (strip volatile CRM data)
             if not r.error:
                 try:
-                    cacheable = json.loads(r.model_dump_json())
-                    cacheable.pop("sf_account", None)
-                    cacheable.pop("fit_score", None)
-                    for p in cacheable.get("person_profiles", []):
-                        p.pop("interactions", None)
-                        p.pop("sf_status", None)
-                        p.pop("last_contacted", None)
-                    self.cache.set_company(
-                        r.company.company_name,
-                        cacheable,
+                    cacheable = r.model_dump(mode="json", exclude=_COMPANY_CACHE_EXCLUDE)
+                    await self._cache_call(
+                        self.cache.set_company, r.company.company_name, cacheable,
                     )
                 except Exception as e:
                     logger.debug("Cache write error: %s", e)
 
         # Return in original order
-        ordered = []
-        for company in companies:
-            if company.company_name in result_map:
-                ordered.append(result_map[company.company_name])
+        ordered = [
+            r for c in companies
+            if (r := result_map.get(c.company_name)) is not None
+        ]
         return ordered
 
     async def run_batch(
@@ -204,11 +467,20 @@ class ResearchPipeline:
         Uses OpenAI Batch API for ~50% cost savings. Falls back to serial
         llm_complete() calls if batch submission or processing fails.
         """
+        async with self._http_clients():
+            return await self._run_batch(companies, progress, progress_callback)
+
+    async def _run_batch(
+        self,
+        companies: list[CompanyInput],
+        progress: Progress | None,
+        progress_callback: object | None,
+    ) -> list[CompanyResult]:
         self._progress_callback = progress_callback
 
         # Connect to Salesforce if configured
         if self.sf_client.is_configured:
-            self._sf_connected = self.sf_client.authenticate()
+            self._sf_connected = await asyncio.to_thread(self.sf_client.authenticate)
             if self._sf_connected:
                 console.print("[bold blue]Salesforce connected — pulling CRM history[/bold blue]")
             else:
@@ -219,6 +491,8 @@ class ResearchPipeline:
         # ── Phase 0: Cache check ──
         results: list[CompanyResult] = []
         to_process: list[CompanyInput] = []
+        cache_hits: list[tuple[CompanyResult, CompanyInput]] = []
+        stale_summaries: list[CompanyResult] = []
         for i, company in enumerate(companies):
             if not self.force_refresh:
                 cached = self.cache.get_company(
@@ -228,25 +502,15 @@ class ResearchPipeline:
                 if cached:
                     try:
                         result = CompanyResult.model_validate(cached)
-                        intel = result.intelligence
-                        has_data = (
-                            intel.company_overview.company_type
-                            or intel.company_overview.aum
-                            or intel.investment_strategy.lending_types
-                            or intel.investment_strategy.deal_types
-                            or intel.recent_activity.fund_raisings
-                            or intel.recent_activity.major_announcements
-                            or intel.portfolio_highlights.recent_deals
-                        )
-                        if not has_data:
+                        if not result.intelligence.has_content():
                             raise ValueError("empty intelligence")
 
                         result.from_cache = True
                         result.fit_score = compute_fit_score(result.intelligence)
-                        if self._sf_connected:
-                            self._enrich_profiles_with_sf(result, company)
-                            result.sf_account = self._fetch_account_data(company.company_name)
+                        if self._summary_is_stale(cached, result):
+                            stale_summaries.append(result)
                         results.append(result)
+                        cache_hits.append((result, company))
                         console.print(
                             f"  [dim][{i+1}/{total}] {company.company_name} — loaded from cache[/dim]"
                         )
@@ -255,6 +519,9 @@ class ResearchPipeline:
                         pass
             to_process.append(company)
 
+        await self._refresh_stale_summaries(stale_summaries)
+        await self._refresh_cached_sf(cache_hits)
+
         if not to_process:
             console.print("[green]All companies loaded from cache.[/green]")
             return results
@@ -264,10 +531,7 @@ class ResearchPipeline:
             f"({len(results)} from cache)...\n"
         )
 
-        batch = BatchProcessor(
-            api_key=self.config.openai_api_key,
-            model=self.config.openai_extraction_model,
-        )
+        batch = self._get_batch(self.config.openai_extraction_model)
         poll_interval = self.config.batch_poll_interval
         batch_timeout = self.config.batch_timeout
 
@@ -283,23 +547,32 @@ class ResearchPipeline:
 
         # ── Phase 1: Search + scrape all companies ──
         console.print(f"[bold]Phase 1: Searching & scraping {len(to_process)} companies...[/bold]")
-        company_pages: dict[str, tuple[list[ScrapedPage], list[str]]] = {}
-        for i, company in enumerate(to_process):
-            console.print(f"  [{i+1}/{len(to_process)}] {company.company_name}...", end=" ")
-            urls, fc_content = await self._search_company(company)
-            pages = await self._scrape_urls(urls, company.search_name, fc_content)
+        phase1_log = _PhaseLog(len(to_process), "Searching & scraping", progress)
+
+        async def _phase1(
+            company: CompanyInput,
+        ) -> tuple[str, tuple[list[ScrapedPage], list[str]]]:
+            async with self.company_sem:
+                urls, fc_content = await self._search_company(company)
+                pages = await self._scrape_urls(urls, company.search_name, fc_content)
             good_pages = [p for p in pages if p.content]
-            source_urls = [p.url for p in good_pages if p.content]
-            company_pages[company.company_name] = (good_pages, source_urls)
-            console.print(f"{len(urls)} URLs, {len(good_pages)} pages scraped")
+            source_urls = [p.url for p in good_pages]
+            phase1_log.item(
+                company.company_name,
+                f"{len(urls)} URLs, {len(good_pages)} pages scraped",
+            )
+            return company.company_name, (good_pages, source_urls)
+
+        company_pages: dict[str, tuple[list[ScrapedPage], list[str]]] = dict(
+            await asyncio.gather(*[_phase1(c) for c in to_process])
+        )
+        phase1_log.flush()
 
         # ── Phase 2: Batch intelligence extraction ──
         console.print(
             f"\n[bold]Phase 2: Extracting intelligence "
             f"(batch mode — {len(to_process)} requests)...[/bold]"
         )
-        from datetime import datetime
-        from company_research.analysis.prompts import EXTRACTION_PROMPT
 
         intel_requests = []
         intel_company_map: dict[str, CompanyInput] = {}
@@ -333,22 +606,12 @@ class ResearchPipeline:
                 )
                 console.print(f"  [green]Intelligence batch complete ({len(intel_results)} results)[/green]")
             except Exception as e:
-                console.print(f"  [yellow]Batch failed ({e}), falling back to serial calls...[/yellow]")
-                for req in intel_requests:
-                    try:
-                        from company_research.analysis.llm_client import llm_complete
-                        text = await llm_complete(
-                            prompt=req["prompt"],
-                            api_key_anthropic=self.config.anthropic_api_key,
-                            api_key_openai=self.config.openai_api_key,
-                            model_anthropic=self.config.extraction_model,
-                            model_openai=self.config.openai_extraction_model,
-                            max_tokens=req["max_tokens"],
-                            temperature=req["temperature"],
-                        )
-                        intel_results[req["id"]] = text
-                    except Exception as inner_e:
-                        logger.error("Serial fallback failed for %s: %s", req["id"], inner_e)
+                console.print(f"  [yellow]Batch failed ({e}), falling back to direct calls...[/yellow]")
+                intel_results.update(await self._fallback_complete(
+                    intel_requests,
+                    model_anthropic=self.config.extraction_model,
+                    model_openai=self.config.openai_extraction_model,
+                ))
 
         # Parse intelligence results
         parsed_intel: dict[str, object] = {}
@@ -357,7 +620,6 @@ class ResearchPipeline:
             parsed_intel[company_name] = _parse_extraction_response(text)
 
         # Fill empty intelligence for companies that had no content
-        from company_research.models import CompanyIntelligence
         for company in to_process:
             if company.company_name not in parsed_intel:
                 parsed_intel[company.company_name] = CompanyIntelligence()
@@ -367,27 +629,23 @@ class ResearchPipeline:
             f"\n[bold]Phase 3: Generating summaries "
             f"(batch mode — {len(to_process)} requests)...[/bold]"
         )
-        from company_research.analysis.prompts import build_summary_prompt
 
-        summary_requests = []
-        for company in to_process:
-            intelligence = parsed_intel[company.company_name]
-            intel_dict = json.loads(intelligence.model_dump_json(by_alias=False))
-            prompt = build_summary_prompt(company.company_name, intel_dict)
-            summary_requests.append({
+        summary_requests = [
+            {
                 "id": f"summary-{company.company_name}",
-                "prompt": prompt,
+                "prompt": build_summary_prompt(
+                    company.company_name, parsed_intel[company.company_name],
+                ),
                 "max_tokens": 2000,
                 "temperature": 0.2,
-            })
+            }
+            for company in to_process
+        ]
 
         summary_results: dict[str, str] = {}
         if summary_requests:
             # Use analysis model for summaries
-            summary_batch = BatchProcessor(
-                api_key=self.config.openai_api_key,
-                model=self.config.openai_analysis_model,
-            )
+            summary_batch = self._get_batch(self.config.openai_analysis_model)
             try:
                 summary_results = summary_batch.submit_and_wait(
                     summary_requests,
@@ -397,25 +655,14 @@ class ResearchPipeline:
                 )
                 console.print(f"  [green]Summary batch complete ({len(summary_results)} results)[/green]")
             except Exception as e:
-                console.print(f"  [yellow]Batch failed ({e}), falling back to serial calls...[/yellow]")
-                for req in summary_requests:
-                    try:
-                        from company_research.analysis.llm_client import llm_complete
-                        text = await llm_complete(
-                            prompt=req["prompt"],
-                            api_key_anthropic=self.config.anthropic_api_key,
-                            api_key_openai=self.config.openai_api_key,
-                            model_anthropic=self.config.analysis_model,
-                            model_openai=self.config.openai_analysis_model,
-                            max_tokens=req["max_tokens"],
-                            temperature=req["temperature"],
-                        )
-                        summary_results[req["id"]] = text
-                    except Exception as inner_e:
-                        logger.error("Serial fallback failed for %s: %s", req["id"], inner_e)
+                console.print(f"  [yellow]Batch failed ({e}), falling back to direct calls...[/yellow]")
+                summary_results.update(await self._fallback_complete(
+                    summary_requests,
+                    model_anthropic=self.config.analysis_model,
+                    model_openai=self.config.openai_analysis_model,
+                ))
 
         # Parse summary results
-        from company_research.models import CompanySummary
         parsed_summaries: dict[str, CompanySummary] = {}
         for req_id, text in summary_results.items():
             company_name = req_id.removeprefix("summary-")
@@ -425,103 +672,119 @@ class ResearchPipeline:
                 parsed_summaries[company.company_name] = CompanySummary()
 
         # ── Phase 4: Search + scrape people ──
-        all_people: list[tuple[str, CompanyInput, str, str]] = []
+        all_people: list[tuple[str, CompanyInput, str, str, str]] = []
         for company in to_process:
             intelligence = parsed_intel[company.company_name]
             company_domain = self._extract_domain(
                 intelligence.company_overview.website_url, company.search_name,
             )
+            # Index contacts once per company (first non-empty value wins)
+            contact_by_name = _contact_lookup(company.contacts)
             for person in company.people:
-                email = ""
-                if company.contacts:
-                    for c in company.contacts:
-                        if c.name == person and c.email:
-                            email = c.email
-                            break
-                all_people.append((person, company, company_domain, email))
+                email, linkedin = contact_by_name.get(person, ("", ""))
+                all_people.append((person, company, company_domain, email, linkedin))
 
         if all_people:
             console.print(
                 f"\n[bold]Phase 4: Researching {len(all_people)} people...[/bold]"
             )
 
-        # Search + scrape for each person (reuses existing concurrent logic)
-        person_pages: dict[tuple[str, str], tuple[list[ScrapedPage], str, str]] = {}
-        from company_research.analysis.prompts import PERSON_EXTRACTION_PROMPT
-
-        for i, (person, company, domain, email) in enumerate(all_people):
-            console.print(
-                f"  [{i+1}/{len(all_people)}] {person} @ {company.company_name}...",
-                end=" ",
+        # Query templates are per company; only the person name varies
+        templates_by_company = {
+            company.company_name: person_query_templates(
+                company.search_name, company_domain=domain or None,
             )
-            # Search for person
-            queries = generate_person_queries(
-                person, company.search_name,
-                company_domain=domain or None,
+            for _, company, domain, _, _ in all_people
+        }
+        person_queries = [
+            render_person_queries(templates_by_company[company.company_name], person)
+            for person, company, _, _, _ in all_people
+        ]
+        # One cache read for every person query in the batch
+        cached_searches = await self._cached_searches(list({
+            q["query"]: None for queries in person_queries for q in queries
+        }))
+        fresh_searches: dict[str, list[SearchResult]] = {}
+
+        # Search + scrape for each person; people and their queries run
+        # concurrently (search/scrape limiters still bound the load)
+        async def _person_query(
+            person: str, q: dict,
+        ) -> tuple[list[SearchResult], dict[str, str]]:
+            query_str = q["query"]
+            cached_search = cached_searches.get(query_str)
+            if cached_search:
+                return cached_search, {}
+            async with self.search_sem:
+                try:
+                    response = await self._do_search(query_str, num_results=5)
+                    organic = response.get("organic_results", [])
+                    sr_results = []
+                    for r in organic:
+                        url = r.get("link", "")
+                        if url and url.startswith("http"):
+                            sr_results.append(SearchResult(
+                                url=url, title=r.get("title", ""),
+                                snippet=r.get("snippet", ""),
+                                query_purpose=q["purpose"],
+                                position=r.get("position", 99),
+                            ))
+                    if sr_results:
+                        fresh_searches[query_str] = sr_results
+                    return sr_results, response.get("scraped_content", {})
+                except Exception as e:
+                    logger.warning("Person search failed for %s: %s", person, e)
+                    return [], {}
+
+        # Per-run memo so a query shared by several people (same company,
+        # same site: search) is fetched once, even while still in flight
+        query_memo: dict[str, asyncio.Task] = {}
+
+        def _memo_query(person: str, q: dict) -> asyncio.Task:
+            task = query_memo.get(q["query"])
+            if task is None:
+                task = asyncio.ensure_future(_person_query(person, q))
+                query_memo[q["query"]] = task
+            return task
+
+        people_log = _PhaseLog(len(all_people), "Researching people", progress)
+
+        async def _person_job(
+            person: str, company: CompanyInput, domain: str, email: str,
+            csv_linkedin: str, queries: list[dict],
+        ) -> tuple[tuple[str, str], tuple[list[ScrapedPage], str, str]]:
+            query_results = await asyncio.gather(
+                *[_memo_query(person, q) for q in queries]
             )
+            # Merge in query order so results match the sequential version,
+            # picking out the LinkedIn URL and scrapable results on the way
             all_sr: list[SearchResult] = []
-            person_fc: dict[str, str] = {}
-            for q in queries:
-                query_str = q["query"]
-                if not self.force_refresh:
-                    cached_search = self.cache.get_search(query_str)
-                    if cached_search is not None and len(cached_search) > 0:
-                        all_sr.extend(SearchResult(**r) for r in cached_search)
-                        continue
-                async with self.search_sem:
-                    try:
-                        response = await self._do_search(query_str, num_results=5)
-                        for url, md in response.get("scraped_content", {}).items():
-                            if url not in person_fc:
-                                person_fc[url] = md
-                        organic = response.get("organic_results", [])
-                        sr_results = []
-                        for r in organic:
-                            url = r.get("link", "")
-                            if url and url.startswith("http"):
-                                sr_results.append(SearchResult(
-                                    url=url, title=r.get("title", ""),
-                                    snippet=r.get("snippet", ""),
-                                    query_purpose=q["purpose"],
-                                    position=r.get("position", 99),
-                                ))
-                        if sr_results:
-                            self.cache.set_search(query_str, [r.model_dump() for r in sr_results])
-                        all_sr.extend(sr_results)
-                    except Exception as e:
-                        logger.warning("Person search failed for %s: %s", person, e)
-
-            # LinkedIn URL
+            scrapable: list[SearchResult] = []
             linkedin_url = ""
-            csv_linkedin = ""
-            if company.contacts:
-                for c in company.contacts:
-                    if c.name == person and c.linkedin_url:
-                        csv_linkedin = c.linkedin_url
-                        break
-            for r in all_sr:
-                if "linkedin.com/in/" in r.url:
-                    linkedin_url = r.url
-                    break
+            person_fc: dict[str, str] = {}
+            for sr_results, scraped in query_results:
+                for r in sr_results:
+                    all_sr.append(r)
+                    if "linkedin.com" not in r.url:
+                        scrapable.append(r)
+                    elif not linkedin_url and "linkedin.com/in/" in r.url:
+                        linkedin_url = r.url
+                for url, md in scraped.items():
+                    person_fc.setdefault(url, md)
 
             # Scrape non-LinkedIn results
-            scrapable = [r for r in all_sr if "linkedin.com" not in r.url]
             good_p_pages: list[ScrapedPage] = []
             if scrapable:
                 ranked = rank_and_deduplicate(scrapable, company.search_name, max_urls=5)
                 p_pages = await self._scrape_urls(ranked, company.search_name, person_fc)
                 good_p_pages = [p for p in p_pages if p.content]
 
-            # Add search snippets as supplementary
-            snippet_lines = []
-            for r in all_sr:
-                if r.snippet and r.snippet.strip():
-                    label = "LinkedIn" if "linkedin.com" in r.url else r.title[:50]
-                    snippet_lines.append(f"- [{label}] {r.snippet.strip()}")
+            # Add search snippets as supplementary (first 15 only)
+            snippet_lines = list(islice(_snippet_lines(all_sr), 15))
             if snippet_lines:
                 snippet_content = (
                     f"Search result snippets about {person}:\n"
-                    + "\n".join(snippet_lines[:15])
+                    + "\n".join(snippet_lines)
                 )
                 good_p_pages.append(ScrapedPage(
                     url="search-snippets://aggregated",
@@ -531,9 +794,20 @@ class ResearchPipeline:
                     quality_score=30.0,
                 ))
 
-            console.print(f"{len(good_p_pages)} pages")
+            people_log.item(
+                f"{person} @ {company.company_name}", f"{len(good_p_pages)} pages",
+            )
             best_li = csv_linkedin or linkedin_url
-            person_pages[(person, company.company_name)] = (good_p_pages, email, best_li)
+            return (person, company.company_name), (good_p_pages, email, best_li)
+
+        person_pages: dict[tuple[str, str], tuple[list[ScrapedPage], str, str]] = dict(
+            await asyncio.gather(*[
+                _person_job(*entry, queries)
+                for entry, queries in zip(all_people, person_queries)
+            ])
+        )
+        people_log.flush()
+        await self._store_searches(fresh_searches)
 
         # ── Phase 5: Batch person extraction ──
         person_requests = []
@@ -558,10 +832,7 @@ class ResearchPipeline:
                 f"\n[bold]Phase 5: Extracting person profiles "
                 f"(batch mode — {len(person_requests)} requests)...[/bold]"
             )
-            person_batch = BatchProcessor(
-                api_key=self.config.openai_api_key,
-                model=self.config.openai_extraction_model,
-            )
+            person_batch = self._get_batch(self.config.openai_extraction_model)
             person_results: dict[str, str] = {}
             try:
                 person_results = person_batch.submit_and_wait(
@@ -572,28 +843,41 @@ class ResearchPipeline:
                 )
                 console.print(f"  [green]Person batch complete ({len(person_results)} results)[/green]")
             except Exception as e:
-                console.print(f"  [yellow]Batch failed ({e}), falling back to serial calls...[/yellow]")
-                for req in person_requests:
-                    try:
-                        from company_research.analysis.llm_client import llm_complete
-                        text = await llm_complete(
-                            prompt=req["prompt"],
-                            api_key_anthropic=self.config.anthropic_api_key,
-                            api_key_openai=self.config.openai_api_key,
-                            model_anthropic=self.config.extraction_model,
-                            model_openai=self.config.openai_extraction_model,
-                            max_tokens=req["max_tokens"],
-                            temperature=req["temperature"],
-                        )
-                        person_results[req["id"]] = text
-                    except Exception as inner_e:
-                        logger.error("Serial fallback failed for %s: %s", req["id"], inner_e)
+                console.print(f"  [yellow]Batch failed ({e}), falling back to direct calls...[/yellow]")
+                person_results.update(await self._fallback_complete(
+                    person_requests,
+                    model_anthropic=self.config.extraction_model,
+                    model_openai=self.config.openai_extraction_model,
+                ))
         else:
             person_results = {}
 
         # ── Phase 6: Assemble results + Salesforce enrichment ──
         console.print(f"\n[bold]Phase 6: Enriching with Salesforce data...[/bold]")
 
+        # Salesforce lookups are blocking REST calls — fetch them all up front
+        # in worker threads rather than one after another inside the loop
+        sf_histories: dict[str, SFContactHistory | None] = {}
+        sf_accounts: dict[str, SFAccountInfo | None] = {}
+        if self._sf_connected:
+            sf_emails = [entry[1] for entry in person_pages.values()]
+            sf_histories, account_results = await asyncio.gather(
+                asyncio.to_thread(self.sf_client.get_contact_histories, sf_emails),
+                asyncio.gather(
+                    *[asyncio.to_thread(self._fetch_account_data, c.company_name) for c in to_process],
+                ),
+            )
+            sf_accounts = {
+                c.company_name: acct for c, acct in zip(to_process, account_results)
+            }
+            # Emails the bulk call could not answer get a single lookup each
+            missing = [e for e in dict.fromkeys(sf_emails) if e and e not in sf_histories]
+            if missing:
+                retried = await asyncio.gather(
+                    *[self._contact_history(e, sf_histories) for e in missing],
+                )
+                sf_histories.update(zip(missing, retried))
+
         new_results: list[CompanyResult] = []
         for company in to_process:
             name = company.company_name
@@ -621,12 +905,12 @@ class ResearchPipeline:
                 if p_li:
                     profile.linkedin_url = p_li
                 if p_pages_data:
-                    profile.source_urls = [p.url for p in p_pages_data[0] if p.content]
+                    profile.source_urls = [p.url for p in p_pages_data[0]]
 
                 # Salesforce enrichment for person
                 if self._sf_connected and p_email:
                     try:
-                        sf_history = self.sf_client.get_contact_history(p_email)
+                        sf_history = sf_histories.get(p_email)
                         if sf_history:
                             profile.sf_status = sf_history.status
                             profile.last_contacted = sf_history.last_activity_date
@@ -646,18 +930,13 @@ class ResearchPipeline:
                         logger.warning("SF lookup failed for %s: %s", person, e)
 
                 # Cache person (strip CRM data)
-                cacheable_profile = json.loads(profile.model_dump_json())
-                cacheable_profile.pop("interactions", None)
-                cacheable_profile.pop("sf_status", None)
-                cacheable_profile.pop("last_contacted", None)
+                cacheable_profile = profile.model_dump(mode="json", exclude=_PROFILE_CACHE_EXCLUDE)
                 self.cache.set_person(person, name, cacheable_profile)
 
                 profiles.append(profile)
 
             # Salesforce account data
-            sf_account = None
-            if self._sf_connected:
-                sf_account = self._fetch_account_data(name)
+            sf_account = sf_accounts.get(name)
 
             _, source_urls = company_pages.get(name, ([], []))
 
@@ -674,66 +953,120 @@ class ResearchPipeline:
 
             # Cache company (strip CRM data)
             try:
-                cacheable = json.loads(result.model_dump_json())
-                cacheable.pop("sf_account", None)
-                cacheable.pop("fit_score", None)
-                for p in cacheable.get("person_profiles", []):
-                    p.pop("interactions", None)
-                    p.pop("sf_status", None)
-                    p.pop("last_contacted", None)
+                cacheable = result.model_dump(mode="json", exclude=_COMPANY_CACHE_EXCLUDE)
                 self.cache.set_company(name, cacheable)
             except Exception as e:
                 logger.debug("Cache write error: %s", e)
 
-        # Merge cached + new results in original order
-        result_map: dict[str, CompanyResult] = {}
-        for r in results:
-            result_map[r.company.company_name] = r
-        for r in new_results:
-            result_map[r.company.company_name] = r
-
-        ordered = []
-        for company in companies:
-            if company.company_name in result_map:
-                ordered.append(result_map[company.company_name])
+        # Merge cached + new results in original order (new results win)
+        result_map = {r.company.company_name: r for r in chain(results, new_results)}
+        ordered = [
+            r for c in companies
+            if (r := result_map.get(c.company_name)) is not None
+        ]
 
         console.print(f"\n  [green]Batch pipeline complete — {len(ordered)} companies[/green]")
         console.print(f"  [dim]Cost savings: ~50% vs real-time mode[/dim]")
         return ordered
 
+    @staticmethod
+    def _active_model(model_anthropic: str, model_openai: str) -> tuple[str, str]:
+        """(provider, model) for the provider llm_complete() will use next.
+
+        Looked up per call, not cached: the provider flips to OpenAI
+        mid-run if Anthropic fails.
+        """
+        provider = get_active_provider()
+        return provider, model_anthropic if provider == "anthropic" else model_openai
+
+    def _get_batch(self, model: str) -> BatchProcessor:
+        """Return the shared BatchProcessor for a model, creating it on first use."""
+        key = (self.config.openai_api_key, model)
+        processor = self._batch_processors.get(key)
+        if processor is None:
+            processor = BatchProcessor(api_key=self.config.openai_api_key, model=model)
+            self._batch_processors[key] = processor
+        return processor
+
+    async def _fallback_complete(
+        self,
+        requests: list[dict],
+        model_anthropic: str,
+        model_openai: str,
+    ) -> dict[str, str]:
+        """Run batch requests as direct LLM calls (gated by claude_sem).
+
+        Used when a batch fails; failed requests are logged and left out.
+        """
+
+        async def one(req: dict) -> tuple[str, str | None]:
+            async with self.claude_sem:
+                try:
+                    text = await llm_complete(
+                        prompt=req["prompt"],
+                        api_key_anthropic=self.config.anthropic_api_key,
+                        api_key_openai=self.config.openai_api_key,
+                        model_anthropic=model_anthropic,
+                        model_openai=model_openai,
+                        max_tokens=req["max_tokens"],
+                        temperature=req["temperature"],
+                    )
+                    return req["id"], text
+                except Exception as e:
+                    logger.error("Fallback call failed for %s: %s", req["id"], e)
+                    return req["id"], None
+
+        pairs = await asyncio.gather(*[one(req) for req in requests])
+        return {req_id: text for req_id, text in pairs if text is not None}
+
     async def _process_company_safe(
         self,
         index: int,
         company: CompanyInput,
         total: int,
     ) -> CompanyResult:
-        """Process a single company with error handling."""
+        """Process a single company with error handling.
+
+        The company's progress lines are buffered and written as one block
+        when it finishes, so concurrent companies don't interleave on the
+        console or take its lock line by line.
+        """
+        out = Console(
+            file=io.StringIO(),
+            force_terminal=console.is_terminal,
+            color_system=console.color_system,
+            width=console.width,
+        )
         async with self.company_sem:
             try:
-                return await self._process_company(index, company, total)
+                return await self._process_company(index, company, total, out)
             except Exception as e:
                 logger.error("Pipeline error for %s: %s", company.company_name, e)
-                console.print(
+                out.print(
                     f"  [red][{index+1}/{total}] {company.company_name} — FAILED: {e}[/red]"
                 )
                 return CompanyResult.error_result(company, str(e))
+            finally:
+                if buffered := out.file.getvalue():
+                    console.print(Text.from_ansi(buffered), end="", soft_wrap=True)
 
     async def _process_company(
         self,
         index: int,
         company: CompanyInput,
         total: int,
+        out: Console = console,
     ) -> CompanyResult:
-        """Full pipeline for a single company."""
+        """Full pipeline for a single company, logging progress to out."""
         name = company.company_name
-        console.print(f"\n{'=' * 70}")
-        console.print(
+        out.print(f"\n{'=' * 70}")
+        out.print(
             f"[bold green][{index+1}/{total}] RESEARCHING: {name}[/bold green]"
         )
-        console.print(
+        out.print(
             f"  People: {', '.join(company.people)}"
         )
-        console.print(f"{'=' * 70}")
+        out.print(f"{'=' * 70}")
 
         # Report progress via callback (web mode)
         def _report(pct: int, msg: str):
@@ -746,7 +1079,7 @@ class ResearchPipeline:
         # Step 1: Multi-query search (Firecrawl returns content inline)
         _report(10, f"Searching for {name}...")
         urls, firecrawl_content = await self._search_company(company)
-        console.print(
+        out.print(
             f"  Found {len(urls)} unique URLs "
             f"({len(firecrawl_content)} already scraped by Firecrawl)"
         )
@@ -755,79 +1088,83 @@ class ResearchPipeline:
         _report(25, f"Scraping {len(urls)} URLs for {name}...")
         pages = await self._scrape_urls(urls, company.search_name, firecrawl_content)
         good_pages = [p for p in pages if p.content]
-        console.print(
+        out.print(
             f"  Scraped {len(good_pages)}/{len(pages)} pages successfully"
         )
 
         # Step 3: Extract structured intelligence
         _report(40, f"Extracting intelligence for {name}...")
-        from company_research.analysis.llm_client import get_active_provider
-        provider = get_active_provider()
-        model_label = (
-            self.config.extraction_model if provider == "anthropic"
-            else self.config.openai_extraction_model
+        provider, model_label = self._active_model(
+            self.config.extraction_model, self.config.openai_extraction_model,
         )
-        console.print(f"  Extracting intelligence via {model_label} ({provider})...")
+        out.print(f"  Extracting intelligence via {model_label} ({provider})...")
         intelligence = await self._extract_intelligence(name, good_pages)
 
         overview = intelligence.company_overview
-        console.print(f"    Type: {overview.company_type or 'Unknown'}")
-        console.print(f"    AUM: {overview.aum or 'Not found'}")
+        out.print(f"    Type: {overview.company_type or 'Unknown'}")
+        out.print(f"    AUM: {overview.aum or 'Not found'}")
 
         # Step 4: Algorithmic fit scoring
         fit_score = compute_fit_score(intelligence)
-        console.print(
+        out.print(
             f"    Fit score: {fit_score.total}/100 ({fit_score.rating})"
         )
 
         # Step 5: Company summary
         _report(55, f"Generating summary for {name}...")
-        provider = get_active_provider()
-        summary_model = (
-            self.config.analysis_model if provider == "anthropic"
-            else self.config.openai_analysis_model
+        provider, summary_model = self._active_model(
+            self.config.analysis_model, self.config.openai_analysis_model,
         )
-        console.print(f"  Generating summary via {summary_model} ({provider})...")
-        summary = await self._generate_summary(name, intelligence)
+        out.print(f"  Generating summary via {summary_model} ({provider})...")
 
-        # Step 6: Find team directory page (shared across all people)
+        # Step 6: Find team directory page (shared across all people) —
+        # independent of the summary, so both run at once
         company_domain = self._extract_domain(overview.website_url, company.search_name)
-        team_content = await self._find_team_pages(company_domain)
+        summary, team_content = await asyncio.gather(
+            self._generate_summary(name, intelligence),
+            self._find_team_pages(company_domain),
+        )
         if team_content:
-            console.print(f"  Found team directory ({len(team_content):,} chars)")
+            out.print(f"  Found team directory ({len(team_content):,} chars)")
+
+        # Step 8 is independent of the people — start the Salesforce account
+        # lookup so it runs during person research
+        sf_task = (
+            asyncio.ensure_future(asyncio.to_thread(self._fetch_account_data, name))
+            if self._sf_connected else None
+        )
 
         # Step 7: Person research
         _report(70, f"Researching {len(company.people)} people at {name}...")
-        console.print(f"  Researching {len(company.people)} people...")
+        out.print(f"  Researching {len(company.people)} people...")
         person_profiles = await self._research_people(
             company.people, name, company.search_name,
             company_domain=company_domain,
             team_content=team_content,
             contacts=company.contacts,
         )
-        profiles_with_data = sum(
-            1 for p in person_profiles
-            if p.current_title or p.prior_experience or p.education
-        )
-        sf_with_history = sum(1 for p in person_profiles if p.interactions)
-        console.print(
+        profiles_with_data = sf_with_history = 0
+        for p in person_profiles:
+            if p.current_title or p.prior_experience or p.education:
+                profiles_with_data += 1
+            if p.interactions:
+                sf_with_history += 1
+        out.print(
             f"    Person profiles: {profiles_with_data}/{len(person_profiles)} with data"
         )
         if sf_with_history:
-            console.print(
+            out.print(
                 f"    CRM history: {sf_with_history}/{len(person_profiles)} with interactions"
             )
 
         # Step 8: Salesforce Account data (opportunities, notes)
         _report(85, f"Fetching Salesforce data for {name}...")
-        sf_account = None
-        if self._sf_connected:
-            sf_account = self._fetch_account_data(name)
+        sf_account = await sf_task if sf_task else None
 
         # Capture source URLs for citation links
-        source_urls = [p.url for p in good_pages if p.content]
+        source_urls = [p.url for p in good_pages]
 
-        console.print(f"  [green]COMPLETED: {name}[/green]")
+        out.print(f"  [green]COMPLETED: {name}[/green]")
 
         # Report progress via callback (web mode)
         if hasattr(self, '_progress_callback') and self._progress_callback:
@@ -853,12 +1190,20 @@ class ResearchPipeline:
 
         Returns the standard normalised dict with organic_results and scraped_content.
         Permanently switches to DuckDuckGo if Firecrawl returns 402/payment errors.
+        Concurrent calls for the same query share one request.
         """
+        return await self._coalesced(
+            self._inflight_search, (query, num_results),
+            lambda: self._search_once(query, num_results),
+        )
+
+    async def _search_once(self, query: str, num_results: int) -> dict:
         if self._firecrawl_available:
             response = await search_firecrawl(
                 query,
                 self.config.firecrawl_key,
                 num_results=num_results,
+                client=self._api_http,
             )
             error = response.get("error", "")
             if error and ("402" in str(error) or "payment" in str(error).lower()):
@@ -888,14 +1233,17 @@ class ResearchPipeline:
         all_results: list[SearchResult] = []
         firecrawl_content: dict[str, str] = {}
 
+        # One cache read for every query (skip on force-refresh)
+        cached_searches = await self._cached_searches([q["query"] for q in queries])
+        fresh_searches: dict[str, list[SearchResult]] = {}
+
         async def run_query(q: dict) -> list[SearchResult]:
             query_str = q["query"]
 
-            # Check cache (skip on force-refresh, skip empty cached results)
-            if not self.force_refresh:
-                cached = self.cache.get_search(query_str)
-                if cached is not None and len(cached) > 0:
-                    return [SearchResult(**r) for r in cached]
+            # Skip empty cached results
+            cached = cached_searches.get(query_str)
+            if cached:
+                return cached
 
             async with self.search_sem:
                 response = await self._do_search(
@@ -903,10 +1251,9 @@ class ResearchPipeline:
                     num_results=self.config.max_search_results,
                 )
 
-                # Collect scraped markdown content from Firecrawl
+                # Collect scraped markdown content from Firecrawl (first wins)
                 for url, md in response.get("scraped_content", {}).items():
-                    if url not in firecrawl_content:
-                        firecrawl_content[url] = md
+                    firecrawl_content.setdefault(url, md)
 
                 organic = response.get("organic_results", [])
                 results = []
@@ -925,10 +1272,7 @@ class ResearchPipeline:
 
                 # Only cache non-empty results
                 if results:
-                    self.cache.set_search(
-                        query_str,
-                        [r.model_dump() for r in results],
-                    )
+                    fresh_searches[query_str] = results
                 return results
 
         # Run all queries concurrently
@@ -936,6 +1280,7 @@ class ResearchPipeline:
             *[run_query(q) for q in queries],
             return_exceptions=True,
         )
+        await self._store_searches(fresh_searches)
 
         for qr in query_results:
             if isinstance(qr, list):
@@ -973,11 +1318,13 @@ class ResearchPipeline:
                     content_length=len(content),
                     quality_score=50.0,  # Firecrawl content is generally good
                 )
-                self.cache.set_scrape(url.url, page.content, page.quality_score)
+                await self._cache_call(
+                    self.cache.set_scrape, url.url, page.content, page.quality_score,
+                )
                 return page
 
             # 2. Check scrape cache
-            cached = self.cache.get_scrape(url.url)
+            cached = await self._cache_call(self.cache.get_scrape, url.url)
             if cached is not None:
                 content, quality = cached
                 return ScrapedPage(
@@ -988,7 +1335,17 @@ class ResearchPipeline:
                     quality_score=quality,
                 )
 
-            # 3. Fall back to trafilatura
+            # 3. Fall back to trafilatura — one fetch per URL in flight; like
+            # a scrape-cache hit, a shared page keeps the first caller's score
+            page = await self._coalesced(
+                self._inflight_scrape, url.url,
+                lambda: fetch(url, company_name),
+            )
+            if page.title != url.title:
+                page = page.model_copy(update={"title": url.title})
+            return page
+
+        async def fetch(url: RankedURL, company_name: str) -> ScrapedPage:
             async with self.scrape_sem:
                 page = await extract_page(
                     url.url,
@@ -996,20 +1353,21 @@ class ResearchPipeline:
                     company_name=company_name,
                     timeout=self.config.scrape_timeout,
                     max_chars=self.config.content_max_chars,
+                    client=self._scrape_http,
                 )
 
                 if page.content:
-                    self.cache.set_scrape(
-                        url.url, page.content, page.quality_score
+                    await self._cache_call(
+                        self.cache.set_scrape, url.url, page.content, page.quality_score,
                     )
 
-                status = "OK" if page.content else f"FAIL: {page.error}"
-                logger.info(
-                    "  [%s] %s (%s)",
-                    status,
-                    url.url[:60],
-                    f"{page.content_length:,} chars" if page.content else "",
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "  [%s] %s (%s)",
+                        "OK" if page.content else f"FAIL: {page.error}",
+                        url.url[:60],
+                        f"{page.content_length:,} chars" if page.content else "",
+                    )
                 return page
 
         results = await asyncio.gather(
@@ -1051,19 +1409,7 @@ class ResearchPipeline:
         self, website_url: str | None, search_name: str,
     ) -> str:
         """Get domain from extracted website URL or guess from company name."""
-        if website_url:
-            from urllib.parse import urlparse
-            try:
-                parsed = urlparse(website_url)
-                domain = parsed.netloc or parsed.path
-                domain = domain.removeprefix("www.")
-                if domain:
-                    return domain
-            except Exception:
-                pass
-        # Fall back to guessing (use the shared domain guesser)
-        from company_research.search.strategy import _guess_domain
-        return _guess_domain(search_name)
+        return _company_domain(website_url or None, search_name)
 
     async def _find_team_pages(self, company_domain: str) -> str:
         """Search for and scrape the company's team/professionals page.
@@ -1074,7 +1420,7 @@ class ResearchPipeline:
         query_str = query_info["query"]
 
         # Check cache
-        cached = self.cache.get_search(query_str)
+        cached = await self._cache_call(self.cache.get_search, query_str)
         if cached is not None:
             # Cached results exist but we need the scraped content
             # Fall through to use cached URLs
@@ -1105,17 +1451,11 @@ class ResearchPipeline:
                                 query_purpose="team_directory",
                                 position=r.get("position", 99),
                             ))
-                    self.cache.set_search(query_str, [r.model_dump() for r in results])
-
-                    # Combine team page content (limit to ~20k chars)
-                    combined = []
-                    total_len = 0
-                    for url, md in scraped.items():
-                        if total_len > 20000:
-                            break
-                        combined.append(f"--- Team page: {url} ---\n{md}")
-                        total_len += len(md)
-                    return "\n\n".join(combined)
+                    await self._cache_call(
+                        self.cache.set_search, query_str, [r.model_dump() for r in results],
+                    )
+
+                    return _combine_team_pages(scraped)
 
                 team_urls = [
                     r.get("link", "") for r in response.get("organic_results", [])
@@ -1137,26 +1477,37 @@ class ResearchPipeline:
         if not people:
             return []
 
-        # Build email and LinkedIn lookups from contacts
-        email_by_name: dict[str, str] = {}
-        linkedin_by_name: dict[str, str] = {}
-        if contacts:
-            for c in contacts:
-                if c.email:
-                    email_by_name[c.name] = c.email
-                if c.linkedin_url:
-                    linkedin_by_name[c.name] = c.linkedin_url
+        # Build (email, LinkedIn) lookup from contacts
+        contact_by_name = _contact_lookup(contacts)
 
-        tasks = [
-            self._research_person(
+        # One bulk Salesforce lookup for every contact email at this company
+        sf_histories: dict[str, SFContactHistory | None] | None = None
+        if self._sf_connected:
+            try:
+                sf_histories = await asyncio.to_thread(
+                    self.sf_client.get_contact_histories,
+                    [email for email, _ in contact_by_name.values()],
+                )
+            except Exception as e:
+                logger.warning("Salesforce bulk lookup failed for %s: %s", company_name, e)
+
+        # Search query templates are shared by everyone at the company
+        query_templates = person_query_templates(
+            search_name, company_domain=company_domain or None,
+        )
+
+        tasks = []
+        for person in people:
+            email, linkedin = contact_by_name.get(person, ("", ""))
+            tasks.append(self._research_person(
                 person, company_name, search_name,
                 company_domain=company_domain,
                 team_content=team_content,
-                email=email_by_name.get(person, ""),
-                csv_linkedin_url=linkedin_by_name.get(person, ""),
-            )
-            for person in people
-        ]
+                email=email,
+                csv_linkedin_url=linkedin,
+                sf_histories=sf_histories,
+                query_templates=query_templates,
+            ))
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         profiles = []
@@ -1178,16 +1529,19 @@ class ResearchPipeline:
         team_content: str = "",
         email: str = "",
         csv_linkedin_url: str = "",
+        sf_histories: dict[str, SFContactHistory | None] | None = None,
+        query_templates: list[tuple[str, str]] | None = None,
     ) -> PersonProfile:
         """Full person research pipeline: search, scrape, extract.
 
         Uses team_content as bonus context and company_domain for
-        site-specific searches. Enriches with Salesforce CRM data.
+        site-specific searches. Enriches with Salesforce CRM data, taken
+        from sf_histories when the email was bulk-fetched up front.
         """
         # Check person cache first
         if not self.force_refresh:
-            cached = self.cache.get_person(
-                person_name, company_name,
+            cached = await self._cache_call(
+                self.cache.get_person, person_name, company_name,
                 max_age_days=self.config.repository_ttl_days,
             )
             if cached:
@@ -1199,7 +1553,9 @@ class ResearchPipeline:
                         if p_email:
                             profile.email = p_email
                             try:
-                                sf_history = self.sf_client.get_contact_history(p_email)
+                                sf_history = await self._contact_history(
+                                    p_email, sf_histories,
+                                )
                                 if sf_history:
                                     profile.sf_status = sf_history.status
                                     profile.last_contacted = sf_history.last_activity_date
@@ -1222,21 +1578,39 @@ class ResearchPipeline:
                     pass
 
         # Search for the person (now includes site-specific query)
-        queries = generate_person_queries(
-            person_name, search_name,
-            company_domain=company_domain or None,
-        )
+        if query_templates is None:
+            query_templates = person_query_templates(
+                search_name, company_domain=company_domain or None,
+            )
+        queries = render_person_queries(query_templates, person_name)
         all_results: list[SearchResult] = []
         person_fc_content: dict[str, str] = {}
 
+        # Sort results as they arrive: first LinkedIn profile URL, and the
+        # non-LinkedIn results that can be scraped
+        linkedin_url = ""
+        scrapable_results: list[SearchResult] = []
+
+        def collect(results: Iterable[SearchResult]) -> None:
+            nonlocal linkedin_url
+            for r in results:
+                all_results.append(r)
+                if "linkedin.com" not in r.url:
+                    scrapable_results.append(r)
+                elif not linkedin_url and "linkedin.com/in/" in r.url:
+                    linkedin_url = r.url
+
+        # One cache read for every query (skip on force-refresh)
+        cached_searches = await self._cached_searches([q["query"] for q in queries])
+        fresh_searches: dict[str, list[SearchResult]] = {}
+
         for q in queries:
             query_str = q["query"]
-            # Check cache (skip on force-refresh, skip empty cached results)
-            if not self.force_refresh:
-                cached_search = self.cache.get_search(query_str)
-                if cached_search is not None and len(cached_search) > 0:
-                    all_results.extend(SearchResult(**r) for r in cached_search)
-                    continue
+            # Skip empty cached results
+            cached_search = cached_searches.get(query_str)
+            if cached_search:
+                collect(cached_search)
+                continue
 
             async with self.search_sem:
                 try:
@@ -1245,10 +1619,9 @@ class ResearchPipeline:
                         num_results=5,
                     )
 
-                    # Collect inline scraped content
+                    # Collect inline scraped content (first wins)
                     for url, md in response.get("scraped_content", {}).items():
-                        if url not in person_fc_content:
-                            person_fc_content[url] = md
+                        person_fc_content.setdefault(url, md)
 
                     organic = response.get("organic_results", [])
                     results = []
@@ -1266,24 +1639,14 @@ class ResearchPipeline:
                             )
                     # Only cache non-empty results
                     if results:
-                        self.cache.set_search(query_str, [r.model_dump() for r in results])
-                    all_results.extend(results)
+                        fresh_searches[query_str] = results
+                    collect(results)
                 except Exception as e:
                     logger.warning("Person search failed for %s: %s", person_name, e)
+        await self._store_searches(fresh_searches)
 
-        # Extract LinkedIn URL from search results
-        linkedin_url = ""
-        for r in all_results:
-            if "linkedin.com/in/" in r.url:
-                linkedin_url = r.url
-                break
-
-        # Build pages from search results (filter out LinkedIn — can't be scraped)
+        # Build pages from search results
         good_pages: list[ScrapedPage] = []
-        scrapable_results = [
-            r for r in all_results if "linkedin.com" not in r.url
-        ]
-
         if scrapable_results:
             ranked = rank_and_deduplicate(scrapable_results, search_name, max_urls=5)
             pages = await self._scrape_urls(ranked, search_name, person_fc_content)
@@ -1301,15 +1664,11 @@ class ResearchPipeline:
 
         # Collect search result snippets as supplementary context
         # (especially valuable for LinkedIn results that can't be scraped)
-        snippet_lines = []
-        for r in all_results:
-            if r.snippet and r.snippet.strip():
-                source_label = "LinkedIn" if "linkedin.com" in r.url else r.title[:50]
-                snippet_lines.append(f"- [{source_label}] {r.snippet.strip()}")
+        snippet_lines = list(islice(_snippet_lines(all_results), 15))
         if snippet_lines:
             snippet_content = (
                 f"Search result snippets about {person_name}:\n"
-                + "\n".join(snippet_lines[:15])
+                + "\n".join(snippet_lines)
             )
             good_pages.append(ScrapedPage(
                 url="search-snippets://aggregated",
@@ -1335,12 +1694,12 @@ class ResearchPipeline:
             profile.linkedin_url = best_linkedin
 
         # Capture source URLs for person citations
-        profile.source_urls = [p.url for p in good_pages if p.content]
+        profile.source_urls = [p.url for p in good_pages]
 
         # Enrich with Salesforce CRM history
         if self._sf_connected and email:
             try:
-                sf_history = self.sf_client.get_contact_history(email)
+                sf_history = await self._contact_history(email, sf_histories)
                 if sf_history:
                     profile.sf_status = sf_history.status
                     profile.last_contacted = sf_history.last_activity_date
@@ -1361,17 +1720,21 @@ class ResearchPipeline:
                 logger.warning("Salesforce lookup failed for %s: %s", person_name, e)
 
         # Cache the result (strip volatile CRM data)
-        cacheable_profile = json.loads(profile.model_dump_json())
-        cacheable_profile.pop("interactions", None)
-        cacheable_profile.pop("sf_status", None)
-        cacheable_profile.pop("last_contacted", None)
-        self.cache.set_person(
-            person_name, company_name,
-            cacheable_profile,
+        cacheable_profile = profile.model_dump(mode="json", exclude=_PROFILE_CACHE_EXCLUDE)
+        await self._cache_call(
+            self.cache.set_person, person_name, company_name, cacheable_profile,
         )
 
         return profile
 
+    async def _contact_history(
+        self, email: str, prefetched: dict[str, SFContactHistory | None] | None,
+    ) -> SFContactHistory | None:
+        """CRM history for email: the bulk-fetched entry, else a single lookup."""
+        if prefetched is not None and email in prefetched:
+            return prefetched[email]
+        return await asyncio.to_thread(self.sf_client.get_contact_history, email)
+
     def _fetch_account_data(self, company_name: str) -> SFAccountInfo | None:
         """Fetch Salesforce Account data and map to Pydantic model."""
         try:
@@ -1407,6 +1770,67 @@ class ResearchPipeline:
             logger.warning("SF account fetch failed for %s: %s", company_name, e)
             return None
 
+    def _summary_is_stale(self, cached: dict, result: CompanyResult) -> bool:
+        """True when a cached summary is older than summary_ttl_days.
+
+        Summaries refreshed on their own carry ``_summary_at``; otherwise the
+        summary dates from when the company was processed.
+        """
+        summary_at = cached.get("_summary_at") or result.processed_at
+        return _is_expired(summary_at, self.config.summary_ttl_days)
+
+    async def _refresh_stale_summaries(self, stale: list[CompanyResult]) -> None:
+        """Regenerate stale summaries on cache hits, keeping the cached intelligence.
+
+        The cache entry is rewritten in place, so the intelligence keeps its
+        original age against repository_ttl_days.
+        """
+        if not stale:
+            return
+        console.print(
+            f"  [dim]Refreshing {len(stale)} cached summaries older than "
+            f"{self.config.summary_ttl_days} days...[/dim]"
+        )
+
+        async def refresh(result: CompanyResult) -> None:
+            name = result.company.company_name
+            summary = await self._generate_summary(name, result.intelligence)
+            if not (summary.overview or summary.credit_focus or summary.notable_details):
+                return  # generation failed — keep the old summary
+            result.summary = summary
+            cacheable = result.model_dump(mode="json", exclude=_COMPANY_CACHE_EXCLUDE)
+            cacheable["from_cache"] = False
+            cacheable["_summary_at"] = datetime.now().isoformat()
+            await self._cache_call(self.cache.update_company, name, cacheable)
+
+        outcomes = await asyncio.gather(
+            *[refresh(r) for r in stale], return_exceptions=True,
+        )
+        for result, outcome in zip(stale, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    "Summary refresh failed for %s: %s", result.company.company_name, outcome,
+                )
+
+    async def _refresh_cached_sf(
+        self, cache_hits: list[tuple[CompanyResult, CompanyInput]],
+    ) -> None:
+        """Refresh CRM data on cache hits, one worker thread per company."""
+        if not self._sf_connected or not cache_hits:
+            return
+
+        def refresh(result: CompanyResult, company: CompanyInput) -> None:
+            self._enrich_profiles_with_sf(result, company)
+            result.sf_account = self._fetch_account_data(company.company_name)
+
+        outcomes = await asyncio.gather(
+            *[asyncio.to_thread(refresh, r, c) for r, c in cache_hits],
+            return_exceptions=True,
+        )
+        for (_, company), outcome in zip(cache_hits, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning("SF refresh failed for %s: %s", company.company_name, outcome)
+
     def _enrich_profiles_with_sf(
         self,
         result: CompanyResult,
@@ -1414,15 +1838,20 @@ class ResearchPipeline:
     ) -> None:
         """Enrich person profiles in a (cached) CompanyResult with Salesforce data."""
         # Build email lookup from contacts
-        email_by_name: dict[str, str] = {}
-        for c in company.contacts:
-            if c.email:
-                email_by_name[c.name] = c.email
+        email_by_name = {
+            name: email
+            for name, (email, _) in _contact_lookup(company.contacts).items()
+            if email
+        }
         # Also check if profile already has email
         for p in result.person_profiles:
             if p.email and p.name not in email_by_name:
                 email_by_name[p.name] = p.email
 
+        sf_histories = self.sf_client.get_contact_histories([
+            email_by_name.get(p.name, "") for p in result.person_profiles
+        ])
+
         enriched = 0
         for profile in result.person_profiles:
             email = email_by_name.get(profile.name, "")
@@ -1430,7 +1859,10 @@ class ResearchPipeline:
                 continue
             profile.email = email
             try:
-                sf_history = self.sf_client.get_contact_history(email)
+                if email in sf_histories:
+                    sf_history = sf_histories[email]
+                else:
+                    sf_history = self.sf_client.get_contact_history(email)
                 if sf_history:
                     profile.sf_status = sf_history.status
                     profile.last_contacted = sf_history.last_activity_date
@@ -1456,4 +1888,6 @@ class ResearchPipeline:
             )
 
     def close(self) -> None:
+        self._cache_io.shutdown(wait=True)
+        self.sf_client.close()
         self.cache.close()
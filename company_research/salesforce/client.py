@@ -5,13 +5,39 @@ from __future__ import annotations
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from urllib.parse import urlencode
 
 import httpx
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# Emails per "Email IN (...)" lookup — keeps the SOQL GET URL well short of
+# the request-line limit
+_EMAIL_CHUNK = 100
+
+# Subrequest cap for a single composite/batch call (Salesforce limit)
+_COMPOSITE_BATCH_SIZE = 25
+
+# Parallel note/link requests per account fetch
+_NOTE_WORKERS = 8
+
+# In-process memo of contact/account lookups (entries, seconds)
+_LOOKUP_CACHE_SIZE = 4096
+_LOOKUP_CACHE_TTL = 3600
+
+_MISS = object()
+
+# Activity fields, shared by the per-person queries and the bulk subqueries
+_TASK_FIELDS = "Subject, Description, ActivityDate, Type, CreatedDate, Owner.Name"
+_EVENT_FIELDS = "Subject, Description, ActivityDate, Owner.Name"
+
 
 @dataclass
 class ActivityRecord:
@@ -50,6 +76,35 @@ class SFAccountData:
     notes: list[str] = field(default_factory=list)
 
 
+class _TTLCache:
+    """Thread-safe LRU map whose entries expire after ttl seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Return the cached value, or _MISS if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISS
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._data[key]
+                return _MISS
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, value) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
 class SalesforceClient:
     """Handles Salesforce OAuth and SOQL queries."""
 
@@ -63,6 +118,22 @@ class SalesforceClient:
         self.instance_url = os.getenv("SF_INSTANCE_URL", "")
         self._access_token: str = ""
         self._base_url: str = ""
+        # One keep-alive pool for every API call (shared by the worker threads)
+        self._http = httpx.Client(
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+        # Independent note requests fan out here; tasks never submit more work
+        self._io = ThreadPoolExecutor(
+            max_workers=_NOTE_WORKERS, thread_name_prefix="sf-io",
+        )
+        # Lookups repeat within a run (bulk prefetch, per-person fallback,
+        # cached-result refresh); "not found" results are memoized too, but
+        # only from lookups whose requests all succeeded
+        self._contact_cache = _TTLCache(_LOOKUP_CACHE_SIZE, _LOOKUP_CACHE_TTL)
+        self._account_cache = _TTLCache(_LOOKUP_CACHE_SIZE, _LOOKUP_CACHE_TTL)
+        self._failures = 0  # failed API requests so far (see _memoized)
+        self._failures_lock = threading.Lock()
 
     @property
     def is_configured(self) -> bool:
@@ -79,18 +150,19 @@ class SalesforceClient:
             login_url = "https://login.salesforce.com/services/oauth2/token"
 
         try:
-            r = httpx.post(login_url, data={
+            r = self._http.post(login_url, data={
                 "grant_type": "password",
                 "client_id": self.client_id,
                 "client_secret": self.client_secret,
                 "username": self.username,
                 "password": self.password + self.security_token,
-            }, timeout=15)
+            })
             data = r.json()
 
             if "access_token" in data:
                 self._access_token = data["access_token"]
                 self._base_url = data["instance_url"]
+                self._http.headers["Authorization"] = f"Bearer {self._access_token}"
                 logger.info("Salesforce authenticated: %s", self._base_url)
                 return True
             else:
@@ -105,17 +177,40 @@ class SalesforceClient:
         if not self._access_token:
             return []
         try:
-            r = httpx.get(
+            r = self._http.get(
                 f"{self._base_url}/services/data/v59.0/query/",
                 params={"q": soql},
-                headers={"Authorization": f"Bearer {self._access_token}"},
-                timeout=15,
             )
+            if r.status_code == 400:
+                # The query itself is invalid (e.g. a missing custom field):
+                # it fails the same way every time, so it's an answer
+                logger.warning("Salesforce query error: %s", r.text[:200])
+                return []
+            r.raise_for_status()
             return r.json().get("records", [])
         except Exception as e:
+            self._note_failure()
             logger.warning("Salesforce query error: %s", e)
             return []
 
+    def _note_failure(self) -> None:
+        with self._failures_lock:
+            self._failures += 1
+
+    def _memoized(self, cache: _TTLCache, key: str, lookup: Callable[[], object]):
+        """cache[key], else lookup() — stored only if no request failed meanwhile.
+
+        Failures anywhere in the client count, so a concurrent failure just
+        costs this result its cache entry; a partial answer is never kept.
+        """
+        value = cache.get(key)
+        if value is _MISS:
+            failures = self._failures
+            value = lookup()
+            if self._failures == failures:
+                cache.put(key, value)
+        return value
+
     def get_contact_history(self, email: str) -> SFContactHistory | None:
         """Look up a person by email and pull their activity history.
 
@@ -123,6 +218,12 @@ class SalesforceClient:
         """
         if not self._access_token or not email:
             return None
+        return self._memoized(
+            self._contact_cache, email, lambda: self._lookup_contact_history(email),
+        )
+
+    def _lookup_contact_history(self, email: str) -> SFContactHistory | None:
+        """Uncached get_contact_history."""
 
         # Try Contact first
         records = self._query(
@@ -166,16 +267,144 @@ class SalesforceClient:
 
         return None
 
+    def _composite_batch(self, soqls: list[str]) -> list[list[dict] | None]:
+        """Run several SOQL queries through the composite/batch endpoint.
+
+        Up to 25 queries travel in one HTTP call. Returns one record list per
+        query, in order; a failed subrequest (or call) yields None, so callers
+        can tell it apart from a query that matched nothing.
+        """
+        results: list[list[dict] | None] = [None] * len(soqls)
+        if not self._access_token:
+            return results
+        for start in range(0, len(soqls), _COMPOSITE_BATCH_SIZE):
+            chunk = soqls[start:start + _COMPOSITE_BATCH_SIZE]
+            try:
+                r = self._http.post(
+                    f"{self._base_url}/services/data/v59.0/composite/batch",
+                    json={"batchRequests": [
+                        {"method": "GET", "url": f"v59.0/query?{urlencode({'q': q})}"}
+                        for q in chunk
+                    ]},
+                )
+                sub_results = r.json().get("results", [])
+            except Exception as e:
+                self._note_failure()
+                logger.warning("Salesforce composite batch error: %s", e)
+                continue
+            for offset, sub in enumerate(sub_results[:len(chunk)]):
+                if sub.get("statusCode") == 200:
+                    results[start + offset] = (sub.get("result") or {}).get("records", [])
+                else:
+                    self._note_failure()
+                    logger.warning("Salesforce query error: %s", sub.get("result"))
+        return results
+
+    def get_contact_histories(
+        self, emails: list[str],
+    ) -> dict[str, SFContactHistory | None]:
+        """Bulk form of get_contact_history.
+
+        Contacts and Leads are fetched with ``Email IN (...)`` queries per
+        chunk of emails, all sent through composite batches; each record's
+        tasks and events come back as relationship subqueries, so no
+        per-person round-trips. A Contact match wins over a Lead, as in
+        get_contact_history. Returns {email: history or None}; emails whose
+        queries failed are left out, so callers fall back to a single lookup.
+        """
+        found: dict[str, SFContactHistory | None] = {}
+        wanted: list[str] = []
+        for e in dict.fromkeys(e for e in emails if e):
+            cached = self._contact_cache.get(e)
+            found[e] = None if cached is _MISS else cached
+            if cached is _MISS:
+                wanted.append(e)
+        if not self._access_token or not wanted:
+            return found
+        # SOQL compares Email case-insensitively; map records back by lowercase
+        by_lower = {e.lower(): e for e in wanted}
+
+        activities = (
+            f"(SELECT {_TASK_FIELDS} FROM Tasks ORDER BY CreatedDate DESC LIMIT 15), "
+            f"(SELECT {_EVENT_FIELDS} FROM Events ORDER BY ActivityDate DESC LIMIT 10)"
+        )
+        objects = (
+            ("Contact", "Id, Name, Email, Account.Name, Title, LastActivityDate"),
+            ("Lead", "Id, Name, Email, Company, Title, Status, LastActivityDate"),
+        )
+        in_lists = [
+            ", ".join(f"'{_escape(e)}'" for e in wanted[i:i + _EMAIL_CHUNK])
+            for i in range(0, len(wanted), _EMAIL_CHUNK)
+        ]
+        # Contact queries come first so their matches are taken before Leads
+        queries = [
+            (sf_object, chunk, f"SELECT {fields}, {activities} "
+                               f"FROM {sf_object} WHERE Email IN ({in_list})")
+            for sf_object, fields in objects
+            for chunk, in_list in enumerate(in_lists)
+        ]
+        batches = self._composite_batch([soql for _, _, soql in queries])
+        failed = {(sf_object, chunk) for (sf_object, chunk, _), records
+                  in zip(queries, batches) if records is None}
+        for (sf_object, _, _), records in zip(queries, batches):
+            for rec in records or ():
+                email = by_lower.get((rec.get("Email") or "").lower())
+                if email is None or found[email] is not None:
+                    continue  # first match wins, as with LIMIT 1
+                if sf_object == "Contact":
+                    company = (rec.get("Account") or {}).get("Name", "")
+                else:
+                    company = rec.get("Company", "")
+                history = SFContactHistory(
+                    sf_id=rec["Id"],
+                    sf_object=sf_object,
+                    name=rec.get("Name", ""),
+                    email=email,
+                    title=rec.get("Title", ""),
+                    company=company,
+                    status=rec.get("Status", ""),
+                    last_activity_date=rec.get("LastActivityDate", "") or "",
+                )
+                self._add_activities(
+                    history,
+                    (rec.get("Tasks") or {}).get("records", []),
+                    (rec.get("Events") or {}).get("records", []),
+                )
+                found[email] = history
+        for i, email in enumerate(wanted):
+            chunk = i // _EMAIL_CHUNK
+            # A failed Contact query could hide a match that beats any Lead;
+            # a failed Lead query only matters when nothing matched
+            if ("Contact", chunk) in failed or (
+                found[email] is None and ("Lead", chunk) in failed
+            ):
+                del found[email]
+            else:
+                self._contact_cache.put(email, found[email])
+        return found
+
     def _load_activities(self, history: SFContactHistory) -> None:
         """Load tasks and events for a contact/lead."""
         sf_id = history.sf_id
 
         # Tasks (calls, emails, to-dos)
         tasks = self._query(
-            f"SELECT Subject, Description, ActivityDate, Type, CreatedDate, Owner.Name "
+            f"SELECT {_TASK_FIELDS} "
             f"FROM Task WHERE WhoId = '{sf_id}' "
             f"ORDER BY CreatedDate DESC LIMIT 15"
         )
+        # Events (meetings)
+        events = self._query(
+            f"SELECT {_EVENT_FIELDS} "
+            f"FROM Event WHERE WhoId = '{sf_id}' "
+            f"ORDER BY ActivityDate DESC LIMIT 10"
+        )
+        self._add_activities(history, tasks, events)
+
+    def _add_activities(
+        self, history: SFContactHistory, tasks: list[dict], events: list[dict],
+    ) -> None:
+        """Convert Task/Event records into the history's sorted activity list."""
         for t in tasks:
             owner = t.get("Owner") or {}
             notes = (t.get("Description") or "").strip()
@@ -191,12 +420,6 @@ class SalesforceClient:
                 owner=owner.get("Name", ""),
             ))
 
-        # Events (meetings)
-        events = self._query(
-            f"SELECT Subject, Description, ActivityDate, Owner.Name "
-            f"FROM Event WHERE WhoId = '{sf_id}' "
-            f"ORDER BY ActivityDate DESC LIMIT 10"
-        )
         for e in events:
             owner = e.get("Owner") or {}
             subject = e.get("Subject", "")
@@ -225,6 +448,14 @@ class SalesforceClient:
         """
         if not self._access_token or not account_name:
             return None
+        # SOQL string comparison is case-insensitive
+        key = account_name.lower()
+        return self._memoized(
+            self._account_cache, key, lambda: self._lookup_account_data(account_name),
+        )
+
+    def _lookup_account_data(self, account_name: str) -> SFAccountData | None:
+        """Uncached get_account_data."""
 
         escaped = _escape(account_name)
 
@@ -295,6 +526,14 @@ class SalesforceClient:
                 f"FROM Opportunity WHERE AccountId = '{account_id}' "
                 f"ORDER BY CloseDate DESC LIMIT 10"
             )
+
+        # Account notes (up to 10) and each opportunity's notes (up to 5)
+        # are fetched together
+        limits = {account_id: 10}
+        limits.update((opp["Id"], 5) for opp in opps if opp.get("Id"))
+        linked_notes = self._fetch_notes(limits)
+        data.notes = linked_notes[account_id]
+
         for opp in opps:
             opp_owner = opp.get("Owner") or {}
             amount = opp.get("Amount")
@@ -311,9 +550,7 @@ class SalesforceClient:
             if roadblocks_available:
                 roadblocks = (opp.get("Roadblocks__c", "") or "").strip()
 
-            # Fetch notes linked to this specific opportunity
-            opp_id = opp.get("Id", "")
-            opp_notes = self._fetch_linked_notes(opp_id) if opp_id else []
+            opp_notes = linked_notes.get(opp.get("Id", ""), [])
 
             data.opportunities.append({
                 "name": opp.get("Name", ""),
@@ -329,39 +566,6 @@ class SalesforceClient:
                 "opp_notes": opp_notes,
             })
 
-        # Query Notes via ContentDocumentLink → ContentNote
-        # First get ContentDocumentIds for SNOTE type
-        content_links = self._query(
-            f"SELECT ContentDocumentId, ContentDocument.Title "
-            f"FROM ContentDocumentLink "
-            f"WHERE LinkedEntityId = '{account_id}' "
-            f"AND ContentDocument.FileType = 'SNOTE' "
-            f"ORDER BY ContentDocument.CreatedDate DESC LIMIT 10"
-        )
-        for cl in content_links:
-            doc_id = cl.get("ContentDocumentId", "")
-            doc = cl.get("ContentDocument") or {}
-            title = doc.get("Title", "")
-            # Fetch full note body via REST API (TextPreview is capped at 255 chars)
-            body = self._fetch_note_content(doc_id)
-            note_text = f"{title}: {body}" if title and body else title or body
-            if note_text:
-                data.notes.append(note_text)
-
-        # Fallback to classic Note object if no ContentNotes found
-        if not data.notes:
-            classic_notes = self._query(
-                f"SELECT Title, Body "
-                f"FROM Note WHERE ParentId = '{account_id}' "
-                f"ORDER BY CreatedDate DESC LIMIT 10"
-            )
-            for n in classic_notes:
-                title = n.get("Title", "")
-                body = _clean_notes(n.get("Body", ""))
-                note_text = f"{title}: {body}" if title and body else title or body
-                if note_text:
-                    data.notes.append(note_text)
-
         logger.info(
             "SF Account '%s': %d opps, %d notes",
             data.account_name, len(data.opportunities), len(data.notes),
@@ -378,10 +582,8 @@ class SalesforceClient:
             return ""
         try:
             import base64
-            r = httpx.get(
+            r = self._http.get(
                 f"{self._base_url}/services/data/v59.0/sobjects/ContentNote/{content_document_id}",
-                headers={"Authorization": f"Bearer {self._access_token}"},
-                timeout=15,
             )
             data = r.json()
             content_b64 = data.get("Content", "")
@@ -400,59 +602,76 @@ class SalesforceClient:
                 plain = plain[:2000].rsplit(" ", 1)[0] + "..."
             return plain
         except Exception as e:
+            self._note_failure()
             logger.debug("Failed to fetch ContentNote %s: %s", content_document_id, e)
             return ""
 
-    def _fetch_linked_notes(self, entity_id: str) -> list[str]:
-        """Fetch notes linked to any Salesforce entity (Opportunity, Account, etc.)."""
-        if not self._access_token or not entity_id:
-            return []
-        notes = []
-        try:
-            # ContentNote links
-            content_links = self._query(
+    def _fetch_notes(self, limits: dict[str, int]) -> dict[str, list[str]]:
+        """Fetch notes for several entities at once: {entity_id: max notes}.
+
+        ContentNotes are preferred; entities with none fall back to classic
+        Note objects. Each step (links, note bodies, classic notes) runs its
+        requests concurrently, so an account costs three round-trip waves
+        rather than one per note.
+        """
+        ids = list(limits)
+        link_lists = list(self._io.map(
+            lambda entity_id: self._query(
                 f"SELECT ContentDocumentId, ContentDocument.Title "
                 f"FROM ContentDocumentLink "
                 f"WHERE LinkedEntityId = '{entity_id}' "
                 f"AND ContentDocument.FileType = 'SNOTE' "
-                f"ORDER BY ContentDocument.CreatedDate DESC LIMIT 5"
-            )
-            for cl in content_links:
-                doc_id = cl.get("ContentDocumentId", "")
-                doc = cl.get("ContentDocument") or {}
-                title = doc.get("Title", "")
-                body = self._fetch_note_content(doc_id)
+                f"ORDER BY ContentDocument.CreatedDate DESC LIMIT {limits[entity_id]}"
+            ),
+            ids,
+        ))
+        # Full note bodies via REST API (TextPreview is capped at 255 chars)
+        links = [
+            (entity_id, cl)
+            for entity_id, content_links in zip(ids, link_lists)
+            for cl in content_links
+        ]
+        bodies = self._io.map(
+            self._fetch_note_content,
+            [cl.get("ContentDocumentId", "") for _, cl in links],
+        )
+        notes: dict[str, list[str]] = {entity_id: [] for entity_id in ids}
+        for (entity_id, cl), body in zip(links, bodies):
+            title = (cl.get("ContentDocument") or {}).get("Title", "")
+            note_text = f"{title}: {body}" if title and body else title or body
+            if note_text:
+                notes[entity_id].append(note_text)
+
+        # Fallback to classic Note objects where no ContentNotes were found
+        bare = [entity_id for entity_id in ids if not notes[entity_id]]
+        classic_lists = self._io.map(
+            lambda entity_id: self._query(
+                f"SELECT Title, Body FROM Note "
+                f"WHERE ParentId = '{entity_id}' "
+                f"ORDER BY CreatedDate DESC LIMIT {limits[entity_id]}"
+            ),
+            bare,
+        )
+        for entity_id, classic in zip(bare, classic_lists):
+            for n in classic:
+                title = n.get("Title", "")
+                body = _clean_notes(n.get("Body", ""))
                 note_text = f"{title}: {body}" if title and body else title or body
                 if note_text:
-                    notes.append(note_text)
-
-            # Classic Note objects
-            if not notes:
-                classic = self._query(
-                    f"SELECT Title, Body FROM Note "
-                    f"WHERE ParentId = '{entity_id}' "
-                    f"ORDER BY CreatedDate DESC LIMIT 5"
-                )
-                for n in classic:
-                    title = n.get("Title", "")
-                    body = _clean_notes(n.get("Body", ""))
-                    note_text = f"{title}: {body}" if title and body else title or body
-                    if note_text:
-                        notes.append(note_text)
-        except Exception as e:
-            logger.debug("Failed to fetch linked notes for %s: %s", entity_id, e)
+                    notes[entity_id].append(note_text)
         return notes
 
+    def close(self) -> None:
+        self._io.shutdown(wait=True)
+        self._http.close()
+
     def bulk_lookup(self, emails: list[str]) -> dict[str, SFContactHistory]:
         """Look up multiple people by email. Returns {email: history}."""
-        results = {}
-        for email in emails:
-            if not email:
-                continue
-            history = self.get_contact_history(email)
-            if history:
-                results[email] = history
-        return results
+        return {
+            email: history
+            for email, history in self.get_contact_histories(emails).items()
+            if history
+        }
 
 
 def _normalize_firm_name(name: str) -> str:
@@ -14,7 +14,7 @@ import httpx
 import trafilatura
 
 from company_research.models import ScrapedPage
-from company_research.scrape.http_scraper import fetch_url
+from company_research.scrape.http_scraper import fetch_url, new_scrape_client
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +34,7 @@ async def extract_page(
     company_name: str = "",
     timeout: int = 30,
     max_chars: int = 15000,
+    client: httpx.AsyncClient | None = None,
 ) -> ScrapedPage:
     """Fetch and extract content from a URL.
 
@@ -41,11 +42,13 @@ async def extract_page(
     1. trafilatura (fast, local HTML extraction)
     2. Jina.ai Reader (free API for JS-heavy / paywall sites)
     3. Basic HTML stripping (last resort)
+
+    Pass a shared client (see new_scrape_client) to pool connections.
     """
     content = None
 
     # Tier 1: Direct fetch + trafilatura
-    html, error = await fetch_url(url, timeout=timeout)
+    html, error = await fetch_url(url, timeout=timeout, client=client)
     if html:
         content = trafilatura.extract(
             html,
@@ -61,7 +64,7 @@ async def extract_page(
 
     # Tier 2: Jina.ai Reader (free, handles JS-rendered pages)
     if not content or len(content) < 100:
-        jina_content = await _fetch_via_jina(url, timeout=timeout)
+        jina_content = await _fetch_via_jina(url, timeout=timeout, client=client)
         if jina_content and len(jina_content) > len(content or ""):
             content = jina_content
 
@@ -85,24 +88,27 @@ async def extract_page(
     )
 
 
-async def _fetch_via_jina(url: str, timeout: int = 30) -> str | None:
+async def _fetch_via_jina(
+    url: str, timeout: int = 30, client: httpx.AsyncClient | None = None,
+) -> str | None:
     """Fetch clean markdown via Jina.ai Reader API (free, no API key).
 
     Jina renders JavaScript and returns clean markdown — perfect for
     JS-heavy sites, SPAs, and pages behind cookie walls.
     """
     jina_url = f"https://r.jina.ai/{url}"
+    headers = {
+        "Accept": "text/plain",
+        "X-Return-Format": "text",
+    }
     try:
-        async with httpx.AsyncClient(timeout=timeout, verify=False) as client:
-            response = await client.get(
-                jina_url,
-                headers={
-                    "Accept": "text/plain",
-                    "X-Return-Format": "text",
-                },
-            )
-            if response.status_code == 200 and len(response.text) > 100:
-                return response.text
+        if client is not None:
+            response = await client.get(jina_url, headers=headers, timeout=timeout)
+        else:
+            async with new_scrape_client(timeout) as own_client:
+                response = await own_client.get(jina_url, headers=headers)
+        if response.status_code == 200 and len(response.text) > 100:
+            return response.text
     except Exception as e:
         logger.debug("Jina.ai fallback failed for %s: %s", url[:60], e)
     return None
@@ -36,41 +36,57 @@ def _get_headers() -> dict[str, str]:
     }
 
 
+def new_scrape_client(timeout: int = 30, **kwargs) -> httpx.AsyncClient:
+    """Client configured for page scraping (redirects followed, TLS lenient).
+
+    Pass one to fetch_url() to reuse its connection pool across requests.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        max_redirects=5,
+        verify=False,
+        **kwargs,
+    )
+
+
 async def fetch_url(
-    url: str, timeout: int = 30, max_retries: int = 2,
+    url: str,
+    timeout: int = 30,
+    max_retries: int = 2,
+    client: httpx.AsyncClient | None = None,
 ) -> tuple[str | None, str | None]:
     """Fetch a URL and return (html_content, error_message).
 
     Returns (content, None) on success or (None, error_string) on failure.
-    Retries on transient errors (429, 503, timeouts).
+    Retries on transient errors (429, 503, timeouts). Uses the given
+    client's connection pool, or a one-off client when none is passed.
     """
     last_error = None
 
     for attempt in range(max_retries + 1):
         try:
-            async with httpx.AsyncClient(
-                timeout=timeout,
-                follow_redirects=True,
-                max_redirects=5,
-                verify=False,
-            ) as client:
-                response = await client.get(url, headers=_get_headers())
-
-                if response.status_code in (429, 503) and attempt < max_retries:
-                    last_error = f"HTTP {response.status_code} (retrying)"
-                    await asyncio.sleep(2 * (attempt + 1))
-                    continue
-
-                if response.status_code >= 400:
-                    return None, f"HTTP {response.status_code}"
-
-                content_type = response.headers.get("content-type", "")
-                if "text/html" not in content_type and "text/plain" not in content_type:
-                    if "application/json" in content_type:
-                        return response.text, None
-                    return None, f"Non-HTML content: {content_type[:50]}"
-
-                return response.text, None
+            if client is not None:
+                response = await client.get(url, headers=_get_headers(), timeout=timeout)
+            else:
+                async with new_scrape_client(timeout) as own_client:
+                    response = await own_client.get(url, headers=_get_headers())
+
+            if response.status_code in (429, 503) and attempt < max_retries:
+                last_error = f"HTTP {response.status_code} (retrying)"
+                await asyncio.sleep(2 * (attempt + 1))
+                continue
+
+            if response.status_code >= 400:
+                return None, f"HTTP {response.status_code}"
+
+            content_type = response.headers.get("content-type", "")
+            if "text/html" not in content_type and "text/plain" not in content_type:
+                if "application/json" in content_type:
+                    return response.text, None
+                return None, f"Non-HTML content: {content_type[:50]}"
+
+            return response.text, None
 
         except httpx.TimeoutException:
             last_error = "timeout"
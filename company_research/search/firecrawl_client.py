@@ -16,6 +16,7 @@ async def search_firecrawl(
     api_key: str,
     num_results: int = 10,
     timeout: int = 60,
+    client: httpx.AsyncClient | None = None,
 ) -> dict:
     """Execute a Google search via Firecrawl with inline page scraping.
 
@@ -26,6 +27,7 @@ async def search_firecrawl(
       - 'organic_results': list of {link, title, snippet, position}
       - 'scraped_content': dict mapping URL -> markdown text
     Returns an empty dict with 'error' key on failure.
+    Reuses the given client's connection pool when one is passed.
     """
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -41,49 +43,52 @@ async def search_firecrawl(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        if client is not None:
             response = await client.post(
-                FIRECRAWL_SEARCH_URL,
-                headers=headers,
-                json=payload,
+                FIRECRAWL_SEARCH_URL, headers=headers, json=payload, timeout=timeout,
             )
-            response.raise_for_status()
-            data = response.json()
-
-            if not data.get("success", False):
-                warning = data.get("warning", "unknown error")
-                logger.warning("Firecrawl search failed for query '%s': %s", query[:80], warning)
-                return {"error": warning}
-
-            # Normalise Firecrawl v2 response (data nested by source type)
-            raw_data = data.get("data", {})
-            # v2 nests under "web"; fall back to flat list for v1 compat
-            if isinstance(raw_data, list):
-                raw_results = raw_data
-            else:
-                raw_results = raw_data.get("web", [])
-
-            organic_results = []
-            scraped_content: dict[str, str] = {}
-
-            for i, item in enumerate(raw_results):
-                url = item.get("url", "")
-                organic_results.append({
-                    "link": url,
-                    "title": item.get("title", ""),
-                    "snippet": item.get("description", ""),
-                    "position": i + 1,
-                })
-
-                # Capture markdown content if Firecrawl returned it
-                markdown = item.get("markdown", "")
-                if url and markdown and len(markdown) > 50:
-                    scraped_content[url] = markdown
-
-            return {
-                "organic_results": organic_results,
-                "scraped_content": scraped_content,
-            }
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as own_client:
+                response = await own_client.post(
+                    FIRECRAWL_SEARCH_URL, headers=headers, json=payload,
+                )
+        response.raise_for_status()
+        data = response.json()
+
+        if not data.get("success", False):
+            warning = data.get("warning", "unknown error")
+            logger.warning("Firecrawl search failed for query '%s': %s", query[:80], warning)
+            return {"error": warning}
+
+        # Normalise Firecrawl v2 response (data nested by source type)
+        raw_data = data.get("data", {})
+        # v2 nests under "web"; fall back to flat list for v1 compat
+        if isinstance(raw_data, list):
+            raw_results = raw_data
+        else:
+            raw_results = raw_data.get("web", [])
+
+        organic_results = []
+        scraped_content: dict[str, str] = {}
+
+        for i, item in enumerate(raw_results):
+            url = item.get("url", "")
+            organic_results.append({
+                "link": url,
+                "title": item.get("title", ""),
+                "snippet": item.get("description", ""),
+                "position": i + 1,
+            })
+
+            # Capture markdown content if Firecrawl returned it
+            markdown = item.get("markdown", "")
+            if url and markdown and len(markdown) > 50:
+                scraped_content[url] = markdown
+
+        return {
+            "organic_results": organic_results,
+            "scraped_content": scraped_content,
+        }
 
     except httpx.TimeoutException:
         logger.warning("Firecrawl timeout for query: %s", query[:80])
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 
 def generate_queries(search_name: str, max_queries: int = 6) -> list[dict]:
@@ -68,28 +69,53 @@ def generate_person_queries(
     Kept to 2 queries max to reduce DDG rate-limit pressure.
     LinkedIn site-search is skipped because DDG backends block it.
     """
-    queries = []
+    return render_person_queries(
+        person_query_templates(company_name, company_domain), person_name,
+    )
+
+
+def person_query_templates(
+    company_name: str,
+    company_domain: str | None = None,
+) -> list[tuple[str, str]]:
+    """Build the per-company (query template, purpose) pairs once.
+
+    Templates take the person via ``{person}``; render them for each
+    person at the company with render_person_queries().
+    """
+    company = _brace_escape(company_name)
 
     # Primary query: person + company (most effective single query)
-    queries.append({
-        "query": f'"{person_name}" "{company_name}"',
-        "purpose": "person_at_company",
-    })
+    templates = [(f'"{{person}}" "{company}"', "person_at_company")]
 
     # Site-specific search (finds bio pages directly on company website)
     if company_domain:
-        queries.append({
-            "query": f'site:{company_domain} "{person_name}"',
-            "purpose": "person_company_site",
-        })
+        templates.append((
+            f'site:{_brace_escape(company_domain)} "{{person}}"',
+            "person_company_site",
+        ))
     else:
         # Fall back to industry-specific search
-        queries.append({
-            "query": f'"{person_name}" private credit OR direct lending',
-            "purpose": "person_industry",
-        })
+        templates.append((
+            '"{person}" private credit OR direct lending',
+            "person_industry",
+        ))
+
+    return templates
+
+
+def render_person_queries(
+    templates: list[tuple[str, str]], person_name: str,
+) -> list[dict]:
+    """Fill person_query_templates() output in for one person."""
+    return [
+        {"query": template.format(person=person_name), "purpose": purpose}
+        for template, purpose in templates
+    ]
+
 
-    return queries
+def _brace_escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
 
 
 def generate_team_page_query(company_domain: str) -> dict:
@@ -103,6 +129,7 @@ def generate_team_page_query(company_domain: str) -> dict:
     }
 
 
+@lru_cache(maxsize=1024)
 def _guess_domain(search_name: str) -> str:
     """Guess the company's likely domain from its name.
 